@@ -0,0 +1,105 @@
+# =============================================================================
+# SUPPRESSION D'UN COURS TRÈS SUIVI (benchmarks/delete.py)
+# =============================================================================
+# Compare, pour un cours de N inscriptions (20 000 par défaut) :
+#   - course.delete() (collector de Django, une seule transaction)
+#   - deletion.delete_course() (paquets de DELETION_BATCH_SIZE inscriptions)
+# Mesures : durée totale, plus longue transaction (durée pendant laquelle le
+# verrou d'écriture est tenu) et pic de mémoire Python. Le pic de mémoire est
+# mesuré lors d'une seconde exécution : tracemalloc ralentit fortement le code.
+#
+# Le script travaille sur une base SQLite temporaire : db.sqlite3 n'est pas modifiée.
+#
+# Exemple : python benchmarks/delete.py --enrollments 20000 --batch-size 1000
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'course_service.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+
+from course import deletion  # noqa: E402
+from course.models import Course, StudentCourse  # noqa: E402
+
+
+def create_course(enrollments):
+    course = Course.objects.create(
+        name="Cours très suivi", instructor="Dr. Sara", category="Bench", schedule="Lundi 9h-11h"
+    )
+    StudentCourse.objects.bulk_create(
+        (StudentCourse(student_id=index, course=course) for index in range(enrollments)),
+        batch_size=5000
+    )
+    return course
+
+
+def measure(delete, enrollments):
+    """
+    Supprime deux cours de `enrollments` inscriptions avec delete(course)
+
+    Returns:
+        (résultat, secondes, pic de mémoire en Mio)
+    """
+    course = create_course(enrollments)
+    start = time.perf_counter()
+    result = delete(course)
+    elapsed = time.perf_counter() - start
+
+    course = create_course(enrollments)
+    tracemalloc.start()
+    delete(course)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suppression d'un cours et de ses inscriptions")
+    parser.add_argument('--enrollments', type=int, default=20000, help="Inscriptions du cours")
+    parser.add_argument('--batch-size', type=int, default=deletion.DEFAULT_BATCH_SIZE,
+                        help="Inscriptions par transaction (suppression par paquets)")
+    args = parser.parse_args()
+
+    # Base temporaire (fichier, pour mesurer de vraies écritures disque)
+    connection.settings_dict['NAME'] = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+    call_command('migrate', verbosity=0)
+
+    print(f"Cours de {args.enrollments} inscriptions")
+
+    def collector_delete(course):
+        start = time.perf_counter()
+        committed = []
+        with transaction.atomic():
+            # Premier rappel exécuté après le COMMIT : fin du verrou d'écriture
+            # (les rappels des signaux de roster s'exécutent ensuite)
+            transaction.on_commit(lambda: committed.append(time.perf_counter()))
+            course.delete()
+        return (committed[0] - start) * 1000
+
+    lock_ms, seconds, peak = measure(collector_delete, args.enrollments)
+    # Une seule transaction : le verrou d'écriture est tenu pendant toute la cascade
+    print(f"  course.delete()            : {seconds * 1000:8.0f} ms, "
+          f"plus longue transaction {lock_ms:8.0f} ms, pic mémoire {peak:6.1f} Mio")
+
+    report, seconds, peak = measure(
+        lambda course: deletion.delete_courses([course.pk], args.batch_size), args.enrollments
+    )
+    print(f"  deletion.delete_course()   : {seconds * 1000:8.0f} ms, "
+          f"plus longue transaction {report['longest_batch_ms']:8.0f} ms, pic mémoire {peak:6.1f} Mio "
+          f"({report['batches']} transactions)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# =============================================================================
+# TEST DE CHARGE HTTP (benchmarks/load_test.py)
+# =============================================================================
+# Envoie N requêtes GET avec C clients simultanés et affiche le débit et les
+# latences (p50, p95, p99). Aucune dépendance en dehors de "requests".
+#
+# Exemple :
+#   python benchmarks/load_test.py --url http://127.0.0.1:8000/api/courses/ \
+#       --concurrency 32 --requests 2000
+#
+# L'URL peut contenir {n}, remplacé par --start + numéro de la requête, pour
+# viser une ressource différente à chaque requête (ex: listes d'inscrits froides) :
+#   python benchmarks/load_test.py --url http://127.0.0.1:8000/api/course/{n}/students/ \
+#       --start 1 --requests 500
+
+import argparse
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+_local = threading.local()
+
+
+def _session():
+    # Une session (connexions keep-alive) par thread client
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+    return _local.session
+
+
+def _one_request(url, timeout):
+    """(latence, code HTTP ou nom de l'exception)"""
+    start = time.perf_counter()
+    try:
+        outcome = _session().get(url, timeout=timeout).status_code
+    except requests.exceptions.RequestException as e:
+        outcome = type(e).__name__
+    return time.perf_counter() - start, outcome
+
+
+def _is_success(outcome):
+    # Seules les réponses 2xx comptent : un 429 (limitation de débit) ou un
+    # 503 (Student Service surchargé) est une erreur
+    return isinstance(outcome, int) and 200 <= outcome < 300
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(url, total, concurrency, timeout, first=1):
+    """Exécute le test et retourne un dictionnaire de résultats"""
+    urls = [url.format(n=first + index) for index in range(total)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda target: _one_request(target, timeout), urls))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for latency, _ in results]
+    failures = Counter(outcome for _, outcome in results if not _is_success(outcome))
+    return {
+        "requests": total,
+        "errors": sum(failures.values()),
+        "failures": dict(failures),
+        "seconds": elapsed,
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge HTTP simple")
+    parser.add_argument('--url', required=True, help="URL à appeler (GET)")
+    parser.add_argument('--requests', type=int, default=1000, help="Nombre total de requêtes")
+    parser.add_argument('--concurrency', type=int, default=16, help="Clients simultanés")
+    parser.add_argument('--timeout', type=float, default=30, help="Timeout par requête (s)")
+    parser.add_argument('--start', type=int, default=1, help="Première valeur de {n} dans l'URL")
+    args = parser.parse_args()
+
+    result = run(args.url, args.requests, args.concurrency, args.timeout, args.start)
+    print(
+        f"{result['requests']} requêtes, {result['errors']} erreurs en {result['seconds']:.2f}s "
+        f"→ {result['rps']:.1f} req/s | p50 {result['p50_ms']:.1f} ms, "
+        f"p95 {result['p95_ms']:.1f} ms, p99 {result['p99_ms']:.1f} ms"
+    )
+    if result['failures']:
+        print("Erreurs par code : " + ", ".join(
+            f"{outcome} × {count}" for outcome, count in sorted(result['failures'].items(), key=str)
+        ))
+
+
+if __name__ == '__main__':
+    main()
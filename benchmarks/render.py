@@ -0,0 +1,96 @@
+# =============================================================================
+# RENDU JSON ET COMPRESSION (benchmarks/render.py)
+# =============================================================================
+# Compare, sur une liste de cours sérialisée par CourseSerializer (10 000 par
+# défaut, comme GET /api/courses/ sur un gros catalogue) :
+#   - JSONRenderer de DRF (json de la bibliothèque standard) et FastJSONRenderer (orjson)
+#   - la taille et le coût de la compression gzip / brotli
+#
+# Exemple : python benchmarks/render.py --courses 10000
+
+import argparse
+import gzip
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'course_service.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from course.models import Course  # noqa: E402
+from course.renderers import FastJSONParser, FastJSONRenderer, orjson  # noqa: E402
+from course.serializers import CourseSerializer  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def best_of(function, repeat):
+    """Meilleur temps (ms) sur `repeat` exécutions"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rendu JSON et compression")
+    parser.add_argument('--courses', type=int, default=10000, help="Nombre de cours")
+    parser.add_argument('--repeat', type=int, default=20, help="Répétitions (meilleur temps)")
+    args = parser.parse_args()
+
+    courses = [
+        Course(
+            id=index, name=f"Cours {index} - Programmation avancée",
+            instructor=f"Dr. Instructeur {index % 50}", category=f"Catégorie {index % 12}",
+            schedule="Lundi 9h-11h"
+        )
+        for index in range(1, args.courses + 1)
+    ]
+    serialize_ms = best_of(lambda: CourseSerializer(courses, many=True).data, 3)
+    data = CourseSerializer(courses, many=True).data
+
+    standard = JSONRenderer()
+    fast = FastJSONRenderer()
+    body = standard.render(data)
+    assert fast.render(data) == body, "les deux renderers doivent produire le même JSON"
+
+    print(f"{args.courses} cours, {len(body) / 1024:.0f} Kio de JSON (orjson installé : {orjson is not None})")
+    print(f"  CourseSerializer (.data)     : {serialize_ms:7.2f} ms (pour comparaison)")
+    print(f"  JSONRenderer (json)          : {best_of(lambda: standard.render(data), args.repeat):7.2f} ms")
+    print(f"  FastJSONRenderer (orjson)    : {best_of(lambda: fast.render(data), args.repeat):7.2f} ms")
+    print(f"  json.loads (corps entier)    : {best_of(lambda: json.loads(body), args.repeat):7.2f} ms")
+    print(f"  FastJSONParser               : "
+          f"{best_of(lambda: FastJSONParser().parse(io.BytesIO(body)), args.repeat):7.2f} ms")
+
+    level = settings.COMPRESSION_GZIP_LEVEL
+    gzipped = gzip.compress(body, compresslevel=level, mtime=0)
+    gzip_ms = best_of(lambda: gzip.compress(body, compresslevel=level, mtime=0), args.repeat)
+    print(f"  gzip niveau {level}                : {gzip_ms:7.2f} ms → "
+          f"{len(gzipped) / 1024:.0f} Kio ({len(gzipped) / len(body):.0%})")
+    if brotli is not None:
+        quality = settings.COMPRESSION_BROTLI_QUALITY
+        compressed = brotli.compress(body, quality=quality)
+        brotli_ms = best_of(lambda: brotli.compress(body, quality=quality), args.repeat)
+        print(f"  brotli qualité {quality}             : {brotli_ms:7.2f} ms → "
+              f"{len(compressed) / 1024:.0f} Kio ({len(compressed) / len(body):.0%})")
+    else:
+        print("  brotli                       : non installé (pip install brotli)")
+
+
+if __name__ == '__main__':
+    main()
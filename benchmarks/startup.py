@@ -0,0 +1,116 @@
+# =============================================================================
+# TEMPS DE DÉMARRAGE (benchmarks/startup.py)
+# =============================================================================
+# Mesure, pour un ou plusieurs modules de configuration, dans un processus
+# Python neuf à chaque fois :
+#   - le temps d'import cumulé (python -X importtime) jusqu'à l'application WSGI
+#     et le nombre de modules importés (stable d'une mesure à l'autre, contrairement
+#     aux temps : c'est l'indicateur à surveiller pour détecter une régression)
+#   - le temps jusqu'à la première réponse (démarrage + 1ère requête GET)
+#
+# Exemples :
+#   python benchmarks/startup.py
+#   python benchmarks/startup.py --settings course_service.settings_production \
+#       --budget-ms 600      # code de sortie 1 si le budget est dépassé (CI)
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Programme exécuté dans le processus mesuré : charge l'application WSGI
+# puis envoie une première requête, et affiche le temps écoulé depuis le
+# début du chargement de l'application
+FIRST_RESPONSE = """
+import time
+start = time.perf_counter()
+from course_service.wsgi import application
+from django.test import RequestFactory
+request = RequestFactory().get({path!r}, HTTP_HOST='localhost')
+response = application.get_response(request)
+print(f"{{(time.perf_counter() - start) * 1000:.1f}} {{response.status_code}}")
+"""
+
+# Imports mesurés : application WSGI + configuration des URLs (vues, sérialiseurs)
+IMPORT_ALL = "import course_service.wsgi; from django.urls import get_resolver; get_resolver().url_patterns"
+
+
+def _env(settings_module):
+    env = dict(os.environ)
+    env['DJANGO_SETTINGS_MODULE'] = settings_module
+    # Le profil de production exige une clé secrète (valeur quelconque pour la mesure)
+    env.setdefault('DJANGO_SECRET_KEY', 'benchmark-only')
+    env['PYTHONPATH'] = str(ROOT)
+    return env
+
+
+def import_stats(settings_module):
+    """Temps d'import cumulé (ms) et nombre de modules chargés par l'application WSGI"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_ALL],
+        cwd=ROOT, env=_env(settings_module), capture_output=True, text=True, check=True
+    )
+    total_us = 0
+    modules = 0
+    for line in result.stderr.splitlines():
+        # Format : "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules += 1
+        # Seuls les imports de premier niveau : leur cumul inclut les imports imbriqués
+        if not name.startswith('  '):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def first_response_ms(settings_module, path):
+    """Temps (ms) entre le début du chargement et la première réponse"""
+    result = subprocess.run(
+        [sys.executable, '-c', FIRST_RESPONSE.format(path=path)],
+        cwd=ROOT, env=_env(settings_module), capture_output=True, text=True, check=True
+    )
+    elapsed, status = result.stdout.split()
+    return float(elapsed), int(status)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesure du temps de démarrage")
+    parser.add_argument(
+        '--settings', action='append',
+        help="Module de configuration (option répétable, défaut : développement et production)"
+    )
+    parser.add_argument('--path', default='/api/courses/', help="URL de la première requête")
+    parser.add_argument('--runs', type=int, default=5, help="Nombre de mesures (médiane)")
+    parser.add_argument(
+        '--budget-ms', type=float,
+        help="Échec (code 1) si le temps jusqu'à la première réponse dépasse ce budget"
+    )
+    args = parser.parse_args()
+
+    modules = args.settings or ['course_service.settings', 'course_service.settings_production']
+    over_budget = False
+    for module in modules:
+        stats = [import_stats(module) for _ in range(args.runs)]
+        imports = statistics.median(elapsed for elapsed, _ in stats)
+        modules_count = stats[-1][1]
+        firsts = [first_response_ms(module, args.path) for _ in range(args.runs)]
+        first = statistics.median(elapsed for elapsed, _ in firsts)
+        status = firsts[-1][1]
+        print(
+            f"{module}: {modules_count} modules, imports {imports:.1f} ms | "
+            f"première réponse {first:.1f} ms (HTTP {status})"
+        )
+        if args.budget_ms is not None and first > args.budget_ms:
+            over_budget = True
+            print(f"  ❌ budget de {args.budget_ms:.0f} ms dépassé")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CourseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'course'
+
+    def ready(self):
+        # Connexion des récepteurs de signaux (données dérivées des modèles)
+        from . import signals  # noqa: F401
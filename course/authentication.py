@@ -0,0 +1,113 @@
+# =============================================================================
+# AUTHENTIFICATION (course/authentication.py)
+# =============================================================================
+# TokenAuthentication de DRF fait une requête SQL (Token + User) à chaque appel
+# de l'API, avant même d'entrer dans la vue. CachedTokenAuthentication garde
+# les tokens déjà vérifiés dans un cache borné (alias "auth" de CACHES) avec
+# une durée de vie : les requêtes suivantes avec le même token ne touchent
+# plus la base. Les entrées sont invalidées quand un token est supprimé ou
+# remplacé, ou quand son utilisateur est modifié (voir course/signals.py).
+#
+# Le cache est local à chaque processus : une révocation faite ailleurs
+# (manage.py, shell, autre worker) ne peut pas retirer l'entrée des autres
+# workers. Elle met donc aussi à jour un fichier marqueur
+# (TOKEN_REVOCATION_MARKER) dont la date de modification est lue à chaque
+# requête (un stat, sans requête SQL) : toute entrée vérifiée avant la
+# dernière révocation est ignorée et le token est revérifié en base.
+
+import hashlib
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.authentication import TokenAuthentication
+
+logger = logging.getLogger(__name__)
+
+# Alias du cache dédié (voir CACHES dans settings.py)
+AUTH_CACHE_ALIAS = 'auth'
+
+# Marge (secondes) autour de la date du marqueur : les dates de fichiers sont
+# moins précises que time.time()
+REVOCATION_MARGIN = 1.0
+
+
+def _auth_cache():
+    return caches[AUTH_CACHE_ALIAS if AUTH_CACHE_ALIAS in settings.CACHES else 'default']
+
+
+def _cache_key(key):
+    # Empreinte du token : la valeur secrète n'apparaît pas dans les clés du cache
+    return 'auth-token:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+# =============================================================================
+# MARQUEUR DE RÉVOCATION (partagé par les processus de la machine)
+# =============================================================================
+def _marker_path():
+    return getattr(settings, 'TOKEN_REVOCATION_MARKER', None)
+
+
+def last_revocation():
+    """Date (timestamp) de la dernière révocation, 0 si aucune"""
+    path = _marker_path()
+    if not path:
+        return 0
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0
+
+
+def _touch_marker():
+    path = _marker_path()
+    if not path:
+        return
+    try:
+        with open(path, 'a'):
+            pass
+        os.utime(path)
+    except OSError as e:
+        logger.error(f"Cannot update token revocation marker {path}: {e}")
+
+
+def invalidate_token(key):
+    """
+    Retire un token du cache (suppression, remplacement, utilisateur modifié)
+
+    Le marqueur est mis à jour après la validation de la transaction : un
+    worker qui revérifie le token entre-temps le voit encore valide, mais son
+    entrée date d'avant le marqueur et sera ignorée.
+    """
+    _auth_cache().delete(_cache_key(key))
+    transaction.on_commit(_touch_marker)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication avec cache des tokens valides
+
+    Seuls les tokens valides sont mis en cache (un token inconnu est toujours
+    vérifié en base). Durée de vie : TOKEN_AUTH_CACHE_TIMEOUT secondes, et
+    jusqu'à la prochaine révocation (marqueur TOKEN_REVOCATION_MARKER).
+    """
+
+    def authenticate_credentials(self, key):
+        cache = _auth_cache()
+        cache_key = _cache_key(key)
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            user, token, checked_at = cached
+            if checked_at > last_revocation() + REVOCATION_MARGIN:
+                return user, token
+
+        # Vérification standard (requête Token + User, utilisateur actif) ;
+        # l'heure est relevée avant la requête (voir invalidate_token)
+        checked_at = time.time()
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, (user, token, checked_at), getattr(settings, 'TOKEN_AUTH_CACHE_TIMEOUT', 60))
+        return user, token
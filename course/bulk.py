@@ -0,0 +1,219 @@
+# =============================================================================
+# IMPORT / EXPORT EN MASSE DES COURS (course/bulk.py)
+# =============================================================================
+# Pipeline partagé par les commandes import_courses / export_courses et par
+# l'endpoint POST /api/courses/import/ :
+#   - lecture en flux (CSV ou NDJSON, une ligne à la fois : mémoire constante)
+#   - validation par paquets avec les règles de CourseSerializer
+#   - écriture par paquets (bulk_create / bulk_update), une transaction par paquet
+#   - rapport : lignes créées, modifiées, invalides, débit
+#
+# Format des lignes : name, instructor, category, schedule, et un "id"
+# optionnel (si le cours existe déjà, il est mis à jour au lieu d'être créé).
+
+import csv
+import json
+import time
+
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from rest_framework.exceptions import ValidationError
+
+from . import catalog, changefeed, schedule
+from .models import Course
+from .serializers import CourseSerializer
+
+FORMATS = ('csv', 'ndjson')
+
+# Colonnes exportées / importées (dans cet ordre pour le CSV)
+COLUMNS = ['id', 'name', 'instructor', 'category', 'schedule']
+# Champs écrits par l'import (l'id sert seulement à retrouver le cours)
+IMPORT_FIELDS = COLUMNS[1:]
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Nombre maximal d'erreurs détaillées conservées dans le rapport
+MAX_REPORTED_ERRORS = 100
+
+
+def guess_format(name):
+    """Format d'après l'extension d'un fichier (.csv, .ndjson, .jsonl), sinon None"""
+    name = (name or '').lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return None
+
+
+# =============================================================================
+# LECTURE / ÉCRITURE EN FLUX
+# =============================================================================
+def read_records(lines, fmt):
+    """
+    Lit les lignes (itérable de chaînes) et produit des couples (numéro, dict)
+
+    Une ligne NDJSON illisible produit (numéro, None) : elle sera comptée
+    comme invalide sans interrompre l'import.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        for record in reader:
+            # Numéro de ligne dans le fichier (en-tête = ligne 1)
+            yield reader.line_num, record
+        return
+
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        yield number, record if isinstance(record, dict) else None
+
+
+def write_records(queryset, stream, fmt, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Écrit les cours du queryset dans stream (fichier texte), ligne par ligne
+
+    Les lignes sont lues par paquets avec iterator() : la mémoire utilisée ne
+    dépend pas du nombre de cours. Retourne le nombre de cours écrits.
+    """
+    rows = queryset.order_by('id').values_list(*COLUMNS).iterator(chunk_size=chunk_size)
+    count = 0
+    if fmt == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(COLUMNS)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    for row in rows:
+        stream.write(json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False))
+        stream.write('\n')
+        count += 1
+    return count
+
+
+# =============================================================================
+# IMPORT
+# =============================================================================
+def _chunks(records, size):
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _parse_id(value):
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return False
+
+
+def import_courses(records, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """
+    Importe les cours produits par read_records()
+
+    Args:
+        records: itérable de (numéro de ligne, dict ou None)
+        chunk_size: nombre de lignes validées puis écrites par transaction
+        progress: fonction appelée après chaque paquet avec le rapport courant
+
+    Returns:
+        dict: {"processed", "created", "updated", "invalid", "errors", "seconds", "rate"}
+    """
+    report = {
+        "processed": 0, "created": 0, "updated": 0, "invalid": 0,
+        "errors": [], "seconds": 0.0, "rate": 0.0,
+    }
+    # Un seul sérialiseur réutilisé : run_validation applique les mêmes règles
+    # que is_valid() sans reconstruire les champs à chaque ligne
+    serializer = CourseSerializer()
+    explicit_ids = False
+    start = time.perf_counter()
+
+    def invalid(number, errors):
+        report["invalid"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append({"line": number, "errors": errors})
+
+    for chunk in _chunks(records, chunk_size):
+        valid = []
+        for number, record in chunk:
+            if record is None:
+                invalid(number, {"non_field_errors": ["Ligne JSON invalide."]})
+                continue
+            course_id = _parse_id(record.get('id'))
+            if course_id is False:
+                invalid(number, {"id": ["Un entier valide est requis."]})
+                continue
+            try:
+                data = serializer.run_validation(record)
+            except ValidationError as exc:
+                invalid(number, exc.detail)
+                continue
+            valid.append((number, course_id, data))
+
+        # Cours déjà existants parmi les IDs fournis : une requête par paquet
+        ids = [course_id for _, course_id, _ in valid if course_id is not None]
+        existing = Course.objects.in_bulk(ids) if ids else {}
+
+        to_create, to_update, new_ids = [], [], set()
+        for number, course_id, data in valid:
+            if course_id is not None and course_id in new_ids:
+                invalid(number, {"id": [f"ID {course_id} présent plusieurs fois dans le même paquet."]})
+                continue
+            if course_id in existing:
+                course = existing[course_id]
+                for name in IMPORT_FIELDS:
+                    setattr(course, name, data[name])
+                to_update.append(course)
+            else:
+                # Un id inconnu est conservé (ex: réimport d'un export dans une base vide)
+                if course_id is not None:
+                    explicit_ids = True
+                    new_ids.add(course_id)
+                to_create.append(Course(id=course_id, **data))
+
+        # Une transaction par paquet : verrous courts, un paquet en échec
+        # n'annule pas les précédents
+        with transaction.atomic():
+            created = Course.objects.bulk_create(to_create)
+            if to_update:
+                Course.objects.bulk_update(to_update, IMPORT_FIELDS)
+            # bulk_create / bulk_update n'envoient pas de signaux
+            changefeed.record_many(created, 'create')
+            changefeed.record_many(to_update, 'update')
+            schedule.sync_courses(created + to_update)
+        if created or to_update:
+            catalog.bump()
+
+        report["processed"] += len(chunk)
+        report["created"] += len(created)
+        report["updated"] += len(to_update)
+        report["seconds"] = time.perf_counter() - start
+        report["rate"] = report["processed"] / report["seconds"] if report["seconds"] else 0.0
+        if progress is not None:
+            progress(report)
+
+    if explicit_ids:
+        # Des IDs ont été fixés à la main : recaler la séquence d'auto-incrément
+        # (PostgreSQL) pour que les prochains INSERT ne les réutilisent pas
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Course]):
+                cursor.execute(sql)
+
+    report["seconds"] = time.perf_counter() - start
+    report["rate"] = report["processed"] / report["seconds"] if report["seconds"] else 0.0
+    return report
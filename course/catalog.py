@@ -0,0 +1,193 @@
+# =============================================================================
+# CATALOGUE : RECHERCHE, FACETTES ET CACHE VERSIONNÉ (course/catalog.py)
+# =============================================================================
+# Les données du catalogue (représentation de chaque cours, comptes par
+# catégorie et par instructeur) sont mises en cache sous une clé qui contient la
+# "version du catalogue". Chaque modification d'un cours incrémente cette
+# version (signaux de Course, import en masse) : les anciennes entrées ne
+# sont plus jamais lues et expirent d'elles-mêmes, sans invalidation clé par clé.
+#
+# Avec un cache local par processus (LocMemCache), la version d'un worker
+# n'est pas vue par les autres : CATALOG_CACHE_TIMEOUT borne ce décalage.
+# Acceptable pour les facettes (des comptes), pas pour la lecture d'un cours
+# par son ID (un cours supprimé par un autre worker serait encore renvoyé) :
+# courses_by_id lit la base tant que CATALOG_SHARED_CACHE est faux.
+
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import Course
+from .serializers import CourseSerializer
+
+CATALOG_VERSION_KEY = 'catalog:version'
+
+# Champs pour lesquels on calcule des facettes (colonnes indexées)
+FACET_FIELDS = ('category', 'instructor')
+
+
+def _cache_timeout():
+    return getattr(settings, 'CATALOG_CACHE_TIMEOUT', 60)
+
+
+def courses_cached():
+    """Cours par ID mis en cache : seulement avec un cache partagé par les processus"""
+    return getattr(settings, 'CATALOG_SHARED_CACHE', False)
+
+
+# =============================================================================
+# VERSION DU CATALOGUE
+# =============================================================================
+def _initial_version():
+    # Valeur initiale unique (millisecondes) : si la clé est évincée du cache,
+    # la nouvelle version ne retombe pas sur une ancienne encore en cache
+    return int(time.time() * 1000)
+
+
+def version():
+    """Version courante du catalogue (créée si absente du cache)"""
+    current = cache.get(CATALOG_VERSION_KEY)
+    if current is None:
+        current = _initial_version()
+        # add() : si un autre thread vient de la créer, garder la sienne
+        if not cache.add(CATALOG_VERSION_KEY, current, timeout=None):
+            current = cache.get(CATALOG_VERSION_KEY, current)
+    return current
+
+
+def bump():
+    """Nouvelle version : toutes les entrées mises en cache pour l'ancienne deviennent obsolètes"""
+    try:
+        return cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        # Clé absente (premier appel ou éviction)
+        current = _initial_version()
+        cache.set(CATALOG_VERSION_KEY, current, timeout=None)
+        return current
+
+
+def cache_key(kind, *parts):
+    """Clé de cache liée à la version courante : "catalog:<kind>:<version>:..." """
+    return ':'.join(['catalog', kind, str(version()), *(str(part) for part in parts)])
+
+
+# =============================================================================
+# COURS PAR ID (cache partagé par get_course_by_id et la lecture groupée)
+# =============================================================================
+def courses_by_id(ids):
+    """
+    Représentations (CourseSerializer) des cours demandés
+
+    Lecture groupée dans le cache (get_many), puis une seule requête
+    "id IN (...)" pour les cours absents du cache, qui y sont ajoutés.
+    Sans cache partagé (CATALOG_SHARED_CACHE), seulement la requête.
+
+    Returns:
+        dict: {id: données du cours} (les IDs inexistants sont absents)
+    """
+    if not courses_cached():
+        return {
+            data['id']: dict(data)
+            for data in CourseSerializer(Course.objects.filter(pk__in=ids), many=True).data
+        }
+
+    current = version()
+    keys = {pk: f'catalog:course:{current}:{pk}' for pk in ids}
+    cached = cache.get_many(list(keys.values()))
+    found = {pk: cached[key] for pk, key in keys.items() if key in cached}
+
+    misses = [pk for pk in keys if pk not in found]
+    if misses:
+        fetched = {
+            data['id']: dict(data)
+            for data in CourseSerializer(Course.objects.filter(pk__in=misses), many=True).data
+        }
+        cache.set_many({keys[pk]: data for pk, data in fetched.items()}, _cache_timeout())
+        found.update(fetched)
+    return found
+
+
+# =============================================================================
+# RECHERCHE
+# =============================================================================
+SEARCH_PARAMS = ('q', 'name', 'instructor', 'category')
+
+
+def search_params(query_params):
+    """Paramètres de recherche non vides de la requête : {"q": "python", ...}"""
+    params = {}
+    for name in SEARCH_PARAMS:
+        value = query_params.get(name, '').strip()
+        if value:
+            params[name] = value
+    return params
+
+
+def search_filter(params):
+    """
+    Condition Q de la recherche (/api/courses/search/, /api/courses/facets/)
+
+    q : texte cherché dans le nom, l'instructeur ou la catégorie ;
+    name / instructor / category : texte cherché dans ce champ. Les
+    paramètres sont combinés par ET. Aucun paramètre : tout le catalogue.
+    """
+    filters = Q()
+    q = params.get('q')
+    if q:
+        filters &= (Q(name__icontains=q) | Q(instructor__icontains=q) | Q(category__icontains=q))
+    for name in ('name', 'instructor', 'category'):
+        if params.get(name):
+            filters &= Q(**{f'{name}__icontains': params[name]})
+    return filters
+
+
+# =============================================================================
+# FACETTES
+# =============================================================================
+def _params_hash(params):
+    raw = json.dumps(params, sort_keys=True)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def compute_facets(params):
+    """
+    Comptes par catégorie et par instructeur des cours correspondant à params
+
+    Une seule requête : GROUP BY category, instructor, puis regroupement des
+    couples en Python (bien moins de lignes que de cours).
+    """
+    rows = (
+        Course.objects.filter(search_filter(params))
+        .order_by()
+        .values_list(*FACET_FIELDS)
+        .annotate(count=Count('id'))
+    )
+    counts = {name: {} for name in FACET_FIELDS}
+    total = 0
+    for *values, count in rows:
+        total += count
+        for name, value in zip(FACET_FIELDS, values):
+            counts[name][value] = counts[name].get(value, 0) + count
+
+    facets = {"total": total}
+    for name in FACET_FIELDS:
+        # Les plus fréquents d'abord, puis par ordre alphabétique
+        facets[name] = [
+            {"value": value, "count": count}
+            for value, count in sorted(counts[name].items(), key=lambda item: (-item[1], item[0]))
+        ]
+    return facets
+
+
+def facets(params):
+    """Facettes de la recherche params, en cache pour la version courante du catalogue"""
+    key = cache_key('facets', _params_hash(params))
+    result = cache.get(key)
+    if result is None:
+        result = compute_facets(params)
+        cache.set(key, result, _cache_timeout())
+    return result
@@ -0,0 +1,101 @@
+# =============================================================================
+# FLUX DE CHANGEMENTS (course/changefeed.py)
+# =============================================================================
+# Enregistre chaque création / modification / suppression de Course et de
+# StudentCourse dans la table ChangeLogEntry, et relit ces changements à
+# partir d'un curseur. Les consommateurs (Student Service, analytics, caches
+# du frontend) ne téléchargent ainsi que ce qui a changé depuis leur dernière
+# synchronisation, au lieu de comparer des listes complètes.
+#
+# L'enregistrement se fait au moment de la modification (signaux post_save /
+# post_delete, voir course/signals.py) : dans une transaction, un changement
+# annulé n'apparaît donc jamais dans le flux.
+
+from .models import ChangeLogEntry, Course
+
+# Nombre de changements renvoyés par page (GET /api/changes/?limit=)
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+def snapshot(instance):
+    """Données d'un objet telles qu'enregistrées dans le flux"""
+    if isinstance(instance, Course):
+        return {
+            "id": instance.pk,
+            "name": instance.name,
+            "instructor": instance.instructor,
+            "category": instance.category,
+            "schedule": instance.schedule,
+        }
+    # course_id et non course.name : pas de requête supplémentaire par inscription
+    return {
+        "id": instance.pk,
+        "student_id": instance.student_id,
+        "course": instance.course_id,
+    }
+
+
+def _entry(instance, action):
+    return ChangeLogEntry(
+        model=instance._meta.model_name,
+        object_id=instance.pk,
+        action=action,
+        data=snapshot(instance),
+    )
+
+
+def record(instance, action):
+    """Enregistre un changement ('create', 'update' ou 'delete') sur un objet"""
+    entry = _entry(instance, action)
+    entry.save()
+    return entry
+
+
+def record_many(instances, action):
+    """
+    Enregistre en une seule requête les changements d'une opération en masse
+
+    bulk_create / bulk_update / QuerySet.delete ne déclenchent pas les signaux :
+    ces opérations doivent appeler record_many elles-mêmes.
+    """
+    return ChangeLogEntry.objects.bulk_create(
+        [_entry(instance, action) for instance in instances]
+    )
+
+
+def changes_since(cursor, limit=DEFAULT_LIMIT, model=None):
+    """
+    Changements postérieurs au curseur, du plus ancien au plus récent
+
+    Returns:
+        dict: {"changes": [...], "next_cursor": int, "has_more": bool}
+        next_cursor est le curseur à renvoyer pour la page suivante
+        (inchangé s'il n'y a aucun nouveau changement).
+    """
+    queryset = ChangeLogEntry.objects.filter(id__gt=cursor).order_by('id')
+    if model:
+        queryset = queryset.filter(model=model)
+
+    # Une ligne de plus que demandé pour savoir s'il reste des changements
+    rows = list(
+        queryset.values('id', 'model', 'object_id', 'action', 'data', 'created_at')[:limit + 1]
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return {
+        "changes": [
+            {
+                "cursor": row['id'],
+                "model": row['model'],
+                "action": row['action'],
+                "object_id": row['object_id'],
+                "data": row['data'],
+                "created_at": row['created_at'],
+            }
+            for row in rows
+        ],
+        "next_cursor": rows[-1]['id'] if rows else cursor,
+        "has_more": has_more,
+    }
@@ -0,0 +1,81 @@
+# =============================================================================
+# TABLEAU DE BORD ÉTUDIANT (course/dashboard.py)
+# =============================================================================
+# La page la plus consultée du frontend affichait le tableau de bord d'un
+# étudiant avec plusieurs appels HTTP : ses cours, l'effectif de chaque cours,
+# puis sa fiche dans le Student Service. build_dashboard assemble tout en un
+# seul document :
+#   - la fiche de l'étudiant est demandée au Student Service dans un thread,
+#     pendant que les requêtes SQL s'exécutent (si upstream_limiter le permet ;
+#     sinon le tableau de bord est servi sans la fiche)
+#   - les cours, leurs effectifs et les conflits d'horaires sont lus en trois
+#     requêtes au plus, quel que soit le nombre de cours
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db.models import Count, F
+
+from . import schedule
+from .models import Course, StudentCourse
+from .services import student_service
+from .throttling import upstream_limiter
+
+# Erreur renvoyée quand la limite d'appels simultanés au Student Service est atteinte
+UPSTREAM_BUSY_ERROR = 'Student service busy'
+
+
+def _courses(student_id):
+    """Cours de l'étudiant (une requête) avec l'effectif de chacun (une requête GROUP BY)"""
+    courses = list(
+        Course.objects
+        .filter(studentcourse__student_id=student_id)
+        .order_by('studentcourse__id')
+        .values('id', 'name', 'instructor', 'category', 'schedule', enrollment_id=F('studentcourse__id'))
+    )
+    headcounts = dict(
+        StudentCourse.objects
+        .filter(course_id__in=[course['id'] for course in courses])
+        .order_by()
+        .values_list('course_id')
+        .annotate(count=Count('id'))
+    ) if courses else {}
+    for course in courses:
+        course['headcount'] = headcounts.get(course['id'], 0)
+    return courses
+
+
+def build_dashboard(student_id):
+    """
+    Données du tableau de bord d'un étudiant
+
+    Returns:
+        dict: {"student_id", "student", "student_error", "courses", "conflicts"}
+        student vaut None (et student_error explique pourquoi) si le Student
+        Service ne renvoie pas la fiche, ou si le processus l'appelle déjà
+        UPSTREAM_MAX_CONCURRENCY fois : le reste du tableau de bord est servi.
+    """
+    if not upstream_limiter.acquire():
+        courses = _courses(student_id)
+        conflicts = schedule.student_conflicts(student_id) if len(courses) > 1 else []
+        result = {'success': False, 'error': UPSTREAM_BUSY_ERROR, 'student_id': student_id}
+    else:
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Appel réseau lancé en premier, en parallèle des requêtes SQL
+                upstream = executor.submit(student_service.get_student_by_id, student_id)
+
+                courses = _courses(student_id)
+                # Un conflit demande au moins deux cours
+                conflicts = schedule.student_conflicts(student_id) if len(courses) > 1 else []
+
+                result = upstream.result()
+        finally:
+            upstream_limiter.release()
+
+    return {
+        "student_id": student_id,
+        "student": result['data'] if result['success'] else None,
+        "student_error": None if result['success'] else result['error'],
+        "courses": courses,
+        "conflicts": conflicts,
+    }
@@ -0,0 +1,113 @@
+# =============================================================================
+# SUPPRESSION EN MASSE DES COURS (course/deletion.py)
+# =============================================================================
+# course.delete() laisse le "collector" de Django charger en mémoire toutes les
+# inscriptions du cours pour envoyer leurs signaux, puis tout supprimer dans
+# une seule transaction : pour un cours de plusieurs dizaines de milliers
+# d'inscrits, le worker et le verrou d'écriture sont bloqués plusieurs secondes.
+#
+# delete_courses supprime d'abord les inscriptions par paquets bornés
+# (DELETE ... WHERE id IN (...), une courte transaction par paquet), puis les
+# cours eux-mêmes, qui n'ont alors plus rien de volumineux à supprimer en cascade.
+# La mémoire et la durée de chaque verrou dépendent de la taille des paquets,
+# plus du nombre d'inscriptions.
+
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+from . import changefeed, rosters
+from .models import Course, CourseRosterSnapshot, StudentCourse
+
+# Nombre d'inscriptions supprimées par transaction (DELETION_BATCH_SIZE)
+DEFAULT_BATCH_SIZE = 1000
+
+# Nombre de cours traités ensemble (taille des clauses IN)
+COURSE_CHUNK_SIZE = 500
+
+
+def _batch_size():
+    return getattr(settings, 'DELETION_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+
+
+def _chunks(items, size):
+    for index in range(0, len(items), size):
+        yield items[index:index + size]
+
+
+def _delete_enrollments(course_ids, batch_size, report):
+    """Supprime les inscriptions des cours donnés, un paquet par transaction"""
+    while True:
+        start = time.perf_counter()
+        with transaction.atomic():
+            rows = list(
+                StudentCourse.objects
+                .filter(course_id__in=course_ids)
+                .order_by('pk')
+                .values_list('pk', 'student_id', 'course_id')[:batch_size]
+            )
+            if not rows:
+                return
+            # DELETE direct, sans collector ni signaux : les données dérivées
+            # (flux de changements, listes d'inscrits) sont traitées ici
+            batch = StudentCourse.objects.filter(pk__in=[pk for pk, _, _ in rows])
+            batch._raw_delete(batch.db)
+            changefeed.record_many(
+                [
+                    StudentCourse(pk=pk, student_id=student_id, course_id=course_id)
+                    for pk, student_id, course_id in rows
+                ],
+                'delete'
+            )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        report["enrollments"] += len(rows)
+        report["batches"] += 1
+        report["longest_batch_ms"] = max(report["longest_batch_ms"], elapsed_ms)
+
+
+def delete_courses(course_ids, batch_size=None):
+    """
+    Supprime des cours et leurs inscriptions par paquets
+
+    Args:
+        course_ids: IDs des cours à supprimer
+        batch_size: inscriptions par transaction (défaut : DELETION_BATCH_SIZE)
+
+    Returns:
+        dict: {"courses", "enrollments", "batches", "seconds", "longest_batch_ms"}
+        longest_batch_ms = plus longue transaction (durée maximale du verrou d'écriture)
+    """
+    batch_size = batch_size or _batch_size()
+    report = {"courses": 0, "enrollments": 0, "batches": 0, "seconds": 0.0, "longest_batch_ms": 0.0}
+    start = time.perf_counter()
+
+    for chunk in _chunks(list(course_ids), COURSE_CHUNK_SIZE):
+        # Instantanés supprimés d'abord : si la suppression est interrompue,
+        # la prochaine lecture reconstruit la liste des inscrits restants
+        CourseRosterSnapshot.objects.filter(course_id__in=chunk).delete()
+        for course_id in chunk:
+            rosters.invalidate(course_id)
+
+        _delete_enrollments(chunk, batch_size, report)
+
+        # Plus d'inscriptions à charger : la cascade ne porte que sur les
+        # créneaux horaires. Les signaux de Course (flux, caches) sont envoyés.
+        batch_start = time.perf_counter()
+        with transaction.atomic():
+            _, deleted = Course.objects.filter(pk__in=chunk).delete()
+        report["courses"] += deleted.get(Course._meta.label, 0)
+        # Inscriptions ajoutées entre-temps et supprimées par la cascade
+        report["enrollments"] += deleted.get(StudentCourse._meta.label, 0)
+        report["batches"] += 1
+        report["longest_batch_ms"] = max(
+            report["longest_batch_ms"], (time.perf_counter() - batch_start) * 1000
+        )
+
+    report["seconds"] = time.perf_counter() - start
+    return report
+
+
+def delete_course(course):
+    """Supprime un cours et ses inscriptions par paquets (voir delete_courses)"""
+    return delete_courses([course.pk])
@@ -0,0 +1,29 @@
+# =============================================================================
+# FILTRES (course/filters.py)
+# =============================================================================
+# Filtres des ViewSets (DjangoFilterBackend, voir REST_FRAMEWORK dans settings.py)
+# Tous les champs filtrables sont indexés en base (voir models.py).
+
+from django_filters import rest_framework as filters
+
+from .models import Course, StudentCourse
+
+
+class CourseFilter(filters.FilterSet):
+    """Filtres exacts : /api/catalog/?category=Programmation&instructor=Dr.%20Sara"""
+
+    class Meta:
+        model = Course
+        fields = ['category', 'instructor']
+
+
+class StudentCourseFilter(filters.FilterSet):
+    """Filtres exacts : /api/studentcourses/?student_id=12&course=3"""
+
+    # Filtre sur la colonne course_id directement : pas de requête
+    # supplémentaire pour vérifier que le cours existe
+    course = filters.NumberFilter(field_name='course_id')
+
+    class Meta:
+        model = StudentCourse
+        fields = ['student_id', 'course']
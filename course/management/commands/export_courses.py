@@ -0,0 +1,55 @@
+# =============================================================================
+# COMMANDE export_courses
+# =============================================================================
+# Exporte les cours en CSV ou NDJSON, en flux (mémoire constante).
+#
+# Exemples :
+#   python manage.py export_courses catalogue.csv
+#   python manage.py export_courses - --format ndjson --category Programmation > prog.ndjson
+
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from course import bulk
+from course.models import Course
+
+
+class Command(BaseCommand):
+    help = "Exporte les cours au format CSV ou NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Fichier de sortie ('-' pour la sortie standard)")
+        parser.add_argument(
+            '--format', choices=bulk.FORMATS,
+            help="Format du fichier (par défaut : d'après l'extension)"
+        )
+        parser.add_argument('--category', help="N'exporter que cette catégorie")
+        parser.add_argument(
+            '--chunk-size', type=int, default=bulk.DEFAULT_CHUNK_SIZE,
+            help="Nombre de lignes lues par requête"
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or bulk.guess_format(path)
+        if fmt is None:
+            raise CommandError("Format inconnu : utiliser --format csv ou --format ndjson.")
+
+        queryset = Course.objects.all()
+        if options['category']:
+            queryset = queryset.filter(category=options['category'])
+
+        start = time.perf_counter()
+        if path == '-':
+            count = bulk.write_records(queryset, sys.stdout, fmt, options['chunk_size'])
+        else:
+            with open(path, 'w', encoding='utf-8', newline='') as stream:
+                count = bulk.write_records(queryset, stream, fmt, options['chunk_size'])
+        elapsed = time.perf_counter() - start
+
+        # Rapport sur stderr : la sortie standard peut contenir l'export lui-même
+        self.stderr.write(self.style.SUCCESS(
+            f"✅ {count} cours exportés en {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f} lignes/s)."
+        ))
@@ -0,0 +1,67 @@
+# =============================================================================
+# COMMANDE import_courses
+# =============================================================================
+# Importe un catalogue de cours depuis un fichier CSV ou NDJSON, en flux et
+# par paquets (voir course/bulk.py).
+#
+# Exemples :
+#   python manage.py import_courses catalogue.csv
+#   python manage.py import_courses catalogue.ndjson --chunk-size 5000
+#   cat catalogue.csv | python manage.py import_courses - --format csv
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from course import bulk
+
+
+class Command(BaseCommand):
+    help = "Importe des cours depuis un fichier CSV ou NDJSON (création ou mise à jour par id)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Fichier à importer ('-' pour l'entrée standard)")
+        parser.add_argument(
+            '--format', choices=bulk.FORMATS,
+            help="Format du fichier (par défaut : d'après l'extension)"
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=bulk.DEFAULT_CHUNK_SIZE,
+            help="Nombre de lignes validées puis écrites par transaction"
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or bulk.guess_format(path)
+        if fmt is None:
+            raise CommandError("Format inconnu : utiliser --format csv ou --format ndjson.")
+        if options['chunk_size'] < 1:
+            raise CommandError("--chunk-size doit être positif.")
+
+        def progress(report):
+            self.stderr.write(
+                f"{report['processed']} lignes ({report['created']} créées, "
+                f"{report['updated']} modifiées, {report['invalid']} invalides) "
+                f"- {report['rate']:.0f} lignes/s"
+            )
+
+        if path == '-':
+            report = bulk.import_courses(
+                bulk.read_records(sys.stdin, fmt), options['chunk_size'], progress
+            )
+        else:
+            try:
+                with open(path, encoding='utf-8', newline='') as stream:
+                    report = bulk.import_courses(
+                        bulk.read_records(stream, fmt), options['chunk_size'], progress
+                    )
+            except OSError as exc:
+                raise CommandError(f"Impossible de lire {path} : {exc}")
+
+        for error in report['errors']:
+            self.stderr.write(f"Ligne {error['line']} : {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {report['created']} cours créés, {report['updated']} modifiés, "
+            f"{report['invalid']} lignes invalides en {report['seconds']:.1f}s "
+            f"({report['rate']:.0f} lignes/s)."
+        ))
@@ -0,0 +1,91 @@
+# =============================================================================
+# COMMANDE refresh_rosters
+# =============================================================================
+# Met à jour les instantanés des listes d'inscrits (CourseRosterSnapshot)
+# quand les données du Student Service ont changé.
+#
+# Exemples :
+#   python manage.py refresh_rosters                 # reconstruit tous les instantanés existants
+#   python manage.py refresh_rosters --all           # + construit ceux de tous les autres cours
+#   python manage.py refresh_rosters --min-students 200
+#                                                    # + construit ceux des cours d'au moins 200 inscrits
+#   python manage.py refresh_rosters --course 3      # reconstruit le cours 3
+#   python manage.py refresh_rosters --student 12 --student 40
+#                                                    # met à jour ces étudiants partout
+#
+# Construire à l'avance les listes des gros cours (--all / --min-students, par
+# exemple au déploiement) évite que leur première construction (un appel au
+# Student Service par étudiant) se fasse pendant une requête.
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from course import rosters
+from course.models import Course, CourseRosterSnapshot
+
+
+class Command(BaseCommand):
+    help = "Reconstruit ou met à jour les instantanés des listes d'inscrits"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--course', type=int, action='append', dest='courses',
+            help="ID d'un cours à reconstruire (option répétable)"
+        )
+        parser.add_argument(
+            '--student', type=int, action='append', dest='students',
+            help="ID d'un étudiant dont les données ont changé (option répétable)"
+        )
+        parser.add_argument(
+            '--all', action='store_true',
+            help="Construire aussi les instantanés manquants de tous les cours"
+        )
+        parser.add_argument(
+            '--min-students', type=int, default=None,
+            help="Construire aussi les instantanés manquants des cours d'au moins N inscrits"
+        )
+
+    def handle(self, *args, **options):
+        courses = options['courses']
+        students = options['students']
+        build_all = options['all']
+        min_students = options['min_students']
+        if sum(bool(option) for option in (courses, students, build_all or min_students is not None)) > 1:
+            raise CommandError("Utiliser --course, --student ou --all / --min-students, pas plusieurs.")
+
+        if students:
+            updated = rosters.refresh_students(students)
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ {len(students)} étudiant(s) mis à jour dans {updated} liste(s)."
+            ))
+            return
+
+        if courses:
+            missing = set(courses) - set(
+                Course.objects.filter(id__in=courses).values_list('id', flat=True)
+            )
+            if missing:
+                raise CommandError(f"Cours introuvable(s) : {sorted(missing)}")
+            course_ids = courses
+        else:
+            # Instantanés existants, plus (--all / --min-students) les cours sans
+            # instantané ; sans option, ceux-ci sont construits à leur première lecture
+            course_ids = list(
+                CourseRosterSnapshot.objects.order_by('course_id').values_list('course_id', flat=True)
+            )
+            if build_all or min_students is not None:
+                missing = Course.objects.filter(roster_snapshot__isnull=True).order_by('id')
+                if not build_all:
+                    missing = missing.annotate(headcount=Count('studentcourse')).filter(headcount__gte=min_students)
+                course_ids += list(missing.values_list('id', flat=True))
+
+        for course_id in course_ids:
+            snapshot = rosters.rebuild_roster(course_id)
+            pending = len(snapshot.pending_student_ids)
+            self.stdout.write(
+                f"Cours {course_id} : {len(snapshot.students)} étudiant(s)"
+                + (f", {pending} à relire (Student Service en échec)" if pending else "")
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {len(course_ids)} liste(s) reconstruite(s)."
+        ))
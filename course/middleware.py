@@ -0,0 +1,173 @@
+# =============================================================================
+# MIDDLEWARES (course/middleware.py)
+# =============================================================================
+# Composants appliqués à toutes les requêtes/réponses (voir MIDDLEWARE dans settings.py)
+
+import gzip
+import hmac
+import random
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+from . import profiling
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    brotli = None
+
+# Ne pas compresser ce qui l'est déjà (images, archives...)
+ALREADY_COMPRESSED = ('image/', 'video/', 'audio/', 'application/zip', 'application/gzip')
+
+# Même traitement des ETag que django.middleware.gzip.GZipMiddleware
+STRONG_ETAG_RE = _lazy_re_compile(r'^"[^"]*"$')
+
+
+def accepted_encodings(header):
+    """
+    Encodages acceptés par le client d'après Accept-Encoding
+
+    Exemple : "gzip, br;q=0.9, deflate;q=0" → {"gzip": 1.0, "br": 0.9, "deflate": 0.0}
+    (q=0 est conservé : il refuse explicitement l'encodage, même avec "*")
+    """
+    accepted = {}
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+# =============================================================================
+# COMPRESSION DES RÉPONSES
+# =============================================================================
+class CompressionMiddleware:
+    """
+    Compresse les réponses volumineuses en brotli ou gzip selon Accept-Encoding
+
+    - Seuil : COMPRESSION_MIN_SIZE octets (les petites réponses ne gagnent rien)
+    - brotli (si le paquet "brotli" est installé) est préféré à gzip à qualité égale
+    - Niveaux réglables : COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY
+      (valeurs modérées par défaut : bon ratio pour peu de CPU)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        self.gzip_level = getattr(settings, 'COMPRESSION_GZIP_LEVEL', 6)
+        self.brotli_quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self._should_compress(response):
+            return response
+
+        # La réponse dépend de l'en-tête Accept-Encoding (important pour les caches HTTP)
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = self._choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if encoding == 'br':
+            compressed = brotli.compress(response.content, quality=self.brotli_quality)
+        else:
+            # mtime=0 : même contenu compressé pour une même réponse (ETag stables)
+            compressed = gzip.compress(response.content, compresslevel=self.gzip_level, mtime=0)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # Le contenu transmis n'est plus identique octet par octet : ETag faible
+        etag = response.get('ETag')
+        if etag and STRONG_ETAG_RE.match(etag):
+            response['ETag'] = 'W/' + etag
+        return response
+
+    def _should_compress(self, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return False
+        if response.get('Content-Type', '').startswith(ALREADY_COMPRESSED):
+            return False
+        return len(response.content) >= self.min_size
+
+    def _choose_encoding(self, header):
+        accepted = accepted_encodings(header)
+        candidates = ['gzip']
+        if brotli is not None:
+            candidates.insert(0, 'br')
+        # Meilleure qualité demandée par le client ; à égalité, l'ordre de candidates
+        # ("*" = tout encodage non cité explicitement)
+        def quality(name):
+            return accepted.get(name, accepted.get('*', 0))
+
+        best = max(candidates, key=quality)
+        return best if quality(best) > 0 else None
+
+
+# =============================================================================
+# PROFILAGE PAR ÉCHANTILLONNAGE
+# =============================================================================
+class ProfilingMiddleware:
+    """
+    Profile une partie des requêtes (voir course/profiling.py)
+
+    - PROFILING_ENABLED : désactivé par défaut ; le middleware est alors
+      retiré de la chaîne au démarrage (MiddlewareNotUsed)
+    - PROFILING_SAMPLE_RATE : fraction des requêtes profilées (0.01 = 1 %)
+    - PROFILING_HEADER_TOKEN : une requête avec l'en-tête X-Profile-Token
+      égal à ce jeton est toujours profilée
+    Les réponses profilées portent l'en-tête X-Profiled: 1.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.01)
+        self.header_token = getattr(settings, 'PROFILING_HEADER_TOKEN', None)
+
+    def __call__(self, request):
+        if not self._should_profile(request):
+            return self.get_response(request)
+
+        thread_id = threading.get_ident()
+        # Les piles relevées commencent à cette frame (pas celles du serveur WSGI)
+        profiling.sampler.start(thread_id, sys._getframe())
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            stacks = profiling.sampler.stop(thread_id)
+            profiling.store.add(self._endpoint(request), stacks, time.perf_counter() - start)
+        response['X-Profiled'] = '1'
+        return response
+
+    def _should_profile(self, request):
+        token = request.META.get('HTTP_X_PROFILE_TOKEN')
+        # Comparaison en octets : compare_digest refuse les str non ASCII (TypeError)
+        if token and self.header_token and hmac.compare_digest(token.encode(), self.header_token.encode()):
+            return True
+        return random.random() < self.sample_rate
+
+    @staticmethod
+    def _endpoint(request):
+        # Route et non chemin : /api/courses/1/ et /api/courses/2/ sont agrégés
+        match = getattr(request, 'resolver_match', None)
+        route = match.route if match is not None else '[non résolu]'
+        return f"{request.method} {route}"
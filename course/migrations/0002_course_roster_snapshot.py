@@ -0,0 +1,69 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='course',
+            options={'verbose_name': 'Cours', 'verbose_name_plural': 'Cours'},
+        ),
+        migrations.AlterModelOptions(
+            name='studentcourse',
+            options={'verbose_name': 'Inscription Étudiant-Cours', 'verbose_name_plural': 'Inscriptions Étudiant-Cours'},
+        ),
+        migrations.AlterField(
+            model_name='course',
+            name='category',
+            field=models.CharField(help_text='Catégorie du cours (ex: Programmation, Mathématiques)', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='course',
+            name='instructor',
+            field=models.CharField(help_text="Nom de l'instructeur (ex: Dr. Sara)", max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='course',
+            name='name',
+            field=models.CharField(help_text='Nom du cours (ex: Python Programming)', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='course',
+            name='schedule',
+            field=models.CharField(help_text='Horaire du cours (ex: Lundi 9h-11h)', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='studentcourse',
+            name='course',
+            field=models.ForeignKey(help_text="Cours auquel l'étudiant est inscrit", on_delete=django.db.models.deletion.CASCADE, to='course.course'),
+        ),
+        migrations.AlterField(
+            model_name='studentcourse',
+            name='student_id',
+            field=models.IntegerField(help_text="ID de l'étudiant (vient du microservice Student Service)"),
+        ),
+        migrations.AlterUniqueTogether(
+            name='studentcourse',
+            unique_together={('student_id', 'course')},
+        ),
+        migrations.CreateModel(
+            name='CourseRosterSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('students', models.JSONField(default=list, help_text="Liste des étudiants déjà formatée pour l'API")),
+                ('refreshed_at', models.DateTimeField(help_text="Date de la dernière mise à jour de l'instantané")),
+                ('course', models.OneToOneField(help_text='Cours dont on conserve la liste des inscrits', on_delete=django.db.models.deletion.CASCADE, related_name='roster_snapshot', to='course.course')),
+            ],
+            options={
+                'verbose_name': "Instantané de liste d'inscrits",
+                'verbose_name_plural': "Instantanés de listes d'inscrits",
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0003_course_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(choices=[('course', 'Cours'), ('studentcourse', 'Inscription')], help_text="Type d'objet modifié", max_length=20)),
+                ('object_id', models.BigIntegerField(help_text="ID de l'objet modifié")),
+                ('action', models.CharField(choices=[('create', 'Création'), ('update', 'Modification'), ('delete', 'Suppression')], help_text='Type de modification', max_length=10)),
+                ('data', models.JSONField(blank=True, help_text="Données de l'objet au moment du changement", null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Date du changement')),
+            ],
+            options={
+                'verbose_name': 'Changement',
+                'verbose_name_plural': 'Journal des changements',
+                'indexes': [models.Index(fields=['model', 'id'], name='changelog_model_cursor_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:46
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Copie figée de course.schedule.parse_schedule (version de cette migration) :
+# une migration ne doit dépendre ni du code ni des modèles actuels de l'application
+
+DAY_ALIASES = {
+    'lundi': 0, 'lun': 0, 'monday': 0, 'mon': 0,
+    'mardi': 1, 'mar': 1, 'tuesday': 1, 'tue': 1, 'tues': 1,
+    'mercredi': 2, 'mer': 2, 'wednesday': 2, 'wed': 2,
+    'jeudi': 3, 'jeu': 3, 'thursday': 3, 'thu': 3, 'thur': 3, 'thurs': 3,
+    'vendredi': 4, 'ven': 4, 'friday': 4, 'fri': 4,
+    'samedi': 5, 'sam': 5, 'saturday': 5, 'sat': 5,
+    'dimanche': 6, 'dim': 6, 'sunday': 6, 'sun': 6,
+}
+
+TOKEN_RE = re.compile(
+    r'(?P<start_h>\d{1,2})(?:[h:](?P<start_m>\d{2})?)?\s*(?:-|–|a|to)\s*'
+    r'(?P<end_h>\d{1,2})(?:[h:](?P<end_m>\d{2})?)?'
+    r'|(?P<word>[a-z]+)'
+)
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def _normalize(text):
+    text = unicodedata.normalize('NFKD', text or '')
+    return ''.join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def parse_schedule(text):
+    """(weekday, start_minute, end_minute) triés, sans doublons"""
+    slots = set()
+    days = []
+    after_range = False
+
+    for match in TOKEN_RE.finditer(_normalize(text)):
+        word = match.group('word')
+        if word is not None:
+            day = DAY_ALIASES.get(word)
+            if day is None:
+                continue
+            if after_range:
+                days = []
+                after_range = False
+            days.append(day)
+            continue
+
+        start = int(match.group('start_h')) * 60 + int(match.group('start_m') or 0)
+        end = int(match.group('end_h')) * 60 + int(match.group('end_m') or 0)
+        after_range = True
+        if not days or not start < end <= MINUTES_PER_DAY:
+            continue
+        for day in days:
+            slots.add((day, start, end))
+
+    return sorted(slots)
+
+
+def create_slots(apps, schema_editor):
+    """Analyse l'horaire des cours existants (les nouveaux passent par le signal post_save)"""
+    Course = apps.get_model('course', 'Course')
+    ScheduleSlot = apps.get_model('course', 'ScheduleSlot')
+    slots = []
+    for course_id, text in Course.objects.values_list('id', 'schedule').iterator():
+        for weekday, start, end in parse_schedule(text):
+            slots.append(ScheduleSlot(course_id=course_id, weekday=weekday, start_minute=start, end_minute=end))
+    ScheduleSlot.objects.bulk_create(slots, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0004_change_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduleSlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField(choices=[(0, 'Lundi'), (1, 'Mardi'), (2, 'Mercredi'), (3, 'Jeudi'), (4, 'Vendredi'), (5, 'Samedi'), (6, 'Dimanche')], help_text='Jour de la semaine (0 = lundi)')),
+                ('start_minute', models.PositiveSmallIntegerField(help_text='Début du créneau en minutes depuis minuit')),
+                ('end_minute', models.PositiveSmallIntegerField(help_text='Fin du créneau en minutes depuis minuit')),
+                ('course', models.ForeignKey(help_text='Cours auquel appartient le créneau', on_delete=django.db.models.deletion.CASCADE, related_name='slots', to='course.course')),
+            ],
+            options={
+                'verbose_name': 'Créneau horaire',
+                'verbose_name_plural': 'Créneaux horaires',
+                'indexes': [models.Index(fields=['weekday', 'start_minute', 'end_minute'], name='slot_interval_idx')],
+            },
+        ),
+        migrations.RunPython(create_slots, migrations.RunPython.noop),
+    ]
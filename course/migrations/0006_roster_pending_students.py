@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0005_schedule_slots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='courserostersnapshot',
+            name='pending_student_ids',
+            field=models.JSONField(default=list, help_text='IDs des étudiants à relire dans le Student Service (échec temporaire)'),
+        ),
+    ]
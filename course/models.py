@@ -49,6 +49,11 @@ class Course(models.Model):
         """
         verbose_name = "Cours"  # Nom singulier affiché dans l'admin Django
         verbose_name_plural = "Cours"  # Nom pluriel affiché dans l'admin Django
+        # Index sur les champs utilisés comme filtres par l'API (?category=, ?instructor=)
+        indexes = [
+            models.Index(fields=['category'], name='course_category_idx'),
+            models.Index(fields=['instructor'], name='course_instructor_idx'),
+        ]
 
 
 # =============================================================================
@@ -91,3 +96,169 @@ class StudentCourse(models.Model):
         verbose_name_plural = "Inscriptions Étudiant-Cours"  # Nom pluriel
         # unique_together = Contrainte d'unicité : un étudiant ne peut s'inscrire qu'une fois à un cours
         unique_together = ('student_id', 'course')
+        # (cette contrainte crée aussi l'index utilisé par le filtre ?student_id=,
+        #  et la clé étrangère "course" est indexée automatiquement)
+
+
+# =============================================================================
+# MODÈLE COURSEROSTERSNAPSHOT - Liste des inscrits précalculée
+# =============================================================================
+class CourseRosterSnapshot(models.Model):
+    """
+    Instantané matérialisé de la liste des étudiants d'un cours
+
+    Reconstruire la liste à chaque requête coûte une requête SQL plus un appel
+    au Student Service par étudiant. Cette table conserve le résultat déjà
+    formaté : elle est mise à jour de façon incrémentale quand les inscriptions
+    changent (voir course/signals.py) et servie telle quelle par
+    get_students_by_course avec son horodatage.
+    """
+
+    # OneToOneField = un seul instantané par cours, supprimé avec le cours
+    course = models.OneToOneField(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='roster_snapshot',
+        help_text="Cours dont on conserve la liste des inscrits"
+    )
+    # JSONField = liste sérialisée des étudiants (id, first_name, last_name, email)
+    students = models.JSONField(
+        default=list,
+        help_text="Liste des étudiants déjà formatée pour l'API"
+    )
+    # Date de la dernière mise à jour (reconstruction ou modification incrémentale)
+    refreshed_at = models.DateTimeField(
+        help_text="Date de la dernière mise à jour de l'instantané"
+    )
+    # Étudiants dont la fiche n'a pas pu être lue (délai dépassé, Student Service
+    # indisponible ou en erreur) : leur entrée est provisoire et sera relue
+    pending_student_ids = models.JSONField(
+        default=list,
+        help_text="IDs des étudiants à relire dans le Student Service (échec temporaire)"
+    )
+
+    def __str__(self):
+        return f"Roster {self.course_id} ({len(self.students)} étudiants)"
+
+    class Meta:
+        verbose_name = "Instantané de liste d'inscrits"
+        verbose_name_plural = "Instantanés de listes d'inscrits"
+
+
+# =============================================================================
+# MODÈLE CHANGELOGENTRY - Journal des modifications (flux de changements)
+# =============================================================================
+class ChangeLogEntry(models.Model):
+    """
+    Journal en ajout seul des créations, modifications et suppressions
+    de cours et d'inscriptions
+
+    L'identifiant auto-incrémenté sert de curseur : un consommateur garde le
+    dernier curseur reçu et demande GET /api/changes/?since=<curseur> pour
+    n'obtenir que les changements suivants (voir course/changefeed.py).
+    """
+
+    ACTION_CHOICES = [
+        ('create', 'Création'),
+        ('update', 'Modification'),
+        ('delete', 'Suppression'),
+    ]
+    MODEL_CHOICES = [
+        ('course', 'Cours'),
+        ('studentcourse', 'Inscription'),
+    ]
+
+    model = models.CharField(
+        max_length=20,
+        choices=MODEL_CHOICES,
+        help_text="Type d'objet modifié"
+    )
+    object_id = models.BigIntegerField(
+        help_text="ID de l'objet modifié"
+    )
+    action = models.CharField(
+        max_length=10,
+        choices=ACTION_CHOICES,
+        help_text="Type de modification"
+    )
+    # État de l'objet après la modification (ou avant la suppression)
+    data = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Données de l'objet au moment du changement"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Date du changement"
+    )
+
+    def __str__(self):
+        return f"#{self.pk} {self.action} {self.model} {self.object_id}"
+
+    class Meta:
+        verbose_name = "Changement"
+        verbose_name_plural = "Journal des changements"
+        # Lecture "WHERE model = ... AND id > curseur ORDER BY id" par index
+        indexes = [
+            models.Index(fields=['model', 'id'], name='changelog_model_cursor_idx'),
+        ]
+
+
+# =============================================================================
+# MODÈLE SCHEDULESLOT - Créneaux horaires structurés d'un cours
+# =============================================================================
+class ScheduleSlot(models.Model):
+    """
+    Créneau hebdomadaire d'un cours (jour, heure de début, heure de fin)
+
+    Course.schedule reste un texte libre ("Lundi 9h-11h, Mercredi 14h30-16h").
+    Il est analysé à chaque enregistrement du cours (voir course/schedule.py)
+    et stocké ici sous forme structurée : la recherche de chevauchements
+    devient une requête par intervalle sur un index au lieu d'une analyse
+    de tous les horaires côté client.
+    """
+
+    WEEKDAY_CHOICES = [
+        (0, 'Lundi'),
+        (1, 'Mardi'),
+        (2, 'Mercredi'),
+        (3, 'Jeudi'),
+        (4, 'Vendredi'),
+        (5, 'Samedi'),
+        (6, 'Dimanche'),
+    ]
+
+    # related_name='slots' : course.slots.all()
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='slots',
+        help_text="Cours auquel appartient le créneau"
+    )
+    weekday = models.PositiveSmallIntegerField(
+        choices=WEEKDAY_CHOICES,
+        help_text="Jour de la semaine (0 = lundi)"
+    )
+    # Heures stockées en minutes depuis minuit (9h30 → 570) : comparaisons numériques
+    start_minute = models.PositiveSmallIntegerField(
+        help_text="Début du créneau en minutes depuis minuit"
+    )
+    end_minute = models.PositiveSmallIntegerField(
+        help_text="Fin du créneau en minutes depuis minuit"
+    )
+
+    def __str__(self):
+        return (
+            f"{self.get_weekday_display()} "
+            f"{self.start_minute // 60}h{self.start_minute % 60:02d}-"
+            f"{self.end_minute // 60}h{self.end_minute % 60:02d}"
+        )
+
+    class Meta:
+        verbose_name = "Créneau horaire"
+        verbose_name_plural = "Créneaux horaires"
+        # Index d'intervalles : "weekday = J AND start_minute < fin AND end_minute > début"
+        # parcourt une plage de l'index (jour, début) et lit la fin dans l'index
+        indexes = [
+            models.Index(fields=['weekday', 'start_minute', 'end_minute'], name='slot_interval_idx'),
+        ]
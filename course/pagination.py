@@ -0,0 +1,22 @@
+# =============================================================================
+# PAGINATION (course/pagination.py)
+# =============================================================================
+# Pagination par curseur utilisée par défaut par les ViewSets (voir REST_FRAMEWORK
+# dans settings.py). Contrairement à la pagination par numéro de page, elle ne
+# fait ni COUNT(*) ni OFFSET : chaque page est une requête "WHERE id > ... LIMIT n"
+# sur la clé primaire, quel que soit le nombre de lignes déjà parcourues.
+
+from rest_framework.pagination import CursorPagination
+
+
+class CoursePagination(CursorPagination):
+    """
+    Pagination par curseur sur l'identifiant (clé primaire indexée)
+
+    Exemple : GET /api/catalog/?page_size=100
+    Réponse : {"next": "...?cursor=cD0xMDA%3D", "previous": null, "results": [...]}
+    """
+    ordering = 'id'  # Ordre stable et unique, servi par l'index de clé primaire
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
@@ -0,0 +1,190 @@
+# =============================================================================
+# PROFILAGE PAR ÉCHANTILLONNAGE (course/profiling.py)
+# =============================================================================
+# Quand la latence augmente en production, on veut savoir quel code est chaud
+# (vues, sérialiseurs, StudentService...) sans instrumenter chaque fonction.
+#
+# Principe : pendant une requête profilée, un thread d'échantillonnage relève
+# toutes les PROFILING_INTERVAL secondes la pile d'appels du thread qui traite
+# la requête (sys._current_frames). Les piles sont agrégées par endpoint dans
+# un stockage borné en mémoire, au format "collapsed" de flamegraph.pl /
+# speedscope ("module:fonction;module:fonction;... nombre").
+#
+# Activation (désactivé par défaut, voir settings.py) :
+#   PROFILING_ENABLED = True
+#   PROFILING_SAMPLE_RATE = 0.01            # 1 % des requêtes
+#   PROFILING_HEADER_TOKEN = "secret"       # + toute requête avec X-Profile-Token: secret
+# Lecture : GET /api/profiling/ (administrateurs, voir views.get_profiling)
+#
+# Désactivé, ProfilingMiddleware se retire de la chaîne au démarrage
+# (MiddlewareNotUsed) : aucun coût par requête.
+
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+
+# Pile tronquée au-delà de cette profondeur (récursions profondes)
+MAX_DEPTH = 128
+
+# Piles distinctes au-delà de la limite par endpoint
+OTHER_STACKS = '[autres piles]'
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def collapse(frame, root=None):
+    """
+    Pile d'une frame, de la racine vers la feuille : "mod:fn;mod:fn;..."
+
+    root : frame à partir de laquelle la pile commence (le middleware) ; les
+    frames du serveur (gunicorn, wsgi, threads) au-dessus sont ignorées.
+    """
+    names = []
+    while frame is not None and len(names) < MAX_DEPTH:
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+        if frame is root:
+            break
+        frame = frame.f_back
+    names.reverse()
+    return ';'.join(names)
+
+
+# =============================================================================
+# STOCKAGE BORNÉ DES PILES PAR ENDPOINT
+# =============================================================================
+class ProfileStore:
+    """
+    Piles agrégées par endpoint ("GET courses/<int:pk>/")
+
+    Bornes : PROFILING_MAX_ENDPOINTS endpoints (le moins récemment profilé est
+    retiré) et PROFILING_MAX_STACKS piles distinctes par endpoint (les suivantes
+    sont comptées dans OTHER_STACKS).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = OrderedDict()
+
+    def add(self, endpoint, stacks, seconds):
+        max_endpoints = _setting('PROFILING_MAX_ENDPOINTS', 100)
+        max_stacks = _setting('PROFILING_MAX_STACKS', 2000)
+        with self._lock:
+            entry = self._endpoints.get(endpoint)
+            if entry is None:
+                entry = {"requests": 0, "samples": 0, "seconds": 0.0, "stacks": Counter()}
+                self._endpoints[endpoint] = entry
+                while len(self._endpoints) > max_endpoints:
+                    self._endpoints.popitem(last=False)
+            else:
+                self._endpoints.move_to_end(endpoint)
+
+            entry["requests"] += 1
+            entry["seconds"] += seconds
+            for stack, count in stacks.items():
+                entry["samples"] += count
+                if stack not in entry["stacks"] and len(entry["stacks"]) >= max_stacks:
+                    stack = OTHER_STACKS
+                entry["stacks"][stack] += count
+
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def endpoints(self):
+        with self._lock:
+            return {
+                endpoint: {**entry, "stacks": Counter(entry["stacks"])}
+                for endpoint, entry in self._endpoints.items()
+            }
+
+    def collapsed(self, endpoint=None):
+        """Lignes "pile nombre" (toutes les piles, ou celles d'un endpoint)"""
+        lines = []
+        for name, entry in self.endpoints().items():
+            if endpoint is not None and name != endpoint:
+                continue
+            for stack, count in entry["stacks"].most_common():
+                # L'endpoint sert de racine : un seul flamegraph pour tout le service
+                lines.append(f"{name};{stack} {count}")
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    def summary(self, top=20):
+        """
+        Résumé par endpoint, à la manière de pstats
+
+        "self" = échantillons où la fonction était en haut de la pile (temps propre),
+        "total" = échantillons où elle apparaissait dans la pile (temps cumulé).
+        """
+        result = []
+        for endpoint, entry in self.endpoints().items():
+            own, total = Counter(), Counter()
+            for stack, count in entry["stacks"].items():
+                frames = stack.split(';')
+                own[frames[-1]] += count
+                for name in set(frames):
+                    total[name] += count
+            result.append({
+                "endpoint": endpoint,
+                "requests": entry["requests"],
+                "samples": entry["samples"],
+                "avg_ms": round(entry["seconds"] / entry["requests"] * 1000, 2),
+                "top_self": [{"function": name, "samples": count} for name, count in own.most_common(top)],
+                "top_total": [{"function": name, "samples": count} for name, count in total.most_common(top)],
+            })
+        return result
+
+
+# =============================================================================
+# THREAD D'ÉCHANTILLONNAGE
+# =============================================================================
+class Sampler:
+    """
+    Un thread par processus, démarré à la première requête profilée
+
+    Il ne relève que les piles des threads inscrits (requêtes en cours de
+    profilage) et attend sans rien faire quand il n'y en a aucun.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = {}  # thread_id → (frame racine, Counter des piles de la requête)
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def start(self, thread_id, root=None):
+        stacks = Counter()
+        with self._lock:
+            self._active[thread_id] = (root, stacks)
+            # Après un fork (gunicorn), le thread du processus parent n'existe plus
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return stacks
+
+    def stop(self, thread_id):
+        with self._lock:
+            _, stacks = self._active.pop(thread_id, (None, Counter()))
+            if not self._active:
+                self._wakeup.clear()
+        return stacks
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            time.sleep(_setting('PROFILING_INTERVAL', 0.005))
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, (root, stacks) in self._active.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        stacks[collapse(frame, root)] += 1
+
+
+store = ProfileStore()
+sampler = Sampler()
@@ -0,0 +1,66 @@
+# =============================================================================
+# RENDU ET LECTURE JSON RAPIDES (course/renderers.py)
+# =============================================================================
+# Remplace le module json de la bibliothèque standard par orjson (écrit en Rust,
+# plusieurs fois plus rapide) pour produire et lire le JSON de l'API.
+# Si orjson n'est pas installé, on se rabat automatiquement sur le comportement
+# standard de Django REST Framework.
+#
+# Activés dans REST_FRAMEWORK (settings.py) :
+#   'DEFAULT_RENDERER_CLASSES': ['course.renderers.FastJSONRenderer', ...]
+#   'DEFAULT_PARSER_CLASSES': ['course.renderers.FastJSONParser', ...]
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer basé sur orjson
+
+    Même sortie que JSONRenderer (UTF-8 compact). Les types non natifs (dates,
+    Decimal, chaînes traduites...) passent par l'encodeur de DRF : orjson sait
+    écrire les dates lui-même, mais au format "+00:00" là où DRF écrit "Z",
+    d'où OPT_PASSTHROUGH_DATETIME. Les UUID ont le même format des deux côtés.
+    Les réponses indentées (Accept: application/json; indent=4) et l'absence
+    d'orjson utilisent le rendu standard.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        # Comme JSONRenderer : échapper \u2028 et \u2029 (JSON valide en JavaScript)
+        if b'\xe2\x80' in ret:
+            ret = ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser basé sur orjson (corps des requêtes en UTF-8)"""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', 'utf-8')
+        if orjson is None or encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,354 @@
+# =============================================================================
+# INSTANTANÉS DES LISTES D'INSCRITS (course/rosters.py)
+# =============================================================================
+# Ce fichier gère les listes d'étudiants précalculées par cours
+# (modèle CourseRosterSnapshot). La lecture passe par le cache puis par la
+# base ; le Student Service n'est appelé que pour construire l'instantané ou
+# pour le mettre à jour quand une inscription change.
+#
+# Un échec temporaire du Student Service (délai dépassé, service indisponible,
+# erreur 5xx) n'est jamais conservé comme donnée définitive : l'entrée connue
+# de l'étudiant est gardée si elle existe, sinon une entrée provisoire est
+# enregistrée et l'étudiant est noté dans pending_student_ids pour être relu.
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import CourseRosterSnapshot, StudentCourse
+from .services import student_service
+from .throttling import upstream_limiter
+
+logger = logging.getLogger(__name__)
+
+# Clé de cache d'un instantané (un par cours)
+ROSTER_CACHE_KEY = 'roster:{course_id}'
+
+
+def _cache_key(course_id):
+    return ROSTER_CACHE_KEY.format(course_id=course_id)
+
+
+def _cache_timeout():
+    # Durée de vie dans le cache local : limite le décalage entre workers
+    # quand le cache n'est pas partagé (LocMemCache)
+    return getattr(settings, 'ROSTER_CACHE_TIMEOUT', 60)
+
+
+# =============================================================================
+# FORMATAGE D'UN ÉTUDIANT
+# =============================================================================
+def format_student(student_id, result):
+    """
+    Convertit le résultat de student_service.get_student_by_id en entrée de liste
+
+    Le format est celui historiquement renvoyé par get_students_by_course,
+    y compris pour les étudiants introuvables ou les erreurs du microservice.
+    """
+    if result.get('success'):
+        student_data = result['data']
+        return {
+            "id": student_data.get("id"),
+            "first_name": student_data.get("first_name") or student_data.get("firstName", f"Étudiant {student_id}"),
+            "last_name": student_data.get("last_name") or student_data.get("lastName", ""),
+            "email": student_data.get("email", f"student{student_id}@example.com"),
+        }
+
+    error = result.get('error', '')
+    if error == 'Student service timeout':
+        email = "Timeout - Service Student lent"
+    elif error == 'Student not found' or error.startswith('Student service error'):
+        email = "Non disponible"
+    else:
+        email = f"Erreur: {error[:50]}"
+    return {
+        "id": student_id,
+        "first_name": "Étudiant",
+        "last_name": f"#{student_id}",
+        "email": email
+    }
+
+
+def is_transient_failure(result):
+    """
+    Échec temporaire du Student Service (à relire plus tard)
+
+    Seul "Student not found" est une réponse définitive ; un délai dépassé,
+    une panne ou une erreur 5xx ne dit rien de l'étudiant.
+    """
+    return not result.get('success') and result.get('error') != 'Student not found'
+
+
+def fetch_students(student_ids):
+    """
+    Récupère et formate plusieurs étudiants (appels parallèles au microservice)
+
+    Returns:
+        tuple: ({student_id: entrée formatée}, {IDs en échec temporaire})
+    """
+    results = student_service.get_students_by_ids(student_ids)
+    entries = {
+        student_id: format_student(student_id, result)
+        for student_id, result in results.items()
+    }
+    failed = {student_id for student_id, result in results.items() if is_transient_failure(result)}
+    if failed:
+        logger.warning(f"Student service failed for {len(failed)} student(s), entries kept as pending")
+    return entries, failed
+
+
+# =============================================================================
+# LECTURE ET CONSTRUCTION
+# =============================================================================
+def _to_payload(snapshot):
+    """Données mises en cache pour un instantané"""
+    return {
+        "students": snapshot.students,
+        "refreshed_at": snapshot.refreshed_at.isoformat(),
+    }
+
+
+def _store(snapshot):
+    payload = _to_payload(snapshot)
+    cache.set(_cache_key(snapshot.course_id), payload, _cache_timeout())
+    return payload
+
+
+def preload(course_ids):
+    """
+    Met en cache les instantanés existants des cours donnés (une requête)
+
+    Utilisé au démarrage d'un worker (course/warmup.py) : les cours sans
+    instantané sont ignorés, le Student Service n'est jamais appelé.
+
+    Returns:
+        int: nombre de listes mises en cache
+    """
+    snapshots = CourseRosterSnapshot.objects.filter(course_id__in=list(course_ids))
+    count = 0
+    for snapshot in snapshots:
+        _store(snapshot)
+        count += 1
+    return count
+
+
+def get_roster(course):
+    """
+    Retourne la liste des inscrits d'un cours : {"students": [...], "refreshed_at": "..."}
+
+    Ordre de lecture : cache → table CourseRosterSnapshot → construction complète
+    (seul cas où le Student Service est appelé).
+
+    La construction passe par upstream_limiter : UpstreamBusy (503) si le
+    processus appelle déjà le Student Service UPSTREAM_MAX_CONCURRENCY fois.
+    """
+    payload = cache.get(_cache_key(course.pk))
+    if payload is not None:
+        return payload
+
+    snapshot = CourseRosterSnapshot.objects.filter(course_id=course.pk).first()
+    if snapshot is None:
+        with upstream_limiter.slot():
+            snapshot = rebuild_roster(course.pk)
+        return _to_payload(snapshot)
+    if snapshot.pending_student_ids and upstream_limiter.acquire():
+        # Fiches non lues lors de la dernière mise à jour : nouvel essai, au plus
+        # une fois par ROSTER_CACHE_TIMEOUT (le résultat est ensuite en cache).
+        # Limite atteinte : l'instantané est servi tel quel
+        try:
+            snapshot = retry_pending(course.pk) or snapshot
+        finally:
+            upstream_limiter.release()
+    return _store(snapshot)
+
+
+def _enrolled_ids(course_id):
+    return list(
+        StudentCourse.objects.filter(course_id=course_id)
+        .order_by('id')
+        .values_list('student_id', flat=True)
+    )
+
+
+def rebuild_roster(course_id):
+    """
+    Reconstruit entièrement l'instantané d'un cours
+
+    Les appels au Student Service sont faits hors transaction pour ne pas
+    garder de verrou d'écriture pendant les appels réseau. En cas d'échec
+    temporaire, l'entrée de l'ancien instantané est conservée si elle était valide.
+
+    Les inscriptions validées pendant ces appels ne sont pas perdues : sous le
+    verrou de l'instantané, les IDs sont relus, les étudiants ajoutés
+    entre-temps (peu nombreux) sont récupérés et les retirés sont ignorés.
+    Une mise à jour incrémentale validée ensuite attend ce verrou.
+    """
+    entries, failed = fetch_students(_enrolled_ids(course_id))
+
+    with transaction.atomic():
+        previous = (
+            CourseRosterSnapshot.objects.select_for_update()
+            .filter(course_id=course_id)
+            .first()
+        )
+        student_ids = _enrolled_ids(course_id)
+        added = [student_id for student_id in student_ids if student_id not in entries]
+        if added:
+            added_entries, added_failed = fetch_students(added)
+            entries.update(added_entries)
+            failed |= added_failed
+        failed &= set(student_ids)
+
+        if failed and previous is not None:
+            known = {
+                entry.get("id"): entry for entry in previous.students
+                if entry.get("id") not in previous.pending_student_ids
+            }
+            for student_id in failed & known.keys():
+                entries[student_id] = known[student_id]
+            failed -= known.keys()
+
+        snapshot, _ = CourseRosterSnapshot.objects.update_or_create(
+            course_id=course_id,
+            defaults={
+                "students": [entries[student_id] for student_id in student_ids],
+                "pending_student_ids": sorted(failed),
+                "refreshed_at": timezone.now(),
+            }
+        )
+    _store(snapshot)
+    return snapshot
+
+
+# =============================================================================
+# MISES À JOUR INCRÉMENTALES
+# =============================================================================
+def _update_snapshot(course_id, update):
+    """
+    Applique update(snapshot) (qui modifie students / pending_student_ids)
+    à l'instantané existant d'un cours
+
+    Si l'instantané n'existe pas encore, rien n'est fait : il sera construit
+    à la prochaine lecture.
+    """
+    with transaction.atomic():
+        snapshot = (
+            CourseRosterSnapshot.objects.select_for_update()
+            .filter(course_id=course_id)
+            .first()
+        )
+        if snapshot is None:
+            return None
+        update(snapshot)
+        snapshot.refreshed_at = timezone.now()
+        snapshot.save(update_fields=['students', 'pending_student_ids', 'refreshed_at'])
+    _store(snapshot)
+    return snapshot
+
+
+def _without(students, student_id):
+    return [entry for entry in students if entry.get("id") != student_id]
+
+
+def _replace_entries(entries, failed):
+    """
+    update() qui remplace les entrées relues avec succès
+
+    Les étudiants en échec gardent leur entrée actuelle (et restent en attente
+    s'ils l'étaient déjà).
+    """
+    fresh = {student_id: entry for student_id, entry in entries.items() if student_id not in failed}
+
+    def update(snapshot):
+        snapshot.students = [fresh.get(entry.get("id"), entry) for entry in snapshot.students]
+        snapshot.pending_student_ids = [
+            student_id for student_id in snapshot.pending_student_ids if student_id not in fresh
+        ]
+    return update
+
+
+def add_student(course_id, student_id, entry=None):
+    """
+    Ajoute (ou remplace) un étudiant dans l'instantané d'un cours
+
+    Sans entry, la fiche est demandée au Student Service via upstream_limiter ;
+    limite atteinte : entrée provisoire, relue plus tard comme un échec temporaire.
+    """
+    if not CourseRosterSnapshot.objects.filter(course_id=course_id).exists():
+        return None
+    failed = set()
+    if entry is None:
+        if upstream_limiter.acquire():
+            try:
+                entries, failed = fetch_students([student_id])
+            finally:
+                upstream_limiter.release()
+            entry = entries[student_id]
+        else:
+            entry = format_student(student_id, {'success': False, 'error': 'Student service busy'})
+            failed = {student_id}
+
+    def update(snapshot):
+        snapshot.students = _without(snapshot.students, student_id) + [entry]
+        pending = [pending_id for pending_id in snapshot.pending_student_ids if pending_id != student_id]
+        snapshot.pending_student_ids = pending + [student_id] if failed else pending
+    return _update_snapshot(course_id, update)
+
+
+def remove_student(course_id, student_id):
+    """Retire un étudiant de l'instantané d'un cours"""
+    def update(snapshot):
+        snapshot.students = _without(snapshot.students, student_id)
+        snapshot.pending_student_ids = [
+            pending_id for pending_id in snapshot.pending_student_ids if pending_id != student_id
+        ]
+    return _update_snapshot(course_id, update)
+
+
+def retry_pending(course_id):
+    """
+    Relit les étudiants en attente de l'instantané d'un cours
+
+    Returns:
+        CourseRosterSnapshot | None: l'instantané mis à jour (None s'il n'existe pas)
+    """
+    pending = list(
+        CourseRosterSnapshot.objects.filter(course_id=course_id)
+        .values_list('pending_student_ids', flat=True)
+        .first() or []
+    )
+    if not pending:
+        return None
+    entries, failed = fetch_students(pending)
+    return _update_snapshot(course_id, _replace_entries(entries, failed))
+
+
+def refresh_students(student_ids):
+    """
+    Met à jour les données d'étudiants dans tous les instantanés qui les contiennent
+
+    À appeler quand les données du Student Service ont changé
+    (voir la commande refresh_rosters). Chaque étudiant n'est récupéré qu'une fois.
+    """
+    entries, failed = fetch_students(student_ids)
+    course_ids = set(
+        CourseRosterSnapshot.objects.filter(
+            course__studentcourse__student_id__in=entries.keys()
+        ).values_list('course_id', flat=True)
+    )
+
+    update = _replace_entries(entries, failed)
+    for course_id in course_ids:
+        _update_snapshot(course_id, update)
+    return len(course_ids)
+
+
+def invalidate(course_id):
+    """Supprime l'entrée de cache d'un cours (l'instantané en base est conservé)"""
+    cache.delete(_cache_key(course_id))
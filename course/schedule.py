@@ -0,0 +1,250 @@
+# =============================================================================
+# CRÉNEAUX HORAIRES (course/schedule.py)
+# =============================================================================
+# Analyse le texte libre Course.schedule en créneaux structurés (modèle
+# ScheduleSlot) et s'en sert pour détecter les conflits d'emploi du temps :
+#   - parse_schedule("Lundi 9h-11h, Mercredi 14h30-16h") → [(0, 540, 660), (2, 870, 960)]
+#   - sync_course / sync_courses : met à jour les créneaux d'un ou plusieurs cours
+#   - student_conflicts : chevauchements entre les cours d'un étudiant
+#   - available_courses : cours compatibles avec l'emploi du temps d'un étudiant
+#
+# Formats reconnus (jours en français ou en anglais, abrégés ou non) :
+#   "Lundi 9h-11h", "Mardi 14h30-16h", "Lun 9h à 11h", "Monday 09:00-11:00",
+#   "Lundi et Jeudi 10h-12h", "Lundi 9h-11h et 14h-16h", "Lundi 9h-11h; Mardi 8h-10h"
+# Un horaire non reconnu ne produit aucun créneau (le cours reste valide).
+
+import re
+import unicodedata
+
+from django.db.models import Q
+
+from .models import Course, ScheduleSlot, StudentCourse
+
+# Nom des jours (index = weekday)
+DAY_NAMES = [label for _, label in ScheduleSlot.WEEKDAY_CHOICES]
+
+# Noms acceptés en entrée (minuscules, sans accents)
+DAY_ALIASES = {
+    'lundi': 0, 'lun': 0, 'monday': 0, 'mon': 0,
+    'mardi': 1, 'mar': 1, 'tuesday': 1, 'tue': 1, 'tues': 1,
+    'mercredi': 2, 'mer': 2, 'wednesday': 2, 'wed': 2,
+    'jeudi': 3, 'jeu': 3, 'thursday': 3, 'thu': 3, 'thur': 3, 'thurs': 3,
+    'vendredi': 4, 'ven': 4, 'friday': 4, 'fri': 4,
+    'samedi': 5, 'sam': 5, 'saturday': 5, 'sat': 5,
+    'dimanche': 6, 'dim': 6, 'sunday': 6, 'sun': 6,
+}
+
+# Une plage horaire ("9h-11h", "14h30 - 16h", "9h à 11h", "09:00-11:00")
+# ou un mot (jour, ou mot de liaison ignoré : "et", "de", "and"...)
+TOKEN_RE = re.compile(
+    r'(?P<start_h>\d{1,2})(?:[h:](?P<start_m>\d{2})?)?\s*(?:-|–|a|to)\s*'
+    r'(?P<end_h>\d{1,2})(?:[h:](?P<end_m>\d{2})?)?'
+    r'|(?P<word>[a-z]+)'
+)
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def _normalize(text):
+    """Minuscules sans accents ("Mardi à 14h" → "mardi a 14h")"""
+    text = unicodedata.normalize('NFKD', text or '')
+    return ''.join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def parse_schedule(text):
+    """
+    Analyse un horaire en texte libre
+
+    Une plage horaire s'applique aux jours cités juste avant elle ; une plage
+    sans nouveau jour reprend les derniers jours cités ("Lundi 9h-11h et 14h-16h").
+
+    Returns:
+        list: triples (weekday, start_minute, end_minute) triés, sans doublons
+    """
+    slots = set()
+    days = []
+    after_range = False
+
+    for match in TOKEN_RE.finditer(_normalize(text)):
+        word = match.group('word')
+        if word is not None:
+            day = DAY_ALIASES.get(word)
+            if day is None:
+                continue
+            if after_range:
+                # Nouveau groupe de jours après une plage horaire
+                days = []
+                after_range = False
+            days.append(day)
+            continue
+
+        start = int(match.group('start_h')) * 60 + int(match.group('start_m') or 0)
+        end = int(match.group('end_h')) * 60 + int(match.group('end_m') or 0)
+        after_range = True
+        if not days or not start < end <= MINUTES_PER_DAY:
+            continue
+        for day in days:
+            slots.add((day, start, end))
+
+    return sorted(slots)
+
+
+def format_minute(minute):
+    """570 → "09:30" """
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def format_slot(weekday, start_minute, end_minute):
+    return {
+        "weekday": weekday,
+        "day": DAY_NAMES[weekday],
+        "start": format_minute(start_minute),
+        "end": format_minute(end_minute),
+    }
+
+
+# =============================================================================
+# SYNCHRONISATION DES CRÉNEAUX
+# =============================================================================
+def sync_courses(courses):
+    """
+    Remplace les créneaux des cours donnés par ceux de leur horaire actuel
+
+    Deux requêtes quel que soit le nombre de cours (DELETE ... IN, INSERT en masse) :
+    utilisé par le signal post_save de Course et par l'import en masse.
+    """
+    courses = [course for course in courses if course.pk is not None]
+    if not courses:
+        return
+    ScheduleSlot.objects.filter(course_id__in=[course.pk for course in courses]).delete()
+    ScheduleSlot.objects.bulk_create([
+        ScheduleSlot(course_id=course.pk, weekday=weekday, start_minute=start, end_minute=end)
+        for course in courses
+        for weekday, start, end in parse_schedule(course.schedule)
+    ])
+
+
+def sync_course(course):
+    sync_courses([course])
+
+
+# =============================================================================
+# CONFLITS D'EMPLOI DU TEMPS
+# =============================================================================
+def overlap_q(slots):
+    """
+    Condition "chevauche l'un de ces créneaux" pour une requête sur ScheduleSlot
+
+    Deux créneaux du même jour se chevauchent si chacun commence avant la fin
+    de l'autre (des créneaux qui se touchent, 9h-11h et 11h-13h, ne sont pas
+    en conflit). Chaque terme est une recherche par intervalle sur slot_interval_idx.
+    """
+    condition = Q(pk__in=[])
+    for weekday, start, end in slots:
+        condition |= Q(weekday=weekday, start_minute__lt=end, end_minute__gt=start)
+    return condition
+
+
+def within_q(windows):
+    """Condition "entièrement contenu dans l'une de ces plages libres" """
+    condition = Q(pk__in=[])
+    for weekday, start, end in windows:
+        condition |= Q(weekday=weekday, start_minute__gte=start, end_minute__lte=end)
+    return condition
+
+
+def _student_slots(student_id):
+    """Créneaux des cours d'un étudiant : (weekday, début, fin, course_id, nom du cours)"""
+    return list(
+        ScheduleSlot.objects
+        .filter(course__studentcourse__student_id=student_id)
+        .order_by('weekday', 'start_minute', 'end_minute')
+        .values_list('weekday', 'start_minute', 'end_minute', 'course_id', 'course__name')
+    )
+
+
+def _conflict(first, second):
+    weekday = first[0]
+    return {
+        **format_slot(weekday, max(first[1], second[1]), min(first[2], second[2])),
+        "courses": [
+            {"id": first[3], "name": first[4]},
+            {"id": second[3], "name": second[4]},
+        ],
+    }
+
+
+def student_conflicts(student_id, course=None):
+    """
+    Chevauchements dans l'emploi du temps d'un étudiant
+
+    Args:
+        student_id: ID de l'étudiant
+        course: cours candidat (optionnel) ; seuls ses conflits avec les cours
+                de l'étudiant sont alors renvoyés (vérification avant inscription)
+
+    Returns:
+        list: {"weekday", "day", "start", "end", "courses": [{id, name}, {id, name}]}
+        (start/end = plage où les deux cours se chevauchent)
+    """
+    if course is not None:
+        # Créneaux du candidat, puis une requête par intervalle sur les cours de l'étudiant
+        candidate = list(course.slots.values_list('weekday', 'start_minute', 'end_minute'))
+        if not candidate:
+            return []
+        clashes = (
+            ScheduleSlot.objects
+            .filter(overlap_q(candidate), course__studentcourse__student_id=student_id)
+            .exclude(course_id=course.pk)
+            .order_by('weekday', 'start_minute')
+            .values_list('weekday', 'start_minute', 'end_minute', 'course_id', 'course__name')
+        )
+        return [
+            _conflict((weekday, start, end, course.pk, course.name), clash)
+            for clash in clashes
+            for weekday, start, end in candidate
+            if weekday == clash[0] and start < clash[2] and end > clash[1]
+        ]
+
+    # Une requête, puis balayage des créneaux triés : chaque créneau n'est
+    # comparé qu'aux créneaux encore ouverts du même jour
+    conflicts = []
+    active = []
+    for slot in _student_slots(student_id):
+        active = [other for other in active if other[0] == slot[0] and other[2] > slot[1]]
+        for other in active:
+            if other[3] != slot[3]:
+                conflicts.append(_conflict(other, slot))
+        active.append(slot)
+    return conflicts
+
+
+def available_courses(student_id, windows=None):
+    """
+    Cours du catalogue compatibles avec l'emploi du temps d'un étudiant
+
+    Un cours est retenu s'il a au moins un créneau reconnu, qu'aucun de ses
+    créneaux ne chevauche un cours de l'étudiant et que l'étudiant n'y est
+    pas déjà inscrit. Avec windows (plages libres), chaque créneau du cours
+    doit en plus tenir dans l'une de ces plages.
+
+    Returns:
+        QuerySet de Course (filtrable / paginable par l'appelant)
+    """
+    busy = [slot[:3] for slot in _student_slots(student_id)]
+
+    courses = Course.objects.filter(
+        pk__in=ScheduleSlot.objects.values('course_id')
+    ).exclude(
+        pk__in=StudentCourse.objects.filter(student_id=student_id).values('course_id')
+    )
+    if busy:
+        courses = courses.exclude(
+            pk__in=ScheduleSlot.objects.filter(overlap_q(busy)).values('course_id')
+        )
+    if windows is not None:
+        # Exclure les cours dont un créneau dépasse des plages libres
+        courses = courses.exclude(
+            pk__in=ScheduleSlot.objects.exclude(within_q(windows)).values('course_id')
+        )
+    return courses.order_by('id')
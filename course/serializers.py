@@ -7,13 +7,93 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
+from django.db.models import F  # Référence à une colonne (alias dans .values())
 from rest_framework import serializers  # Classes de base pour créer des sérialiseurs
 from .models import Course, StudentCourse  # Importation des modèles à sérialiser
 
+
+# =============================================================================
+# CHAMPS À LA DEMANDE (?fields=)
+# =============================================================================
+class DynamicFieldsMixin:
+    """
+    Permet de ne sérialiser qu'une partie des champs : ?fields=id,name
+
+    - Serializer(..., fields=['id', 'name']) : ne garde que ces champs dans le JSON
+    - Serializer.requested_fields(request) : lit et valide le paramètre ?fields=
+    - Serializer.columns(fields) : colonnes SQL à lire pour ces champs, pour
+      restreindre aussi la requête avec .only() ou .values()
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def _sources(cls):
+        # {nom du champ JSON: chemin ORM}, calculé une seule fois par classe
+        cache = cls.__dict__.get('_sources_cache')
+        if cache is None:
+            cache = {
+                name: '__'.join(field.source.split('.'))
+                for name, field in cls().fields.items()
+            }
+            cls._sources_cache = cache
+        return cache
+
+    @classmethod
+    def requested_fields(cls, request):
+        """
+        Liste des champs demandés par ?fields=, ou None si le paramètre est absent
+
+        Lève ValidationError (réponse 400) si un champ est inconnu.
+        """
+        raw = request.query_params.get('fields', '')
+        fields = list(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+        if not fields:
+            return None
+        unknown = [name for name in fields if name not in cls._sources()]
+        if unknown:
+            raise serializers.ValidationError({
+                "fields": f"Champ(s) inconnu(s) : {', '.join(unknown)}. "
+                          f"Champs disponibles : {', '.join(cls._sources())}."
+            })
+        return fields
+
+    @classmethod
+    def columns(cls, fields):
+        """
+        Colonnes SQL pour les champs demandés : {nom du champ JSON: chemin ORM}
+
+        Exemple (StudentCourseSerializer) : ['id', 'course_name'] →
+        {'id': 'id', 'course_name': 'course__name'}
+        """
+        sources = cls._sources()
+        return {name: sources[name] for name in fields}
+
+    @classmethod
+    def values(cls, queryset, fields):
+        """
+        Lit uniquement les colonnes demandées, directement en dictionnaires
+
+        Pas d'instanciation de modèles ni de passage par le sérialiseur :
+        utilisé pour les lectures avec ?fields= dans les vues fonctions.
+        """
+        plain, aliased = [], {}
+        for name, lookup in cls.columns(fields).items():
+            if name == lookup:
+                plain.append(name)
+            else:
+                aliased[name] = F(lookup)
+        return queryset.values(*plain, **aliased)
+
 # =============================================================================
 # SÉRIALISEUR POUR LES COURS
 # =============================================================================
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Sérialiseur pour le modèle Course
     
@@ -29,6 +109,8 @@ class CourseSerializer(serializers.ModelSerializer):
         "category": "Programming",
         "schedule": "Lundi 9h-11h"
     }
+
+    Avec ?fields=id,name : {"id": 1, "name": "Python Programming"}
     """
     
     class Meta:
@@ -49,7 +131,7 @@ class CourseSerializer(serializers.ModelSerializer):
 # =============================================================================
 # SÉRIALISEUR POUR LES INSCRIPTIONS ÉTUDIANT-COURS
 # =============================================================================
-class StudentCourseSerializer(serializers.ModelSerializer):
+class StudentCourseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Sérialiseur pour le modèle StudentCourse
     
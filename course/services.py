@@ -10,6 +10,7 @@
 import requests  # Bibliothèque pour faire des appels HTTP
 # Bibliothèque pour faire des appels HTTP
 import logging  # Pour enregistrer les logs (erreurs, informations)
+from concurrent.futures import ThreadPoolExecutor  # Pour paralléliser les appels HTTP
 from django.conf import settings  # Pour accéder aux paramètres de configuration Django
 
 # Configuration du système de logging
@@ -52,7 +53,41 @@ class StudentService:
             'STUDENT_SERVICE_TIMEOUT', 
             5
         )
-    
+
+        # Nombre maximal d'appels simultanés vers le microservice
+        # (utilisé pour récupérer plusieurs étudiants en parallèle)
+        self.max_workers = getattr(
+            settings,
+            'STUDENT_SERVICE_MAX_WORKERS',
+            16
+        )
+
+        # Session HTTP créée au premier appel (voir la propriété session)
+        self._session = None
+
+    @property
+    def session(self):
+        """
+        Session HTTP partagée : réutilise les connexions TCP/TLS (keep-alive)
+        au lieu d'ouvrir une nouvelle connexion à chaque appel
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.max_workers
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+
+    def close(self):
+        """Ferme les connexions ouvertes (ex: après un fork de gunicorn)"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def get_student_by_id(self, student_id):
         """
         Récupère un étudiant par son ID depuis le microservice Student Service
@@ -74,7 +109,7 @@ class StudentService:
             
             # Faire l'appel HTTP GET vers le microservice
             # timeout=self.timeout : arrêter l'appel après X secondes
-            response = requests.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             
             # Analyser le code de statut de la réponse HTTP
             if response.status_code == 200:
@@ -134,13 +169,32 @@ class StudentService:
         Returns:
             list: Liste de dictionnaires contenant les résultats pour chaque étudiant
         """
-        results = []
-        # Parcourir chaque ID d'étudiant
-        for student_id in student_ids:
-            # Valider chaque étudiant individuellement
-            result = self.get_student_by_id(student_id)
-            results.append(result)
-        return results
+        # Les appels sont faits en parallèle, l'ordre des résultats suit l'ordre des IDs
+        results = self.get_students_by_ids(student_ids)
+        return [results[student_id] for student_id in student_ids]
+
+    def get_students_by_ids(self, student_ids):
+        """
+        Récupère plusieurs étudiants en parallèle depuis le microservice
+
+        Args:
+            student_ids (iterable): IDs des étudiants à récupérer
+
+        Returns:
+            dict: {student_id: résultat de get_student_by_id}
+        """
+        # Supprimer les doublons en gardant l'ordre
+        unique_ids = list(dict.fromkeys(student_ids))
+        if not unique_ids:
+            return {}
+        if len(unique_ids) == 1:
+            return {unique_ids[0]: self.get_student_by_id(unique_ids[0])}
+
+        # Pool de threads limité : les appels sont bloqués sur le réseau, pas sur le CPU
+        workers = min(self.max_workers, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.get_student_by_id, unique_ids)
+            return dict(zip(unique_ids, results))
     
     def is_student_valid(self, student_id):
         """
@@ -0,0 +1,130 @@
+# =============================================================================
+# SIGNAUX (course/signals.py)
+# =============================================================================
+# Ce fichier réagit aux modifications des modèles pour garder à jour les
+# données dérivées (instantanés des listes d'inscrits, ...).
+# Les récepteurs sont connectés dans CourseConfig.ready() (course/apps.py).
+#
+# ⚠️ Les opérations en masse (bulk_create, QuerySet.update/delete) ne
+# déclenchent pas ces signaux : elles doivent mettre à jour ces données elles-mêmes.
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from . import catalog, changefeed, rosters, schedule
+from .authentication import invalidate_token
+from .models import Course, StudentCourse
+
+
+# =============================================================================
+# INSCRIPTIONS → INSTANTANÉS DES LISTES D'INSCRITS
+# =============================================================================
+@receiver(pre_save, sender=StudentCourse)
+def remember_previous_course(sender, instance, **kwargs):
+    """Mémorise le cours d'origine quand une inscription existante est modifiée"""
+    if instance.pk is None:
+        instance._previous_roster = None
+        return
+    instance._previous_roster = (
+        StudentCourse.objects.filter(pk=instance.pk)
+        .values_list('course_id', 'student_id')
+        .first()
+    )
+
+
+@receiver(post_save, sender=StudentCourse)
+def enrollment_saved(sender, instance, **kwargs):
+    """
+    Ajoute l'étudiant à l'instantané du cours (après validation de la transaction)
+
+    Si la fiche de l'étudiant vient d'être lue (enroll_student), elle est
+    passée dans instance._roster_entry : pas de second appel au Student Service.
+    """
+    course_id, student_id = instance.course_id, instance.student_id
+    previous = getattr(instance, '_previous_roster', None)
+    entry = getattr(instance, '_roster_entry', None)
+
+    def update():
+        if previous and previous != (course_id, student_id):
+            rosters.remove_student(*previous)
+        rosters.add_student(course_id, student_id, entry=entry)
+
+    transaction.on_commit(update)
+
+
+@receiver(post_delete, sender=StudentCourse)
+def enrollment_deleted(sender, instance, **kwargs):
+    """Retire l'étudiant de l'instantané du cours"""
+    course_id, student_id = instance.course_id, instance.student_id
+    transaction.on_commit(lambda: rosters.remove_student(course_id, student_id))
+
+
+@receiver(post_delete, sender=Course)
+def course_deleted(sender, instance, **kwargs):
+    """L'instantané est supprimé en cascade : on retire aussi son entrée de cache"""
+    course_id = instance.pk
+    transaction.on_commit(lambda: rosters.invalidate(course_id))
+
+
+# =============================================================================
+# COURS → CRÉNEAUX HORAIRES
+# =============================================================================
+@receiver(post_save, sender=Course)
+def course_saved(sender, instance, update_fields=None, **kwargs):
+    """Analyse l'horaire du cours et remplace ses créneaux (ScheduleSlot)"""
+    if update_fields is not None and 'schedule' not in update_fields:
+        return
+    schedule.sync_course(instance)
+
+
+# =============================================================================
+# COURS → VERSION DU CATALOGUE (caches des facettes, ...)
+# =============================================================================
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def catalog_changed(sender, instance, **kwargs):
+    """Nouvelle version du catalogue, une fois la modification validée"""
+    # Après validation : une lecture concurrente ne peut pas mettre en cache
+    # l'ancien état sous la nouvelle version
+    transaction.on_commit(catalog.bump)
+
+
+# =============================================================================
+# COURS ET INSCRIPTIONS → FLUX DE CHANGEMENTS
+# =============================================================================
+# Enregistré immédiatement (et non après validation) : dans une transaction,
+# l'entrée du journal est validée ou annulée avec la modification elle-même.
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=StudentCourse)
+def record_saved(sender, instance, created, raw=False, **kwargs):
+    """Création ou modification d'un cours / d'une inscription"""
+    if raw:  # Chargement de fixtures (loaddata)
+        return
+    changefeed.record(instance, 'create' if created else 'update')
+
+
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=StudentCourse)
+def record_deleted(sender, instance, **kwargs):
+    """Suppression d'un cours / d'une inscription (y compris en cascade)"""
+    changefeed.record(instance, 'delete')
+
+
+# =============================================================================
+# TOKENS ET UTILISATEURS → CACHE D'AUTHENTIFICATION
+# =============================================================================
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def token_changed(sender, instance, **kwargs):
+    """Token supprimé ou remplacé : il ne doit plus être accepté depuis le cache"""
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_changed(sender, instance, **kwargs):
+    """Utilisateur modifié (désactivé, droits changés...) : recharger ses tokens"""
+    for key in Token.objects.filter(user=instance).values_list('key', flat=True):
+        invalidate_token(key)
@@ -1,3 +1,1228 @@
-from django.test import TestCase
+# =============================================================================
+# TESTS DE L'APPLICATION COURSE (course/tests.py)
+# =============================================================================
+# Lancement : python manage.py test course
+#
+# Le Student Service n'est jamais appelé : student_service.get_student_by_id
+# est remplacé par fake_student_service (voir plus bas).
 
-# Create your tests here.
+import datetime
+import gzip
+import io
+import os
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import uuid
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+
+from . import authentication, bulk, catalog, deletion, profiling, rosters, schedule, throttling, warmup
+from .middleware import accepted_encodings, brotli
+from .renderers import FastJSONParser, FastJSONRenderer
+from .models import ChangeLogEntry, Course, CourseRosterSnapshot, ScheduleSlot, StudentCourse
+from .services import StudentService, student_service
+
+
+def json_loads(content):
+    return FastJSONParser().parse(io.BytesIO(content))
+
+
+def create_course(**fields):
+    data = {
+        "name": "Python avancé",
+        "instructor": "Dr. Sara",
+        "category": "Programmation",
+        "schedule": "Lundi 9h-11h",
+    }
+    data.update(fields)
+    return Course.objects.create(**data)
+
+
+def fake_student_service(failing=(), errors=None):
+    """
+    Remplace student_service.get_student_by_id
+
+    failing : IDs pour lesquels le service dépasse son délai ;
+    errors : {student_id: message d'erreur} pour les autres échecs.
+    """
+    errors = dict(errors or {})
+    for student_id in failing:
+        errors[student_id] = 'Student service timeout'
+
+    def get_student_by_id(student_id):
+        if student_id in errors:
+            return {'success': False, 'error': errors[student_id], 'student_id': student_id}
+        return {
+            'success': True,
+            'data': {"id": student_id, "firstName": f"Prénom{student_id}", "lastName": "Nom",
+                     "email": f"s{student_id}@example.com"},
+            'student_id': student_id,
+        }
+
+    return mock.patch.object(student_service, 'get_student_by_id', side_effect=get_student_by_id)
+
+
+def admin_headers():
+    """En-tête d'authentification d'un administrateur (endpoints IsAdminUser)"""
+    user = User.objects.create_superuser(f'admin{User.objects.count()}', 'admin@example.com', 'secret')
+    return {'HTTP_AUTHORIZATION': f'Token {Token.objects.create(user=user).key}'}
+
+
+class CacheClearingTestCase(TestCase):
+    """Les caches locaux (LocMemCache) survivent aux transactions annulées des tests"""
+
+    def setUp(self):
+        cache.clear()
+
+
+# =============================================================================
+# INSTANTANÉS DES LISTES D'INSCRITS (course/rosters.py)
+# =============================================================================
+class RosterSnapshotTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.course = create_course()
+
+    def enroll(self, student_id):
+        with self.captureOnCommitCallbacks(execute=True):
+            return StudentCourse.objects.create(student_id=student_id, course=self.course)
+
+    def snapshot(self):
+        return CourseRosterSnapshot.objects.get(course=self.course)
+
+    def test_first_read_builds_snapshot(self):
+        StudentCourse.objects.create(student_id=1, course=self.course)
+        with fake_student_service():
+            roster = rosters.get_roster(self.course)
+        self.assertEqual([entry["id"] for entry in roster["students"]], [1])
+        self.assertEqual(self.snapshot().students[0]["first_name"], "Prénom1")
+
+    def test_enrollment_added_and_removed(self):
+        with fake_student_service():
+            rosters.rebuild_roster(self.course.pk)
+            enrollment = self.enroll(7)
+        self.assertEqual([entry["id"] for entry in self.snapshot().students], [7])
+        self.assertEqual(rosters.get_roster(self.course)["students"][0]["email"], "s7@example.com")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enrollment.delete()
+        self.assertEqual(self.snapshot().students, [])
+        self.assertEqual(rosters.get_roster(self.course)["students"], [])
+
+    def test_read_from_snapshot_without_upstream_call(self):
+        with fake_student_service():
+            self.enroll(1)
+            rosters.rebuild_roster(self.course.pk)
+        cache.clear()
+        with fake_student_service() as upstream:
+            rosters.get_roster(self.course)
+        upstream.assert_not_called()
+
+    def rebuild_during(self, change):
+        """rebuild_roster où change() est validé pendant les appels au Student Service"""
+        fetch = rosters.fetch_students
+        calls = []
+
+        def fetch_students(student_ids):
+            calls.append(student_ids)
+            if len(calls) == 1:
+                change()
+            return fetch(student_ids)
+
+        with fake_student_service(), mock.patch.object(rosters, 'fetch_students', side_effect=fetch_students):
+            rosters.rebuild_roster(self.course.pk)
+        return calls
+
+    def test_enrollment_during_rebuild(self):
+        with fake_student_service():
+            self.enroll(10)
+            rosters.rebuild_roster(self.course.pk)
+        calls = self.rebuild_during(lambda: self.enroll(20))
+        # add_student (instantané existant), puis la reconstruction ne récupère
+        # que l'étudiant ajouté entre-temps
+        self.assertEqual(calls, [[10], [20], [20]])
+        self.assertEqual([entry["id"] for entry in self.snapshot().students], [10, 20])
+        self.assertEqual([entry["id"] for entry in rosters.get_roster(self.course)["students"]], [10, 20])
+
+    def test_enrollment_during_first_build(self):
+        StudentCourse.objects.create(student_id=10, course=self.course)
+        self.rebuild_during(lambda: self.enroll(20))
+        self.assertEqual([entry["id"] for entry in self.snapshot().students], [10, 20])
+
+    def test_removal_during_rebuild(self):
+        with fake_student_service():
+            enrollment = self.enroll(10)
+            self.enroll(20)
+            rosters.rebuild_roster(self.course.pk)
+
+        def remove():
+            with self.captureOnCommitCallbacks(execute=True):
+                enrollment.delete()
+        self.rebuild_during(remove)
+        self.assertEqual([entry["id"] for entry in self.snapshot().students], [20])
+
+    def test_enroll_endpoint_reuses_fetched_student(self):
+        with fake_student_service():
+            rosters.rebuild_roster(self.course.pk)
+        with fake_student_service() as upstream, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/enroll/', {"student_id": 5, "course_id": self.course.pk},
+                                        content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        upstream.assert_called_once_with(5)
+        self.assertEqual(self.snapshot().students[0]["email"], "s5@example.com")
+
+    @override_settings(UPSTREAM_MAX_CONCURRENCY=0)
+    def test_add_student_when_upstream_busy(self):
+        with fake_student_service():
+            rosters.rebuild_roster(self.course.pk)
+        with fake_student_service() as upstream:
+            self.enroll(6)
+        upstream.assert_not_called()
+        self.assertEqual(self.snapshot().pending_student_ids, [6])
+
+    def test_transient_failure_is_pending_then_retried(self):
+        StudentCourse.objects.create(student_id=1, course=self.course)
+        StudentCourse.objects.create(student_id=2, course=self.course)
+        with fake_student_service(failing=[2]), self.assertLogs('course.rosters', 'WARNING'):
+            snapshot = rosters.rebuild_roster(self.course.pk)
+        self.assertEqual(snapshot.pending_student_ids, [2])
+
+        # Lecture suivante après expiration du cache : seul l'étudiant 2 est relu
+        cache.clear()
+        with fake_student_service() as upstream:
+            roster = rosters.get_roster(self.course)
+        upstream.assert_called_once_with(2)
+        self.assertEqual(roster["students"][1]["email"], "s2@example.com")
+        self.assertEqual(self.snapshot().pending_student_ids, [])
+
+    def test_rebuild_keeps_known_entry_on_failure(self):
+        StudentCourse.objects.create(student_id=1, course=self.course)
+        with fake_student_service():
+            rosters.rebuild_roster(self.course.pk)
+        with fake_student_service(errors={1: 'Student service error: 503'}), \
+                self.assertLogs('course.rosters', 'WARNING'):
+            snapshot = rosters.rebuild_roster(self.course.pk)
+        self.assertEqual(snapshot.students[0]["email"], "s1@example.com")
+        self.assertEqual(snapshot.pending_student_ids, [])
+
+    def test_student_not_found_is_final(self):
+        StudentCourse.objects.create(student_id=1, course=self.course)
+        with fake_student_service(errors={1: 'Student not found'}):
+            snapshot = rosters.rebuild_roster(self.course.pk)
+        self.assertEqual(snapshot.students[0]["email"], "Non disponible")
+        self.assertEqual(snapshot.pending_student_ids, [])
+
+    def test_refresh_rosters_builds_missing_snapshots(self):
+        other = create_course(name="Algèbre")
+        StudentCourse.objects.bulk_create([
+            StudentCourse(student_id=1, course=self.course),
+            StudentCourse(student_id=2, course=self.course),
+            StudentCourse(student_id=3, course=other),
+        ])
+        with fake_student_service():
+            call_command('refresh_rosters', stdout=StringIO())
+            self.assertFalse(CourseRosterSnapshot.objects.exists())
+
+            call_command('refresh_rosters', min_students=2, stdout=StringIO())
+            self.assertEqual(list(CourseRosterSnapshot.objects.values_list('course_id', flat=True)),
+                             [self.course.pk])
+
+            call_command('refresh_rosters', '--all', stdout=StringIO())
+        self.assertEqual(CourseRosterSnapshot.objects.count(), 2)
+
+    def test_students_endpoint(self):
+        StudentCourse.objects.create(student_id=1, course=self.course)
+        with fake_student_service():
+            response = self.client.get(f'/api/course/{self.course.pk}/students/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["students_count"], 1)
+        self.assertIn("refreshed_at", response.json())
+
+
+# =============================================================================
+# PROFIL GUNICORN DE PRODUCTION (gunicorn.conf.py)
+# =============================================================================
+GUNICORN_CONF = Path(settings.BASE_DIR) / 'gunicorn.conf.py'
+
+
+class GunicornConfigTests(TestCase):
+
+    def load(self, **env):
+        with mock.patch.dict(os.environ, env):
+            return runpy.run_path(str(GUNICORN_CONF))
+
+    def test_defaults(self):
+        config = self.load()
+        self.assertEqual(config['worker_class'], 'gthread')
+        self.assertGreaterEqual(config['workers'], 3)
+        self.assertTrue(config['preload_app'])
+        self.assertLess(config['max_requests_jitter'], config['max_requests'])
+
+    def test_workers_follow_container_cpu_quota(self):
+        # 16 CPU sur l'hôte, quota du conteneur : 1,5 CPU → 2 CPU → 5 workers
+        with mock.patch('os.sched_getaffinity', return_value=set(range(16)), create=True), \
+                mock.patch('builtins.open', mock.mock_open(read_data='150000 100000')):
+            config = self.load()
+        self.assertEqual(config['workers'], 5)
+
+    def test_workers_capped(self):
+        with mock.patch('os.sched_getaffinity', return_value=set(range(16)), create=True), \
+                mock.patch('builtins.open', side_effect=OSError):
+            self.assertEqual(self.load()['workers'], 8)
+            self.assertEqual(self.load(GUNICORN_MAX_WORKERS='4')['workers'], 4)
+
+    def test_environment_overrides(self):
+        config = self.load(GUNICORN_WORKERS='2', GUNICORN_THREADS='8', GUNICORN_PRELOAD='0',
+                           GUNICORN_BIND='127.0.0.1:9000')
+        self.assertEqual((config['workers'], config['threads']), (2, 8))
+        self.assertFalse(config['preload_app'])
+        self.assertEqual(config['bind'], '127.0.0.1:9000')
+
+    def test_post_fork_resets_connections(self):
+        session = student_service.session
+        server, worker = mock.Mock(), mock.Mock()
+        server.cfg.preload_app = True
+        with mock.patch('django.db.connections.close_all') as close_all:
+            self.load()['post_fork'](server, worker)
+        close_all.assert_called_once()
+        # Le worker crée sa propre session HTTP au premier appel
+        self.assertIsNot(student_service.session, session)
+
+    def test_post_fork_without_preload(self):
+        server, worker = mock.Mock(), mock.Mock()
+        server.cfg.preload_app = False
+        with mock.patch('django.db.connections.close_all') as close_all:
+            self.load()['post_fork'](server, worker)
+        close_all.assert_not_called()
+
+    def test_post_worker_init_warms_up(self):
+        worker = mock.Mock()
+        report = {"seconds": 0.01}
+        with mock.patch.object(warmup, 'warm_up', return_value=report) as warm_up:
+            self.load()['post_worker_init'](worker)
+            warm_up.assert_called_once()
+            with override_settings(WARMUP_ENABLED=False):
+                self.load()['post_worker_init'](worker)
+            warm_up.assert_called_once()
+
+
+# =============================================================================
+# PROFIL DE PRODUCTION (course_service/settings_production.py)
+# =============================================================================
+class ProductionSettingsTests(TestCase):
+
+    def run_with_production_settings(self, code, **env):
+        """Exécute code dans un processus neuf avec le profil de production"""
+        environ = {key: value for key, value in os.environ.items() if key != 'DJANGO_SECRET_KEY'}
+        environ.update(DJANGO_SETTINGS_MODULE='course_service.settings_production', **env)
+        return subprocess.run(
+            [sys.executable, '-c', f"import django; django.setup(); {code}"],
+            cwd=settings.BASE_DIR, env=environ, capture_output=True, text=True
+        )
+
+    def test_secret_key_required(self):
+        result = self.run_with_production_settings("print('ok')")
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn('ImproperlyConfigured', result.stderr)
+
+    def test_trimmed_profile(self):
+        code = (
+            "from django.conf import settings; from django.apps import apps; "
+            "from django.urls import resolve, Resolver404\n"
+            "try:\n    resolve('/admin/'); print('admin')\n"
+            "except Resolver404:\n    print('no-admin')\n"
+            "print(settings.DEBUG, apps.is_installed('django.contrib.sessions'))"
+        )
+        result = self.run_with_production_settings(code, DJANGO_SECRET_KEY='test-key')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split(), ['no-admin', 'False', 'False'])
+
+    def test_student_session_created_on_first_use(self):
+        service = StudentService()
+        self.assertIsNone(service._session)
+        self.assertIs(service.session, service.session)
+        service.close()
+        self.assertIsNone(service._session)
+
+
+# =============================================================================
+# VIEWSETS DU ROUTER (/api/catalog/, /api/studentcourses/)
+# =============================================================================
+class ViewSetTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.python = create_course()
+        self.algebra = create_course(name="Algèbre", instructor="Dr. Ali", category="Mathématiques")
+        StudentCourse.objects.bulk_create([
+            StudentCourse(student_id=1, course=self.python),
+            StudentCourse(student_id=1, course=self.algebra),
+            StudentCourse(student_id=2, course=self.python),
+        ])
+
+    def test_catalog_filters(self):
+        response = self.client.get('/api/catalog/', {'category': 'Mathématiques'})
+        self.assertEqual([course["id"] for course in response.json()["results"]], [self.algebra.pk])
+
+    def test_cursor_pagination(self):
+        first = self.client.get('/api/catalog/', {'page_size': 1}).json()
+        self.assertEqual(first["results"][0]["id"], self.python.pk)
+        second = self.client.get(first["next"]).json()
+        self.assertEqual(second["results"][0]["id"], self.algebra.pk)
+        self.assertIsNone(second["next"])
+
+    def test_studentcourses_single_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/studentcourses/', {'course': self.python.pk})
+        self.assertEqual(
+            sorted(row["student_id"] for row in response.json()["results"]), [1, 2]
+        )
+
+    def test_by_student(self):
+        response = self.client.get('/api/studentcourses/by_student/', {'student_id': 1})
+        self.assertEqual(len(response.json()["results"]), 2)
+        response = self.client.get('/api/studentcourses/by_student/', {'student_id': 'x'})
+        self.assertEqual(response.status_code, 400)
+
+
+# =============================================================================
+# CHAMPS À LA DEMANDE (?fields=)
+# =============================================================================
+class SparseFieldsTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.course = create_course()
+        StudentCourse.objects.create(student_id=1, course=self.course)
+
+    def test_function_view_reads_only_requested_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/courses/', {'fields': 'id,name'})
+        self.assertEqual(response.json(), [{"id": self.course.pk, "name": "Python avancé"}])
+        self.assertNotIn('"instructor"', queries[-1]['sql'])
+
+    def test_course_by_id(self):
+        response = self.client.get(f'/api/courses/{self.course.pk}/', {'fields': 'name'})
+        self.assertEqual(response.json(), {"name": "Python avancé"})
+
+    def test_viewset(self):
+        response = self.client.get('/api/catalog/', {'fields': 'id,category'})
+        self.assertEqual(response.json()["results"], [{"id": self.course.pk, "category": "Programmation"}])
+
+    def test_related_field_without_instances(self):
+        response = self.client.get('/api/studentcourses/', {'fields': 'student_id,course_name'})
+        self.assertEqual(response.json()["results"], [{"student_id": 1, "course_name": "Python avancé"}])
+
+    def test_student_courses(self):
+        response = self.client.get('/api/student/1/courses/', {'fields': 'id'})
+        self.assertEqual(response.json(), [{"id": self.course.pk}])
+
+    def test_unknown_field(self):
+        response = self.client.get('/api/courses/', {'fields': 'id,password'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("password", response.json()["fields"])
+
+
+# =============================================================================
+# RENDU JSON (orjson) ET COMPRESSION DES RÉPONSES
+# =============================================================================
+class FastJSONTests(TestCase):
+
+    def test_same_output_as_json_renderer(self):
+        data = {
+            "aware": datetime.datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+            "naive": datetime.datetime(2026, 1, 2, 3, 4, 5),
+            "date": datetime.date(2026, 1, 2),
+            "time": datetime.time(9, 30),
+            "uuid": uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            "decimal": Decimal('12.50'),
+            "lazy": gettext_lazy("Cours"),
+            "text": "Étudiant \u2028 séparateur",
+            "nested": [{1: None, "ok": True, "ratio": 0.5}],
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_changefeed_dates_end_with_z(self):
+        create_course()
+        payload = self.client.get('/api/changes/').content
+        self.assertRegex(payload.decode(), r'"created_at":"[^"]+Z"')
+
+    def test_parser(self):
+        parsed = FastJSONParser().parse(io.BytesIO('{"name": "Algèbre"}'.encode()))
+        self.assertEqual(parsed, {"name": "Algèbre"})
+
+    def test_invalid_json_returns_400(self):
+        response = self.client.post('/api/courses/add/', '{"name":', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+class CompressionTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        Course.objects.bulk_create([
+            Course(name=f"Cours {index}", instructor="Dr. Sara", category="Programmation", schedule="Lundi 9h-11h")
+            for index in range(50)
+        ])
+
+    def test_large_response_is_gzipped(self):
+        response = self.client.get('/api/courses/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(len(json_loads(gzip.decompress(response.content))), 50)
+
+    @skipUnless(brotli, "paquet brotli non installé")
+    def test_brotli_preferred(self):
+        response = self.client.get('/api/courses/', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(len(json_loads(brotli.decompress(response.content))), 50)
+
+    def test_not_compressed_without_accept_encoding(self):
+        response = self.client.get('/api/courses/')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_small_response_not_compressed(self):
+        response = self.client.get('/api/courses/', {'fields': 'id', 'ids': '1'}, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_accepted_encodings(self):
+        self.assertEqual(accepted_encodings("gzip, br;q=0.9, deflate;q=0"),
+                         {"gzip": 1.0, "br": 0.9, "deflate": 0.0})
+
+
+# =============================================================================
+# FLUX DE CHANGEMENTS (/api/changes/)
+# =============================================================================
+class ChangeFeedTests(CacheClearingTestCase):
+
+    def changes(self, **params):
+        response = self.client.get('/api/changes/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_pages_through_since_and_has_more(self):
+        course = create_course()
+        course.name = "Python expert"
+        course.save()
+        enrollment = StudentCourse.objects.create(student_id=1, course=course)
+        enrollment.delete()
+
+        first = self.changes(limit=3)
+        self.assertTrue(first["has_more"])
+        self.assertEqual(
+            [(change["model"], change["action"]) for change in first["changes"]],
+            [("course", "create"), ("course", "update"), ("studentcourse", "create")]
+        )
+        self.assertEqual(first["changes"][1]["data"]["name"], "Python expert")
+
+        second = self.changes(since=first["next_cursor"], limit=3)
+        self.assertFalse(second["has_more"])
+        self.assertEqual([change["action"] for change in second["changes"]], ["delete"])
+
+        # Rien de nouveau : le curseur est renvoyé tel quel
+        third = self.changes(since=second["next_cursor"])
+        self.assertEqual((third["changes"], third["next_cursor"]), ([], second["next_cursor"]))
+
+    def test_model_filter(self):
+        course = create_course()
+        StudentCourse.objects.create(student_id=1, course=course)
+        changes = self.changes(model='studentcourse')["changes"]
+        self.assertEqual([change["data"] for change in changes],
+                         [{"id": changes[0]["object_id"], "student_id": 1, "course": course.pk}])
+
+    def test_rolled_back_change_not_recorded(self):
+        try:
+            with transaction.atomic():
+                create_course()
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertFalse(ChangeLogEntry.objects.exists())
+
+    def test_invalid_parameters(self):
+        for params in ({'since': '-1'}, {'limit': '0'}, {'model': 'user'}):
+            self.assertEqual(self.client.get('/api/changes/', params).status_code, 400)
+
+
+# =============================================================================
+# CACHE DES TOKENS (course/authentication.py)
+# =============================================================================
+class CachedTokenAuthenticationTests(TestCase):
+
+    def setUp(self):
+        caches['auth'].clear()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        marker = override_settings(TOKEN_REVOCATION_MARKER=os.path.join(directory, 'revocations'))
+        marker.enable()
+        self.addCleanup(marker.disable)
+
+        self.user = User.objects.create_superuser('admin', 'admin@example.com', 'secret')
+        self.token = Token.objects.create(user=self.user)
+
+    def get(self, key=None):
+        # /api/profiling/ (administrateurs) ne fait aucune requête SQL elle-même
+        return self.client.get('/api/profiling/', HTTP_AUTHORIZATION=f'Token {key or self.token.key}')
+
+    def test_warm_request_makes_no_query(self):
+        self.assertEqual(self.get().status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get().status_code, 200)
+
+    def test_deleted_token_rejected(self):
+        key = self.token.key
+        self.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.token.delete()
+        self.assertEqual(self.get(key).status_code, 401)
+
+    def test_revocation_from_another_process(self):
+        key = self.token.key
+        self.get()
+        # Entrée telle qu'elle reste dans le cache d'un autre worker
+        stale = caches['auth'].get(authentication._cache_key(key))
+        stale = (stale[0], stale[1], stale[2] - 5)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.token.delete()
+        caches['auth'].set(authentication._cache_key(key), stale)
+        self.assertEqual(self.get(key).status_code, 401)
+
+    def test_deactivated_user_rejected(self):
+        self.get()
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertEqual(self.get().status_code, 401)
+
+    def test_unknown_token(self):
+        self.assertEqual(self.get('0' * 40).status_code, 401)
+
+
+# =============================================================================
+# IMPORT / EXPORT EN MASSE (course/bulk.py)
+# =============================================================================
+class BulkImportExportTests(CacheClearingTestCase):
+
+    def import_body(self, body, content_type):
+        return self.client.post('/api/courses/import/', body.encode(), content_type=content_type,
+                                **admin_headers())
+
+    def test_csv_reports_invalid_rows(self):
+        body = (
+            "id,name,instructor,category,schedule\n"
+            ",Python,Dr. Sara,Programmation,Lundi 9h-11h\n"
+            ",,Dr. Ali,Mathématiques,Mardi 9h-11h\n"
+            "abc,Algèbre,Dr. Ali,Mathématiques,Mardi 9h-11h\n"
+        )
+        report = self.import_body(body, 'text/csv').json()
+        self.assertEqual((report["processed"], report["created"], report["invalid"]), (3, 1, 2))
+        self.assertEqual([error["line"] for error in report["errors"]], [3, 4])
+        self.assertIn("name", report["errors"][0]["errors"])
+        self.assertTrue(Course.objects.filter(name="Python").exists())
+
+    def test_ndjson_update_by_id(self):
+        course = create_course()
+        body = (
+            f'{{"id": {course.pk}, "name": "Python expert", "instructor": "Dr. Sara", '
+            f'"category": "Programmation", "schedule": "Lundi 9h-11h"}}\n'
+            'pas du json\n'
+        )
+        report = self.import_body(body, 'application/x-ndjson').json()
+        self.assertEqual((report["updated"], report["invalid"]), (1, 1))
+        course.refresh_from_db()
+        self.assertEqual(course.name, "Python expert")
+
+    def test_http_reimport_keeps_unicode_line_separators(self):
+        create_course(name="Cours\u2028avec\u0085séparateurs")
+        stream = StringIO()
+        bulk.write_records(Course.objects.all(), stream, 'ndjson')
+        Course.objects.all().delete()
+
+        report = self.import_body(stream.getvalue(), 'application/x-ndjson').json()
+        self.assertEqual((report["created"], report["invalid"]), (1, 0))
+        self.assertEqual(Course.objects.get().name, "Cours\u2028avec\u0085séparateurs")
+
+    def test_multipart_upload(self):
+        upload = io.BytesIO(b"name,instructor,category,schedule\nPython,Dr. Sara,Programmation,Lundi 9h-11h\n")
+        upload.name = 'courses.csv'
+        response = self.client.post('/api/courses/import/', {'file': upload}, **admin_headers())
+        self.assertEqual(response.json()["created"], 1)
+
+    def test_import_requires_admin(self):
+        response = self.client.post('/api/courses/import/', b'', content_type='text/csv')
+        self.assertEqual(response.status_code, 401)
+
+    def test_commands_round_trip(self):
+        create_course()
+        create_course(name="Algèbre", category="Mathématiques")
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'courses.csv')
+
+        call_command('export_courses', path, '--category', 'Mathématiques', stdout=StringIO(), stderr=StringIO())
+        Course.objects.all().delete()
+        call_command('import_courses', path, stdout=StringIO(), stderr=StringIO())
+        self.assertEqual(list(Course.objects.values_list('name', flat=True)), ["Algèbre"])
+        # Les créneaux horaires sont créés malgré bulk_create (pas de signaux)
+        self.assertEqual(Course.objects.get().slots.count(), 1)
+
+
+# =============================================================================
+# CRÉNEAUX HORAIRES ET CONFLITS (course/schedule.py)
+# =============================================================================
+class ScheduleParserTests(TestCase):
+
+    def test_formats(self):
+        cases = {
+            "Lundi 9h-11h, Mercredi 14h30-16h": [(0, 540, 660), (2, 870, 960)],
+            "Lun 9h à 11h": [(0, 540, 660)],
+            "Monday 09:00-11:00": [(0, 540, 660)],
+            "Lundi et Jeudi 10h-12h": [(0, 600, 720), (3, 600, 720)],
+            "Lundi 9h-11h et 14h-16h": [(0, 540, 660), (0, 840, 960)],
+            "Lundi 9h-11h; Mardi 8h-10h": [(0, 540, 660), (1, 480, 600)],
+        }
+        for text, slots in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(schedule.parse_schedule(text), slots)
+
+    def test_unrecognized(self):
+        for text in ("", "À définir", "Lundi 11h-9h", "9h-11h"):
+            with self.subTest(text=text):
+                self.assertEqual(schedule.parse_schedule(text), [])
+
+
+class ScheduleConflictTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.monday = create_course(name="Python", schedule="Lundi 9h-11h")
+        self.overlap = create_course(name="Algèbre", schedule="Lundi 10h-12h")
+        self.touching = create_course(name="Réseaux", schedule="Lundi 11h-13h")
+        self.tuesday = create_course(name="Chimie", schedule="Mardi 14h-16h")
+        create_course(name="Sans horaire", schedule="À définir")
+        StudentCourse.objects.create(student_id=1, course=self.monday)
+
+    def test_slots_follow_schedule_changes(self):
+        self.monday.schedule = "Vendredi 8h-10h"
+        self.monday.save()
+        self.assertEqual(list(self.monday.slots.values_list('weekday', 'start_minute')), [(4, 480)])
+
+    def test_student_conflicts(self):
+        StudentCourse.objects.create(student_id=1, course=self.overlap)
+        StudentCourse.objects.create(student_id=1, course=self.touching)
+        conflicts = self.client.get('/api/student/1/conflicts/').json()["conflicts"]
+        # 9h-11h / 10h-12h et 10h-12h / 11h-13h ; 9h-11h et 11h-13h se touchent seulement
+        self.assertEqual([(conflict["start"], conflict["end"]) for conflict in conflicts],
+                         [("10:00", "11:00"), ("11:00", "12:00")])
+        self.assertEqual({course["id"] for course in conflicts[0]["courses"]},
+                         {self.monday.pk, self.overlap.pk})
+
+    def test_candidate_conflicts(self):
+        response = self.client.get('/api/student/1/conflicts/', {'course': self.overlap.pk})
+        conflicts = response.json()["conflicts"]
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0]["day"], "Lundi")
+        self.assertEqual(self.client.get('/api/student/1/conflicts/', {'course': self.tuesday.pk})
+                         .json()["conflicts"], [])
+
+    def test_available_courses(self):
+        ids = [course["id"] for course in self.client.get('/api/student/1/available-courses/').json()]
+        self.assertEqual(ids, [self.touching.pk, self.tuesday.pk])
+
+    def test_available_courses_within_windows(self):
+        response = self.client.get('/api/student/1/available-courses/', {'within': 'Mardi 13h-17h'})
+        self.assertEqual([course["id"] for course in response.json()], [self.tuesday.pk])
+        response = self.client.get('/api/student/1/available-courses/', {'within': 'bientôt'})
+        self.assertEqual(response.status_code, 400)
+
+
+class ScheduleSlotMigrationTests(TransactionTestCase):
+    """La migration 0005 crée les créneaux des cours existants"""
+
+    def test_backfill(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate([('course', '0004_change_log')])
+        old_apps = executor.loader.project_state([('course', '0004_change_log')]).apps
+        OldCourse = old_apps.get_model('course', 'Course')
+        course = OldCourse.objects.create(name="Python", instructor="Dr. Sara", category="Programmation",
+                                          schedule="Lundi et Jeudi 10h-12h")
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+        self.assertEqual(
+            list(Course.objects.get(pk=course.pk).slots.order_by('weekday')
+                 .values_list('weekday', 'start_minute', 'end_minute')),
+            [(0, 600, 720), (3, 600, 720)]
+        )
+
+
+# =============================================================================
+# SUPPRESSION PAR PAQUETS (course/deletion.py)
+# =============================================================================
+class BatchedDeletionTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.course = create_course()
+        self.other = create_course(name="Algèbre", category="Archives")
+        StudentCourse.objects.bulk_create(
+            [StudentCourse(student_id=index, course=self.course) for index in range(25)]
+            + [StudentCourse(student_id=1, course=self.other)]
+        )
+
+    def test_delete_courses_in_batches(self):
+        with fake_student_service():
+            rosters.get_roster(self.course)
+        with self.captureOnCommitCallbacks(execute=True):
+            report = deletion.delete_courses([self.course.pk], batch_size=10)
+
+        self.assertEqual((report["courses"], report["enrollments"]), (1, 25))
+        # 3 paquets d'inscriptions (10 + 10 + 5) + 1 pour les cours
+        self.assertEqual(report["batches"], 4)
+        self.assertFalse(StudentCourse.objects.filter(course_id=self.course.pk).exists())
+        self.assertFalse(ScheduleSlot.objects.filter(course_id=self.course.pk).exists())
+        self.assertEqual(StudentCourse.objects.filter(course=self.other).count(), 1)
+        self.assertIsNone(cache.get(rosters._cache_key(self.course.pk)))
+        # Les suppressions en masse apparaissent quand même dans le flux
+        self.assertEqual(
+            ChangeLogEntry.objects.filter(model='studentcourse', action='delete').count(), 25
+        )
+
+    def test_function_view_and_viewset(self):
+        with mock.patch.object(deletion, 'delete_course', wraps=deletion.delete_course) as delete_course:
+            self.assertEqual(self.client.delete(f'/api/courses/delete/{self.course.pk}/').status_code, 200)
+            self.assertEqual(self.client.delete(f'/api/catalog/{self.other.pk}/').status_code, 204)
+        self.assertEqual(delete_course.call_count, 2)
+        self.assertFalse(StudentCourse.objects.exists())
+
+    def test_bulk_delete(self):
+        headers = admin_headers()
+        response = self.client.post('/api/courses/bulk-delete/', {"category": "Archives", "dry_run": True},
+                                    content_type='application/json', **headers)
+        self.assertEqual(response.json(), {"dry_run": True, "courses": 1, "enrollments": 1})
+        self.assertTrue(Course.objects.filter(pk=self.other.pk).exists())
+
+        # "false" (chaîne) n'est pas une simulation
+        response = self.client.post('/api/courses/bulk-delete/', {"category": "Archives", "dry_run": "false"},
+                                    content_type='application/json', **headers)
+        self.assertEqual(response.json()["courses"], 1)
+        self.assertFalse(Course.objects.filter(pk=self.other.pk).exists())
+
+    def test_bulk_delete_invalid_bodies(self):
+        headers = admin_headers()
+        for body in ([1, 2], {}, {"ids": "1,2"}, {"ids": [True]}):
+            with self.subTest(body=body):
+                response = self.client.post('/api/courses/bulk-delete/', body,
+                                            content_type='application/json', **headers)
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(Course.objects.count(), 2)
+
+    def test_bulk_delete_invalid_filter_value(self):
+        # Une valeur rejetée par le filtre ne doit pas élargir la suppression à tout le catalogue
+        headers = admin_headers()
+        for body in ({"category": "\u0000"}, {"instructor": "a\u0000b"}):
+            with self.subTest(body=body):
+                response = self.client.post('/api/courses/bulk-delete/', body,
+                                            content_type='application/json', **headers)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+        self.assertEqual(Course.objects.count(), 2)
+
+
+# =============================================================================
+# PROFILAGE PAR ÉCHANTILLONNAGE (course/profiling.py)
+# =============================================================================
+class ProfileStoreTests(TestCase):
+
+    def test_collapse_stops_at_root(self):
+        def inner():
+            return sys._getframe()
+
+        def outer():
+            return inner(), sys._getframe()
+
+        leaf, root = outer()
+        self.assertEqual(profiling.collapse(leaf, root), f"{__name__}:outer;{__name__}:inner")
+
+    @override_settings(PROFILING_MAX_ENDPOINTS=2, PROFILING_MAX_STACKS=2)
+    def test_bounds(self):
+        store = profiling.ProfileStore()
+        store.add("GET a/", {"m:f": 1}, 0.01)
+        store.add("GET b/", {"m:f": 1}, 0.01)
+        store.add("GET a/", {"m:g": 1, "m:h": 2}, 0.01)
+        store.add("GET c/", {}, 0.01)
+        endpoints = store.endpoints()
+        # "GET b/" est le moins récemment profilé
+        self.assertEqual(list(endpoints), ["GET a/", "GET c/"])
+        self.assertEqual(endpoints["GET a/"]["stacks"],
+                         {"m:f": 1, "m:g": 1, profiling.OTHER_STACKS: 2})
+        self.assertEqual(endpoints["GET a/"]["requests"], 2)
+
+    def test_collapsed_and_summary(self):
+        store = profiling.ProfileStore()
+        store.add("GET a/", {"m:view;m:query": 3, "m:view": 1}, 0.02)
+        self.assertEqual(store.collapsed(), "GET a/;m:view;m:query 3\nGET a/;m:view 1\n")
+        summary = store.summary()[0]
+        self.assertEqual(summary["top_self"][0], {"function": "m:query", "samples": 3})
+        self.assertEqual(summary["top_total"][0], {"function": "m:view", "samples": 4})
+        self.assertEqual(summary["avg_ms"], 20.0)
+
+
+class ProfilingMiddlewareTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        profiling.store.clear()
+
+    def test_disabled_by_default(self):
+        response = self.client.get('/api/courses/', HTTP_X_PROFILE_TOKEN='secret')
+        self.assertFalse(response.has_header('X-Profiled'))
+
+    @override_settings(PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=0, PROFILING_HEADER_TOKEN='secret')
+    def test_header_token(self):
+        self.assertFalse(self.client.get('/api/courses/').has_header('X-Profiled'))
+        self.assertFalse(self.client.get('/api/courses/', HTTP_X_PROFILE_TOKEN='wrong').has_header('X-Profiled'))
+
+        response = self.client.get('/api/courses/', HTTP_X_PROFILE_TOKEN='secret')
+        self.assertEqual(response['X-Profiled'], '1')
+        self.assertEqual(profiling.store.endpoints()["GET api/courses/"]["requests"], 1)
+
+        headers = admin_headers()
+        summary = self.client.get('/api/profiling/', **headers).json()
+        self.assertEqual([entry["endpoint"] for entry in summary["endpoints"]], ["GET api/courses/"])
+        self.assertEqual(self.client.delete('/api/profiling/', **headers).status_code, 204)
+        self.assertEqual(profiling.store.endpoints(), {})
+
+    @override_settings(PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=0, PROFILING_HEADER_TOKEN='secret')
+    def test_non_ascii_header_token(self):
+        response = self.client.get('/api/courses/', HTTP_X_PROFILE_TOKEN='é')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('X-Profiled'))
+
+    def test_report_requires_admin(self):
+        self.assertEqual(self.client.get('/api/profiling/').status_code, 401)
+
+
+# =============================================================================
+# FACETTES DU CATALOGUE (course/catalog.py)
+# =============================================================================
+class FacetTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        create_course(name="Python")
+        create_course(name="Django", instructor="Dr. Ali")
+        create_course(name="Algèbre", instructor="Dr. Ali", category="Mathématiques")
+
+    def test_counts(self):
+        facets = self.client.get('/api/courses/facets/').json()
+        self.assertEqual(facets["total"], 3)
+        self.assertEqual(facets["category"], [{"value": "Programmation", "count": 2},
+                                              {"value": "Mathématiques", "count": 1}])
+        self.assertEqual(facets["instructor"], [{"value": "Dr. Ali", "count": 2},
+                                                {"value": "Dr. Sara", "count": 1}])
+
+    def test_search_filters_facets(self):
+        response = self.client.get('/api/courses/search/', {'instructor': 'Ali', 'facets': '1'}).json()
+        self.assertEqual(len(response["results"]), 2)
+        self.assertEqual(response["facets"]["category"], [{"value": "Mathématiques", "count": 1},
+                                                          {"value": "Programmation", "count": 1}])
+
+    def test_cached_until_catalog_changes(self):
+        self.client.get('/api/courses/facets/')
+        with self.assertNumQueries(0):
+            self.client.get('/api/courses/facets/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_course(name="Géométrie", category="Mathématiques")
+        facets = self.client.get('/api/courses/facets/').json()
+        self.assertEqual(facets["total"], 4)
+        self.assertIn({"value": "Mathématiques", "count": 2}, facets["category"])
+
+    def test_bump_changes_cache_keys(self):
+        key = catalog.cache_key('facets', 'x')
+        catalog.bump()
+        self.assertNotEqual(catalog.cache_key('facets', 'x'), key)
+
+
+# =============================================================================
+# LECTURE GROUPÉE PAR ID (?ids=, /api/courses/batch/)
+# =============================================================================
+class CourseBatchTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.first = create_course(name="Python")
+        self.second = create_course(name="Algèbre")
+
+    def test_ids_keeps_order_and_reports_missing(self):
+        missing = self.second.pk + 100
+        response = self.client.get('/api/courses/', {'ids': f'{self.second.pk},{missing},{self.first.pk}'}).json()
+        self.assertEqual([course["name"] for course in response["results"]], ["Algèbre", "Python"])
+        self.assertEqual(response["missing"], [missing])
+
+    def test_post_batch_with_fields(self):
+        response = self.client.post('/api/courses/batch/?fields=id', {"ids": [self.first.pk]},
+                                    content_type='application/json')
+        self.assertEqual(response.json(), {"results": [{"id": self.first.pk}], "missing": []})
+
+    def test_reads_database_without_shared_cache(self):
+        self.client.get(f'/api/courses/{self.first.pk}/')
+        # Modification faite par un autre worker (pas de nouvelle version ici)
+        Course.objects.filter(pk=self.first.pk).update(name="Python expert")
+        self.assertEqual(self.client.get(f'/api/courses/{self.first.pk}/').json()["name"], "Python expert")
+        Course.objects.filter(pk=self.second.pk).delete()
+        self.assertEqual(self.client.get(f'/api/courses/{self.second.pk}/').status_code, 404)
+        response = self.client.get('/api/courses/', {'ids': f'{self.first.pk},{self.second.pk}'}).json()
+        self.assertEqual(response["missing"], [self.second.pk])
+
+    @override_settings(CATALOG_SHARED_CACHE=True)
+    def test_shared_cache(self):
+        ids = f'{self.first.pk},{self.second.pk}'
+        with self.assertNumQueries(1):
+            self.client.get('/api/courses/', {'ids': ids})
+        with self.assertNumQueries(0):
+            self.client.get('/api/courses/', {'ids': ids})
+            self.client.get(f'/api/courses/{self.first.pk}/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.name = "Python expert"
+            self.first.save()
+        self.assertEqual(self.client.get(f'/api/courses/{self.first.pk}/').json()["name"], "Python expert")
+
+    @override_settings(COURSE_BATCH_MAX_IDS=2)
+    def test_invalid_ids(self):
+        for ids in ('', 'a,b', '1,2,3'):
+            with self.subTest(ids=ids):
+                self.assertEqual(self.client.get('/api/courses/', {'ids': ids}).status_code, 400)
+        response = self.client.post('/api/courses/batch/', [1], content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_ids_out_of_range(self):
+        huge = 2 ** 64
+        self.assertEqual(self.client.get('/api/courses/', {'ids': str(huge)}).status_code, 400)
+        response = self.client.post('/api/courses/batch/', {"ids": [-huge]}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get(f'/api/courses/{huge}/').status_code, 404)
+
+
+# =============================================================================
+# TABLEAU DE BORD ÉTUDIANT (/api/student/<id>/dashboard/)
+# =============================================================================
+class DashboardTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.python = create_course(name="Python", schedule="Lundi 9h-11h")
+        self.algebra = create_course(name="Algèbre", schedule="Lundi 10h-12h")
+        StudentCourse.objects.bulk_create([
+            StudentCourse(student_id=1, course=self.python),
+            StudentCourse(student_id=1, course=self.algebra),
+            StudentCourse(student_id=2, course=self.python),
+        ])
+
+    def test_dashboard(self):
+        with fake_student_service():
+            data = self.client.get('/api/student/1/dashboard/').json()
+        self.assertEqual(data["student"]["firstName"], "Prénom1")
+        self.assertIsNone(data["student_error"])
+        self.assertEqual([(course["name"], course["headcount"]) for course in data["courses"]],
+                         [("Python", 2), ("Algèbre", 1)])
+        self.assertEqual(len(data["conflicts"]), 1)
+
+    def test_student_service_failure(self):
+        with fake_student_service(failing=[1]):
+            response = self.client.get('/api/student/1/dashboard/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()["student"])
+        self.assertEqual(response.json()["student_error"], 'Student service timeout')
+        self.assertEqual(len(response.json()["courses"]), 2)
+
+    def test_query_count(self):
+        with fake_student_service(), self.assertNumQueries(3):
+            self.client.get('/api/student/1/dashboard/')
+        # Un seul cours : pas de recherche de conflits
+        StudentCourse.objects.filter(student_id=1, course=self.algebra).delete()
+        with fake_student_service(), self.assertNumQueries(2):
+            self.client.get('/api/student/1/dashboard/')
+
+
+# =============================================================================
+# LIMITATION DE DÉBIT ET APPELS SIMULTANÉS (course/throttling.py)
+# =============================================================================
+class ThrottlingTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        caches['throttle'].clear()
+        self.course = create_course()
+        StudentCourse.objects.create(student_id=1, course=self.course)
+
+    def roster(self, **extra):
+        return self.client.get(f'/api/course/{self.course.pk}/students/', **extra)
+
+    def test_token_bucket_per_client(self):
+        with mock.patch.object(throttling.RosterThrottle, 'THROTTLE_RATES', {'roster': '2/min'}), \
+                fake_student_service():
+            statuses = [self.roster().status_code for _ in range(3)]
+            other = self.roster(REMOTE_ADDR='10.0.0.2')
+            response = self.roster()
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+        # Seau propre à chaque client
+        self.assertEqual(other.status_code, 200)
+
+    @override_settings(UPSTREAM_MAX_CONCURRENCY=0, UPSTREAM_RETRY_AFTER=3)
+    def test_busy_upstream_on_roster_build(self):
+        with fake_student_service() as upstream:
+            response = self.roster()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '3')
+        self.assertIn("error", response.json())
+        upstream.assert_not_called()
+        self.assertEqual(throttling.upstream_limiter.in_flight, 0)
+
+    def test_cached_roster_not_limited(self):
+        with fake_student_service():
+            self.assertEqual(self.roster().status_code, 200)
+        with override_settings(UPSTREAM_MAX_CONCURRENCY=0):
+            self.assertEqual(self.roster().status_code, 200)
+            # Instantané en base, cache vidé : toujours sans appel au Student Service
+            cache.clear()
+            self.assertEqual(self.roster().status_code, 200)
+
+    @override_settings(UPSTREAM_MAX_CONCURRENCY=0)
+    def test_pending_retry_skipped_when_busy(self):
+        with fake_student_service(failing=[1]):
+            rosters.rebuild_roster(self.course.pk)
+        cache.clear()
+        with fake_student_service() as upstream:
+            response = self.roster()
+        self.assertEqual(response.status_code, 200)
+        upstream.assert_not_called()
+        self.assertEqual(CourseRosterSnapshot.objects.get(course=self.course).pending_student_ids, [1])
+
+    def enroll(self, student_id):
+        return self.client.post('/api/enroll/', {"student_id": student_id, "course_id": self.course.pk},
+                                content_type='application/json')
+
+    def test_enroll_checks_student_service(self):
+        with fake_student_service(failing=[3], errors={4: 'Student not found'}):
+            self.assertEqual(self.enroll(2).status_code, 201)
+            self.assertEqual(self.enroll(3).status_code, 503)
+            self.assertEqual(self.enroll(4).status_code, 404)
+        self.assertEqual(set(StudentCourse.objects.values_list('student_id', flat=True)), {1, 2})
+        # Le créneau est libéré même quand le Student Service échoue
+        self.assertEqual(throttling.upstream_limiter.in_flight, 0)
+
+    @override_settings(UPSTREAM_MAX_CONCURRENCY=0)
+    def test_enroll_busy(self):
+        with fake_student_service() as upstream:
+            response = self.enroll(2)
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('Retry-After', response)
+        upstream.assert_not_called()
+        self.assertFalse(StudentCourse.objects.filter(student_id=2).exists())
+
+    @override_settings(UPSTREAM_MAX_CONCURRENCY=0)
+    def test_dashboard_served_without_student_when_busy(self):
+        with fake_student_service() as upstream:
+            response = self.client.get('/api/student/1/dashboard/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()["student"])
+        self.assertEqual(response.json()["student_error"], 'Student service busy')
+        self.assertEqual(len(response.json()["courses"]), 1)
+        upstream.assert_not_called()
+
+
+# =============================================================================
+# PRÉCHAUFFAGE DES WORKERS (course/warmup.py)
+# =============================================================================
+class WarmUpTests(CacheClearingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(warmup, 'last_report', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Le Student Service n'est pas joint (étape http)
+        head = mock.patch.object(student_service.session, 'head', return_value=mock.Mock(status_code=200))
+        head.start()
+        self.addCleanup(head.stop)
+
+        self.python = create_course(name="Python")
+        self.algebra = create_course(name="Algèbre")
+        self.history = create_course(name="Histoire")
+        StudentCourse.objects.bulk_create([
+            StudentCourse(student_id=1, course=self.python),
+            StudentCourse(student_id=2, course=self.python),
+            StudentCourse(student_id=1, course=self.algebra),
+        ])
+        with fake_student_service():
+            rosters.rebuild_roster(self.python.pk)
+            rosters.rebuild_roster(self.algebra.pk)
+        cache.clear()
+
+    @override_settings(CATALOG_SHARED_CACHE=True)
+    def test_fills_caches(self):
+        report = warmup.warm_up()
+        self.assertTrue(report["completed"])
+        self.assertEqual(report["steps"]["catalog"]["courses"], 3)
+        self.assertEqual(report["steps"]["rosters"]["rosters"], 2)
+        self.assertEqual(report["steps"]["http"]["status"], 200)
+        with self.assertNumQueries(0):
+            catalog.courses_by_id([self.python.pk, self.algebra.pk, self.history.pk])
+            rosters.get_roster(self.python)
+            rosters.get_roster(self.algebra)
+
+    @override_settings(WARMUP_ROSTER_LIMIT=1)
+    def test_roster_limit_keeps_most_followed(self):
+        warmup.warm_up()
+        self.assertIsNotNone(cache.get(rosters._cache_key(self.python.pk)))
+        self.assertIsNone(cache.get(rosters._cache_key(self.algebra.pk)))
+
+    @override_settings(WARMUP_TIME_BUDGET=0)
+    def test_budget_exhausted(self):
+        report = warmup.warm_up()
+        self.assertFalse(report["completed"])
+        self.assertEqual(report["skipped"], ['database', 'http', 'catalog', 'rosters'])
+        self.assertIsNone(cache.get(rosters._cache_key(self.python.pk)))
+
+    @override_settings(CATALOG_SHARED_CACHE=True)
+    def test_failing_step_does_not_stop_others(self):
+        with mock.patch.object(rosters, 'preload', side_effect=RuntimeError("boom")), \
+                self.assertLogs('course.warmup', 'ERROR'):
+            report = warmup.warm_up()
+        self.assertEqual(report["steps"]["rosters"]["error"], "boom")
+        self.assertEqual(report["steps"]["catalog"]["courses"], 3)
+        self.assertEqual(report["skipped"], [])
+
+    def test_report_endpoint(self):
+        self.assertEqual(self.client.get('/api/warmup/').status_code, 401)
+        headers = admin_headers()
+        self.assertIsNone(self.client.get('/api/warmup/', **headers).json()["report"])
+        warmup.warm_up()
+        data = self.client.get('/api/warmup/', **headers).json()
+        self.assertTrue(data["enabled"])
+        self.assertEqual(set(data["report"]["steps"]), {'database', 'http', 'catalog', 'rosters'})
@@ -0,0 +1,175 @@
+# =============================================================================
+# LIMITATION DE DÉBIT ET CONTRÔLE D'ADMISSION (course/throttling.py)
+# =============================================================================
+# Les endpoints qui appellent le Student Service (listes d'inscrits,
+# inscription, tableau de bord) occupent un thread de worker pendant tout
+# l'appel réseau. Un seul client trop insistant peut ainsi bloquer tous les
+# workers et affamer les endpoints rapides. Deux protections :
+#
+#   - TokenBucketThrottle : seau à jetons par client et par endpoint (throttle
+#     DRF) → 429 Too Many Requests + Retry-After quand le seau est vide
+#   - upstream_limiter : nombre maximal d'appels au Student Service en cours
+#     par processus → 503 Service Unavailable + Retry-After immédiat au-delà,
+#     au lieu de laisser les requêtes s'accumuler dans les threads. Il entoure
+#     seulement le travail réseau (construction d'une liste d'inscrits,
+#     vérification de l'étudiant...) : une lecture servie par le cache ou
+#     l'instantané n'est jamais refusée.
+#
+# Débits : REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] (settings.py), par scope.
+
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.throttling import SimpleRateThrottle
+
+# Alias du cache local des seaux (voir CACHES dans settings.py)
+THROTTLE_CACHE_ALIAS = 'throttle'
+
+
+def _throttle_cache():
+    return caches[THROTTLE_CACHE_ALIAS if THROTTLE_CACHE_ALIAS in settings.CACHES else 'default']
+
+
+# =============================================================================
+# SEAU À JETONS PAR CLIENT ET PAR ENDPOINT
+# =============================================================================
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Throttle DRF à seau à jetons
+
+    Un débit "60/min" donne un seau de 60 jetons rechargé de 1 jeton par
+    seconde : un client peut envoyer une rafale de 60 requêtes, puis une par
+    seconde. Chaque client (utilisateur authentifié, sinon adresse IP) a un
+    seau par scope : un client limité sur un endpoint garde l'accès aux autres.
+
+    Les sous-classes définissent scope (clé de DEFAULT_THROTTLE_RATES).
+    """
+
+    cache_format = 'throttle:%(scope)s:%(ident)s'
+
+    # Lecture-modification-écriture du seau protégée entre les threads du processus
+    _lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__()
+        self.cache = _throttle_cache()
+        self._wait = 0.0
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = f'user-{request.user.pk}'
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        capacity = self.num_requests
+        refill_per_second = self.num_requests / self.duration
+        now = self.timer()
+
+        with self._lock:
+            tokens, updated = self.cache.get(self.key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            # Le seau plein est retrouvé après `duration` secondes sans requête
+            self.cache.set(self.key, (tokens, now), self.duration)
+
+        # Temps avant le prochain jeton (en-tête Retry-After)
+        self._wait = 0.0 if allowed else (1 - tokens) / refill_per_second
+        return allowed
+
+    def wait(self):
+        return self._wait
+
+
+class RosterThrottle(TokenBucketThrottle):
+    """GET /api/course/<id>/students/"""
+    scope = 'roster'
+
+
+class EnrollThrottle(TokenBucketThrottle):
+    """POST /api/enroll/"""
+    scope = 'enroll'
+
+
+class DashboardThrottle(TokenBucketThrottle):
+    """GET /api/student/<id>/dashboard/"""
+    scope = 'dashboard'
+
+
+# =============================================================================
+# LIMITE D'APPELS SIMULTANÉS AU STUDENT SERVICE (PAR PROCESSUS)
+# =============================================================================
+class UpstreamBusy(APIException):
+    """
+    503 + Retry-After (UPSTREAM_RETRY_AFTER secondes)
+
+    Levée dans une vue (ou le code qu'elle appelle), elle est convertie en
+    réponse par le gestionnaire d'exceptions de DRF, qui ajoute Retry-After
+    à partir de l'attribut wait.
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    def __init__(self):
+        super().__init__({"error": "⏳ Service surchargé, réessayer dans quelques instants."})
+        self.wait = getattr(settings, 'UPSTREAM_RETRY_AFTER', 1)
+
+
+class ConcurrencyLimiter:
+    """
+    Sémaphore non bloquant : au-delà de UPSTREAM_MAX_CONCURRENCY appels en
+    cours dans le processus, les suivants sont refusés immédiatement.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def limit(self):
+        return getattr(settings, 'UPSTREAM_MAX_CONCURRENCY', 2)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def acquire(self):
+        with self._lock:
+            if self._in_flight >= self.limit:
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    @contextmanager
+    def slot(self):
+        """
+        with upstream_limiter.slot(): ...  (appels au Student Service)
+
+        Lève UpstreamBusy (503) si la limite est atteinte : des threads
+        restent libres pour les endpoints rapides.
+        """
+        if not self.acquire():
+            raise UpstreamBusy()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+upstream_limiter = ConcurrencyLimiter()
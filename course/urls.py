@@ -2,6 +2,14 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from . import views
 
+# --- ROUTER (ViewSets : CRUD, filtrage et pagination par curseur) ---
+#   /api/catalog/                         → CourseViewSet (?category=, ?instructor=)
+#   /api/studentcourses/                  → StudentCourseViewSet (?student_id=, ?course=)
+#   /api/studentcourses/by_student/?student_id=1
+router = DefaultRouter()
+router.register('catalog', views.CourseViewSet, basename='catalog')
+router.register('studentcourses', views.StudentCourseViewSet, basename='studentcourse')
+
 # --- URLS MANUELLES (fonctions spécifiques) ---
 urlpatterns = [
  
@@ -9,12 +17,33 @@ urlpatterns = [
     path('courses/add/', views.add_course, name='add_course'),
     path('courses/update/<int:pk>/', views.update_course, name='update_course'),
     path('courses/delete/<int:pk>/', views.delete_course, name='delete_course'),
+    path('courses/import/', views.import_courses, name='import_courses'),
+    path('courses/bulk-delete/', views.bulk_delete_courses, name='bulk_delete_courses'),
     path('courses/<int:pk>/', views.get_course_by_id, name='get_course_by_id'),
     path('courses/', views.get_all_courses, name='get_all_courses'),
     path('courses/search/', views.search_courses, name='search_courses'),
+    path('courses/facets/', views.get_course_facets, name='get_course_facets'),
+    path('courses/batch/', views.get_courses_batch, name='get_courses_batch'),
     path('course/<int:course_id>/students/', views.get_students_by_course, name='get_students_by_course'),
 
 # 🔽 Nouvelles routes pour les inscriptions
     path('enroll/', views.enroll_student, name='enroll_student'),
     path('student/<int:student_id>/courses/', views.get_courses_by_student, name='get_courses_by_student'),
-]
\ No newline at end of file
+    path('student/<int:student_id>/dashboard/', views.get_student_dashboard, name='get_student_dashboard'),
+
+    # Emploi du temps : conflits d'horaires et cours compatibles
+    path('student/<int:student_id>/conflicts/', views.get_student_conflicts, name='get_student_conflicts'),
+    path('student/<int:student_id>/available-courses/', views.get_available_courses, name='get_available_courses'),
+
+    # Flux de changements : GET /api/changes/?since=<curseur>
+    path('changes/', views.get_changes, name='get_changes'),
+
+    # Profilage échantillonné (administrateurs) : GET /api/profiling/?output=collapsed
+    path('profiling/', views.get_profiling, name='get_profiling'),
+
+    # Rapport du préchauffage du worker (administrateurs) : GET /api/warmup/
+    path('warmup/', views.get_warmup, name='get_warmup'),
+
+    # Routes générées par le router (placées après les routes manuelles)
+    path('', include(router.urls)),
+]
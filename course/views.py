@@ -5,29 +5,116 @@
 # Il définit comment l'API répond aux différentes requêtes (GET, POST, PUT, DELETE)
 
 #
-from django_filters.rest_framework import DjangoFilterBackend  # Pour le filtrage exact des données
-import requests
-from django.db.models import Q
+import io
+
+from django.conf import settings
+from django.http import HttpResponse
 from rest_framework import viewsets, filters  # Viewsets pour les opérations CRUD automatiques
 from rest_framework.decorators import action  # Pour créer des routes personnalisées dans les viewsets
 from rest_framework.response import Response  # Pour envoyer des réponses HTTP au format JSON
 from rest_framework.decorators import api_view  # Décorateur pour les vues basées sur des fonctions
+from rest_framework.decorators import parser_classes, permission_classes, throttle_classes
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAdminUser
 from rest_framework import status  # Constantes pour les codes de statut HTTP (200, 404, 201, etc.)
 
 from .models import Course, StudentCourse  # Importation des modèles (tables de la base de données)
 from .serializers import CourseSerializer, StudentCourseSerializer  # Sérialiseurs pour convertir les objets en JSON
+from .filters import CourseFilter, StudentCourseFilter  # Filtres des ViewSets (champs indexés)
 from .services import student_service  # Service pour communiquer avec le microservice Student Service  
+from . import rosters  # Instantanés des listes d'inscrits par cours
+from . import changefeed  # Journal des modifications (flux de changements)
+from . import bulk  # Import / export en masse
+from . import schedule  # Créneaux horaires structurés (conflits d'emploi du temps)
+from . import deletion  # Suppression par paquets des cours et de leurs inscriptions
+from . import profiling  # Profilage par échantillonnage (ProfilingMiddleware)
+from . import catalog  # Recherche, facettes et cache versionné du catalogue
+from . import dashboard  # Tableau de bord étudiant (endpoint composite)
+from . import warmup  # Préchauffage des workers au démarrage
+from .throttling import DashboardThrottle, EnrollThrottle, RosterThrottle, upstream_limiter
 
 # Ces fonctions gèrent les opérations CRUD (Create, Read, Update, Delete) pour les cours
 # Chaque fonction correspond à une route HTTP spécifique
-class CourseViewSet(viewsets.ModelViewSet):
+class SparseFieldsMixin:
+    """
+    Paramètre ?fields= pour les ViewSets (lectures uniquement)
+
+    Restreint à la fois le JSON renvoyé (sérialiseur) et les colonnes lues
+    en base (.only()), ex: GET /api/catalog/?fields=id,name
+    """
+
+    def requested_fields(self):
+        if self.request.method not in ('GET', 'HEAD'):
+            return None
+        if not hasattr(self, '_requested_fields'):
+            serializer_class = self.get_serializer_class()
+            self._requested_fields = serializer_class.requested_fields(self.request)
+        return self._requested_fields
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.requested_fields()
+        if fields:
+            lookups = list(self.get_serializer_class().columns(fields).values())
+            if not any('__' in lookup for lookup in lookups):
+                # Aucune colonne d'une table liée demandée : pas de JOIN
+                queryset = queryset.select_related(None)
+            queryset = queryset.only(*lookups)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.requested_fields()
+        if fields:
+            kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
+
+
+class CourseViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    """
+    API CRUD des cours avec filtrage et pagination par curseur (DEFAULT_PAGINATION_CLASS)
+
+    URL: /api/catalog/  (filtres : ?category=, ?instructor= ; champs : ?fields=id,name)
+    """
     queryset = Course.objects.all()
     serializer_class = CourseSerializer
+    filterset_class = CourseFilter
+
+    def perform_destroy(self, instance):
+        # Inscriptions supprimées par paquets, comme DELETE /api/courses/delete/{id}/
+        deletion.delete_course(instance)
 
 
-class StudentCourseViewSet(viewsets.ModelViewSet):
-    queryset = StudentCourse.objects.all()
+class StudentCourseViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    """
+    API CRUD des inscriptions avec filtrage et pagination par curseur
+
+    URL: /api/studentcourses/  (filtres : ?student_id=, ?course= ; champs : ?fields=)
+    """
+    # select_related : le nom du cours (course_name) est lu dans la même requête (JOIN)
+    # only() : seules les colonnes utilisées par StudentCourseSerializer sont lues
+    queryset = StudentCourse.objects.select_related('course').only(
+        'id', 'student_id', 'course__id', 'course__name'
+    )
     serializer_class = StudentCourseSerializer
+    filterset_class = StudentCourseFilter
+
+    @action(detail=False, methods=['get'])
+    def by_student(self, request):
+        """
+        Inscriptions d'un étudiant
+
+        URL: GET /api/studentcourses/by_student/?student_id=123
+        """
+        student_id = request.query_params.get('student_id')
+        if not student_id or not student_id.isdigit():
+            return Response(
+                {"error": "Le paramètre 'student_id' (entier) est requis."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        queryset = self.get_queryset().filter(student_id=student_id)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 # CRÉER UN COURS (POST)
 @api_view(['POST'])  # Décorateur qui spécifie que cette fonction accepte seulement les requêtes POST
 def add_course(request):
@@ -66,7 +153,16 @@ def get_all_courses(request):
     Fonction pour récupérer tous les cours
     
     URL: GET /api/courses/
+    Champs à la demande : GET /api/courses/?fields=id,name
+    Plusieurs cours par ID : GET /api/courses/?ids=1,5,9 (voir get_courses_batch)
     """
+    # ?fields= : ne lire que les colonnes demandées, sans passer par le sérialiseur
+    fields = CourseSerializer.requested_fields(request)
+    if 'ids' in request.GET:
+        return _courses_batch_response(request.GET['ids'], fields)
+    if fields:
+        return Response(list(CourseSerializer.values(Course.objects.all(), fields)))
+
     # Récupérer tous les cours depuis la base de données
     courses = Course.objects.all()
     
@@ -84,22 +180,93 @@ def get_course_by_id(request, pk):  # pk = primary key (identifiant unique du co
     Fonction pour récupérer un cours spécifique par son ID
     
     URL: GET /api/courses/{id}/
+    Champs à la demande : GET /api/courses/{id}/?fields=id,name
     """
-    try:
-        # Rechercher le cours par son ID dans la base de données
-        course = Course.objects.get(pk=pk)
-    except Course.DoesNotExist: 
+    fields = CourseSerializer.requested_fields(request)
+
+    # Rechercher le cours (cache du catalogue s'il est partagé, sinon base)
+    data = catalog.courses_by_id([pk]).get(pk) if _valid_id(pk) else None
+    if data is None:
         # Si le cours n'existe pas, retourner une erreur 404 (Not Found)
         return Response(
             {"error": "❌ Course not found"}, 
             status=status.HTTP_404_NOT_FOUND
         )
-    
-    # Convertir l'objet Course en format JSON
-    serializer = CourseSerializer(course)
-    
-    # Retourner les données du cours
-    return Response(serializer.data)
+
+    # Retourner les données du cours (seulement les champs demandés avec ?fields=)
+    if fields:
+        data = {name: data[name] for name in fields}
+    return Response(data)
+
+
+# RÉCUPÉRER PLUSIEURS COURS PAR LEURS IDS (GET / POST)
+# Plus grand ID stocké par la base (entier signé 64 bits)
+MAX_ID = 2 ** 63 - 1
+
+
+def _valid_id(value):
+    # Au-delà, la requête lève OverflowError (SQLite) au lieu de ne rien trouver
+    return -MAX_ID - 1 <= value <= MAX_ID
+
+
+def _parse_ids(value):
+    """IDs d'une liste JSON ou d'une chaîne "1,5,9" (ordre conservé, sans doublons), ou None"""
+    if isinstance(value, str):
+        value = [item.strip() for item in value.split(',') if item.strip()]
+    if not isinstance(value, list):
+        return None
+    ids = []
+    for item in value:
+        if isinstance(item, bool):
+            return None
+        if isinstance(item, str) and item.isdigit():
+            item = int(item)
+        if not isinstance(item, int) or not _valid_id(item):
+            return None
+        if item not in ids:
+            ids.append(item)
+    return ids
+
+
+def _courses_batch_response(raw_ids, fields=None):
+    max_ids = getattr(settings, 'COURSE_BATCH_MAX_IDS', 100)
+    ids = _parse_ids(raw_ids)
+    if not ids:
+        return Response(
+            {"error": "Le paramètre 'ids' doit être une liste d'entiers (ex: ids=1,5,9)."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(ids) > max_ids:
+        return Response(
+            {"error": f"Au plus {max_ids} IDs par requête."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # Cache du catalogue (s'il est partagé), puis une seule requête "id IN (...)" pour le reste
+    courses = catalog.courses_by_id(ids)
+    results = [courses[pk] for pk in ids if pk in courses]
+    if fields:
+        results = [{name: data[name] for name in fields} for data in results]
+    return Response({
+        "results": results,
+        "missing": [pk for pk in ids if pk not in courses],
+    })
+
+
+@api_view(['POST'])
+def get_courses_batch(request):
+    """
+    Lecture groupée : plusieurs cours en une requête (emploi du temps, panier...)
+
+    URL: POST /api/courses/batch/   Body JSON: {"ids": [1, 5, 9]}
+    (équivalent : GET /api/courses/?ids=1,5,9)
+    Champs à la demande : POST /api/courses/batch/?fields=id,name
+    Réponse : {"results": [...dans l'ordre demandé...], "missing": [9]}
+    Au plus COURSE_BATCH_MAX_IDS IDs par requête.
+    """
+    fields = CourseSerializer.requested_fields(request)
+    ids = request.data.get('ids') if hasattr(request.data, 'get') else None
+    return _courses_batch_response(ids, fields)
 
 
 # MODIFIER UN COURS (PUT)
@@ -156,11 +323,119 @@ def delete_course(request, pk):
             status=status.HTTP_404_NOT_FOUND
         )
     
-    # Supprimer le cours de la base de données
-    course.delete()
+    # Supprimer le cours et ses inscriptions par paquets (transactions courtes)
+    deletion.delete_course(course)
     
     # Retourner un message de confirmation
     return Response({"message": "🗑️ Course deleted successfully"})
+
+
+# SUPPRIMER DES COURS EN MASSE (POST)
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def bulk_delete_courses(request):
+    """
+    Suppression de tous les cours correspondant à un filtre, réservée aux administrateurs
+
+    URL: POST /api/courses/bulk-delete/
+    Body JSON: {"category": "Archives"}, {"instructor": "Dr. Sara"}, {"ids": [3, 8, 12]}
+               (combinables), et "dry_run": true pour seulement compter
+    Réponse : {"courses", "enrollments", "batches", "seconds", "longest_batch_ms"}
+    """
+    data = request.data
+    if not hasattr(data, 'get'):
+        return Response(
+            {"error": "Le corps doit être un objet JSON (ex: {\"category\": \"Archives\"})."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    ids = data.get('ids')
+    lookups = {name: data[name] for name in ('category', 'instructor') if data.get(name)}
+
+    # Refuser un filtre vide : il supprimerait tout le catalogue
+    if not (lookups or ids):
+        return Response(
+            {"error": "Fournir au moins un filtre : category, instructor ou ids."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if ids is not None and not (
+        isinstance(ids, list) and all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids)
+    ):
+        return Response(
+            {"error": "Le champ 'ids' doit être une liste d'entiers."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # Une valeur invalide serait ignorée par .qs (et le filtre porterait sur
+    # tout le catalogue) : on la refuse
+    filterset = CourseFilter(lookups, queryset=Course.objects.all())
+    if not filterset.is_valid():
+        return Response({"error": filterset.errors}, status=status.HTTP_400_BAD_REQUEST)
+    courses = filterset.qs
+    if ids is not None:
+        courses = courses.filter(pk__in=ids)
+
+    # Seules les valeurs explicites activent le mode simulation ("false" ne le fait pas)
+    if data.get('dry_run') in (True, 'true', '1'):
+        return Response({
+            "dry_run": True,
+            "courses": courses.count(),
+            "enrollments": StudentCourse.objects.filter(course_id__in=courses.values('pk')).count(),
+        })
+
+    return Response(deletion.delete_courses(courses.values_list('pk', flat=True)))
+
+
+# IMPORTER DES COURS EN MASSE (POST)
+# Types de contenu acceptés pour un corps brut
+IMPORT_CONTENT_TYPES = {
+    'text/csv': 'csv',
+    'application/x-ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+}
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+@parser_classes([MultiPartParser])
+def import_courses(request):
+    """
+    Import en masse (CSV ou NDJSON), réservé aux administrateurs
+
+    URL: POST /api/courses/import/
+      - corps brut : Content-Type text/csv ou application/x-ndjson
+      - ou formulaire multipart avec un champ "file" (.csv, .ndjson, .jsonl)
+    Le fichier est lu en flux et écrit par paquets (voir course/bulk.py).
+    Réponse : {"processed", "created", "updated", "invalid", "errors", "seconds", "rate"}
+    """
+    fmt = IMPORT_CONTENT_TYPES.get(request.content_type.split(';')[0].strip())
+    if fmt is not None:
+        # Corps lu ligne à ligne depuis la requête, sans être chargé en mémoire.
+        # Découpage sur b"\n" uniquement, puis décodage de chaque ligne : les
+        # lecteurs de codecs découpent aussi sur U+2028, U+0085... qu'un nom de
+        # cours peut contenir (l'export NDJSON les écrit tels quels)
+        lines = (line.decode('utf-8') for line in request._request)
+    else:
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {"error": "Envoyer un corps text/csv ou application/x-ndjson, ou un fichier 'file'."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        fmt = bulk.guess_format(upload.name)
+        if fmt is None:
+            return Response(
+                {"error": "Format inconnu : fichier .csv, .ndjson ou .jsonl attendu."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        lines = io.TextIOWrapper(upload.file, encoding='utf-8', newline='')
+
+    try:
+        report = bulk.import_courses(bulk.read_records(lines, fmt))
+    except UnicodeDecodeError:
+        return Response(
+            {"error": "Le fichier doit être encodé en UTF-8."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response(report)
 # en haut du fichier (ajoute cet import si pas déjà présent)
 
 
@@ -174,42 +449,60 @@ def search_courses(request):
       - /api/courses/search/?instructor=Sara
       - http://127.0.0.1:8000/api/courses/search/?category=Programmation
       - Combinaisons possibles
+      - Champs à la demande : /api/courses/search/?q=Python&fields=id,name
+      - Avec facettes : /api/courses/search/?q=Python&facets=1
+        → {"results": [...], "facets": {"total", "category", "instructor"}}
     """
-    q = request.GET.get('q', '').strip()
-    name = request.GET.get('name', '').strip()
-    instructor = request.GET.get('instructor', '').strip()
-    category = request.GET.get('category', '').strip()
+    params = catalog.search_params(request.GET)
 
     # Si aucun paramètre donné, renvoyer erreur (plutôt que tout)
-    if not (q or name or instructor or category):
+    if not params:
         return Response(
             {"detail": "Fournir au moins un paramètre de recherche: q, name, instructor ou category."},
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    # Construire la requête dynamiquement avec Q()
-    filters = Q()  # <-- utiliser Q(), pas q()
-    if q:
-        filters &= (Q(name__icontains=q) | Q(instructor__icontains=q) | Q(category__icontains=q))
-    if name:
-        filters &= Q(name__icontains=name)
-    if instructor:
-        filters &= Q(instructor__icontains=instructor)
-    if category:
-        filters &= Q(category__icontains=category)
+    # Construire la requête dynamiquement avec Q() (voir catalog.search_filter)
+    filters = catalog.search_filter(params)
 
     results = Course.objects.filter(filters).distinct()
 
-    if not results.exists():
+    # Une seule requête : les résultats sont lus puis testés (pas de .exists() séparé)
+    fields = CourseSerializer.requested_fields(request)
+    if fields:
+        data = list(CourseSerializer.values(results, fields))
+    else:
+        data = CourseSerializer(results, many=True).data
+
+    if not data:
         return Response({"message": "Aucun cours trouvé."}, status=status.HTTP_404_NOT_FOUND)
 
-    serializer = CourseSerializer(results, many=True)
-    return Response(serializer.data)
+    # ?facets=1 : résultats + comptes par catégorie / instructeur (en cache)
+    if request.GET.get('facets') in ('1', 'true'):
+        return Response({"results": data, "facets": catalog.facets(params)})
+
+    return Response(data)
+
+
+@api_view(['GET'])
+def get_course_facets(request):
+    """
+    Nombre de cours par catégorie et par instructeur, pour tout le catalogue
+    ou pour une recherche (mêmes paramètres que /api/courses/search/).
+    Exemples :
+      - GET /api/courses/facets/
+      - GET /api/courses/facets/?q=Python
+    Réponse : {"total": 42, "category": [{"value": "Programmation", "count": 30}, ...],
+               "instructor": [{"value": "Dr. Sara", "count": 12}, ...]}
+    Une requête GROUP BY, puis le cache jusqu'à la prochaine modification du catalogue.
+    """
+    return Response(catalog.facets(catalog.search_params(request.GET)))
 # ===============================================================
 # INSCRIPTION D'UN ÉTUDIANT À UN COURS
 # ===============================================================
 
 @api_view(['POST'])
+@throttle_classes([EnrollThrottle])  # Débit par client (429 + Retry-After)
 def enroll_student(request):
     """
     Inscrire un étudiant à un cours.
@@ -240,16 +533,18 @@ def enroll_student(request):
         )
 
     # 3️⃣ Vérifier si l'étudiant existe dans le Student Service
-    try:
-        student_response = requests.get(f"https://student-service-r9fd.onrender.com/api/students/{student_id}")
-        if student_response.status_code != 200:
+    # (session partagée avec délai STUDENT_SERVICE_TIMEOUT ; appels simultanés
+    # limités par processus : 503 + Retry-After au-delà)
+    with upstream_limiter.slot():
+        result = student_service.get_student_by_id(student_id)
+    if not result['success']:
+        if result['error'] == 'Student not found':
             return Response(
                 {"error": "Étudiant introuvable dans le service Student."},
                 status=status.HTTP_404_NOT_FOUND
             )
-    except requests.exceptions.RequestException as e:
         return Response(
-            {"error": f"Erreur de connexion au Student Service : {str(e)}"},
+            {"error": f"Erreur de connexion au Student Service : {result['error']}"},
             status=status.HTTP_503_SERVICE_UNAVAILABLE
         )
 
@@ -261,8 +556,11 @@ def enroll_student(request):
             status=status.HTTP_200_OK
         )
 
-    # 5️⃣ Créer l'inscription
-    StudentCourse.objects.create(student_id=student_id, course=course)
+    # 5️⃣ Créer l'inscription (la fiche déjà lue est reprise par l'instantané
+    # du cours, sans second appel au Student Service)
+    enrollment = StudentCourse(student_id=student_id, course=course)
+    enrollment._roster_entry = rosters.format_student(student_id, result)
+    enrollment.save()
     return Response(
         {"message": "✅ Étudiant inscrit avec succès."},
         status=status.HTTP_201_CREATED
@@ -275,10 +573,14 @@ def enroll_student(request):
 # ===============================================================
 
 @api_view(['GET'])
+@throttle_classes([RosterThrottle])  # Débit par client (429 + Retry-After)
 def get_students_by_course(request, course_id):
     """
     Récupérer tous les étudiants inscrits à un cours.
     Exemple : GET /api/course/1/students/
+
+    La liste est servie depuis un instantané (CourseRosterSnapshot) mis à jour
+    à chaque inscription/désinscription ; "refreshed_at" indique sa fraîcheur.
     """
     try:
         # Vérifier si le cours existe
@@ -289,76 +591,212 @@ def get_students_by_course(request, course_id):
             status=status.HTTP_404_NOT_FOUND
         )
 
-    # Récupérer toutes les inscriptions pour ce cours
-    enrollments = StudentCourse.objects.filter(course=course)
-    
-    if not enrollments.exists():
+    # Lire l'instantané précalculé de la liste des inscrits
+    # (cache → base ; le Student Service n'est appelé que s'il n'existe pas encore)
+    roster = rosters.get_roster(course)
+    students_data = roster["students"]
+
+    if not students_data:
         return Response({
             "course_id": course_id,
             "course_name": course.name,
             "message": "Aucun étudiant inscrit à ce cours",
-            "students": []
+            "students": [],
+            "refreshed_at": roster["refreshed_at"]
         })
-    
-    students_data = []
-    
-    # Pour chaque inscription, récupérer les détails de l'étudiant
-    for enrollment in enrollments:
-        student_id_value = enrollment.student_id
-        
-        try:
-            # Appeler le Student Service
-            student_response = requests.get(
-                f"https://student-service-r9fd.onrender.com/api/students/{student_id_value}",
-                timeout=5  # Timeout de 5 secondes
-            )
-            
-            if student_response.status_code == 200:
-                student_data = student_response.json()
-                students_data.append({
-                    "id": student_data.get("id"),
-                    "first_name": student_data.get("first_name") or student_data.get("firstName", f"Étudiant {student_id_value}"),
-                    "last_name": student_data.get("last_name") or student_data.get("lastName", ""),
-                    "email": student_data.get("email", f"student{student_id_value}@example.com"),
-                })
-            else:
-                # Si l'étudiant n'est pas trouvé
-                students_data.append({
-                    "id": student_id_value,
-                    "first_name": "Étudiant",
-                    "last_name": f"#{student_id_value}",
-                    "email": "Non disponible"
-                })
-                
-        except requests.exceptions.Timeout:
-            students_data.append({
-                "id": student_id_value,
-                "first_name": "Étudiant",
-                "last_name": f"#{student_id_value}",
-                "email": "Timeout - Service Student lent"
-            })
-        except requests.exceptions.RequestException as e:
-            students_data.append({
-                "id": student_id_value,
-                "first_name": "Étudiant",
-                "last_name": f"#{student_id_value}",
-                "email": f"Erreur: {str(e)[:50]}"
-            })
 
     return Response({
         "course_id": course_id,
         "course_name": course.name,
         "students_count": len(students_data),
-        "students": students_data
+        "students": students_data,
+        "refreshed_at": roster["refreshed_at"]
     })
 @api_view(['GET'])
 def get_courses_by_student(request, student_id):
     """
     Récupérer tous les cours d’un étudiant.
     Exemple : GET /api/student/1/courses/
+    Champs à la demande : GET /api/student/1/courses/?fields=id,name
     """
-    enrollments = StudentCourse.objects.filter(student_id=student_id)
-    courses = [en.course for en in enrollments]
+    # Une seule requête (JOIN sur les inscriptions) au lieu d'une par cours
+    courses = Course.objects.filter(studentcourse__student_id=student_id).order_by('studentcourse__id')
+
+    fields = CourseSerializer.requested_fields(request)
+    if fields:
+        return Response(list(CourseSerializer.values(courses, fields)))
+
     serializer = CourseSerializer(courses, many=True)
     return Response(serializer.data)
-   
\ No newline at end of file
+   
+
+
+# ===============================================================
+# TABLEAU DE BORD ÉTUDIANT (endpoint composite)
+# ===============================================================
+
+@api_view(['GET'])
+@throttle_classes([DashboardThrottle])  # Débit par client (429 + Retry-After)
+def get_student_dashboard(request, student_id):
+    """
+    Tout le tableau de bord d'un étudiant en une seule requête :
+    fiche (Student Service), cours avec leur effectif, conflits d'horaires.
+    Exemple : GET /api/student/1/dashboard/
+    Réponse : {"student_id": 1, "student": {...}, "student_error": null,
+               "courses": [{"id", "name", "instructor", "category", "schedule",
+                            "enrollment_id", "headcount"}, ...],
+               "conflicts": [...]}
+    Si le Student Service ne répond pas, "student" vaut null et
+    "student_error" donne la raison : le reste est servi normalement.
+    """
+    return Response(dashboard.build_dashboard(student_id))
+
+
+# ===============================================================
+# EMPLOI DU TEMPS (conflits et cours compatibles)
+# ===============================================================
+
+@api_view(['GET'])
+def get_student_conflicts(request, student_id):
+    """
+    Chevauchements d'horaires entre les cours d'un étudiant.
+    Exemples :
+      - GET /api/student/1/conflicts/
+      - GET /api/student/1/conflicts/?course=7   (conflits si l'étudiant s'inscrit au cours 7)
+    Réponse : {"student_id": 1, "conflicts": [{"weekday", "day", "start", "end", "courses": [...]}]}
+    """
+    course = None
+    course_id = request.GET.get('course')
+    if course_id is not None:
+        if not course_id.isdigit():
+            return Response(
+                {"error": "Le paramètre 'course' doit être un entier."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            course = Course.objects.only('id', 'name').get(pk=course_id)
+        except Course.DoesNotExist:
+            return Response({"error": "❌ Course not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    return Response({
+        "student_id": student_id,
+        "conflicts": schedule.student_conflicts(student_id, course),
+    })
+
+
+@api_view(['GET'])
+def get_available_courses(request, student_id):
+    """
+    Cours compatibles avec l'emploi du temps d'un étudiant (aucun chevauchement
+    avec ses cours, pas déjà inscrit).
+    Exemples :
+      - GET /api/student/1/available-courses/
+      - GET /api/student/1/available-courses/?within=Lundi 8h-12h; Mardi 14h-18h
+        (uniquement les cours qui tiennent dans ces plages libres)
+      - GET /api/student/1/available-courses/?category=Programmation&fields=id,name,schedule
+    """
+    windows = None
+    within = request.GET.get('within', '').strip()
+    if within:
+        windows = schedule.parse_schedule(within)
+        if not windows:
+            return Response(
+                {"error": "Plages 'within' non reconnues (ex: Lundi 8h-12h; Mardi 14h-18h)."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    courses = schedule.available_courses(student_id, windows)
+    category = request.GET.get('category', '').strip()
+    if category:
+        courses = courses.filter(category=category)
+
+    fields = CourseSerializer.requested_fields(request)
+    if fields:
+        return Response(list(CourseSerializer.values(courses, fields)))
+
+    serializer = CourseSerializer(courses, many=True)
+    return Response(serializer.data)
+
+
+# ===============================================================
+# FLUX DE CHANGEMENTS (synchronisation incrémentale)
+# ===============================================================
+
+@api_view(['GET'])
+def get_changes(request):
+    """
+    Changements (créations, modifications, suppressions) de cours et
+    d'inscriptions depuis un curseur.
+    Exemples :
+      - GET /api/changes/                        (depuis le début)
+      - GET /api/changes/?since=1520&limit=500
+      - GET /api/changes/?since=1520&model=course
+    Réponse : {"changes": [...], "next_cursor": 1620, "has_more": true}
+    Le client rappelle avec since=next_cursor tant que has_more est vrai,
+    puis conserve next_cursor pour sa prochaine synchronisation.
+    """
+    since = request.GET.get('since', '0')
+    limit = request.GET.get('limit', str(changefeed.DEFAULT_LIMIT))
+    model = request.GET.get('model') or None
+
+    if not since.isdigit() or not limit.isdigit() or int(limit) < 1:
+        return Response(
+            {"error": "Les paramètres 'since' et 'limit' doivent être des entiers positifs."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if model not in (None, 'course', 'studentcourse'):
+        return Response(
+            {"error": "Le paramètre 'model' doit valoir 'course' ou 'studentcourse'."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    limit = min(int(limit), changefeed.MAX_LIMIT)
+    return Response(changefeed.changes_since(int(since), limit, model))
+
+
+# ===============================================================
+# PROFILAGE (administrateurs)
+# ===============================================================
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def get_profiling(request):
+    """
+    Piles relevées par ProfilingMiddleware dans ce processus (worker).
+    Exemples :
+      - GET /api/profiling/                           (résumé par endpoint : fonctions les plus chaudes)
+      - GET /api/profiling/?output=collapsed          (piles "collapsed" pour flamegraph.pl / speedscope)
+      - GET /api/profiling/?output=collapsed&endpoint=GET%20api/courses/
+      - DELETE /api/profiling/                        (remise à zéro)
+    """
+    if request.method == 'DELETE':
+        profiling.store.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    if request.GET.get('output') == 'collapsed':
+        return HttpResponse(
+            profiling.store.collapsed(request.GET.get('endpoint') or None),
+            content_type='text/plain; charset=utf-8'
+        )
+
+    return Response({
+        "enabled": getattr(settings, 'PROFILING_ENABLED', False),
+        "sample_rate": getattr(settings, 'PROFILING_SAMPLE_RATE', 0.01),
+        "endpoints": profiling.store.summary(),
+    })
+
+
+# ===============================================================
+# PRÉCHAUFFAGE DU WORKER (administrateurs)
+# ===============================================================
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def get_warmup(request):
+    """
+    Rapport du préchauffage de ce processus (worker) au démarrage :
+    durée totale et par étape, étapes sautées faute de budget.
+    Exemple : GET /api/warmup/
+    """
+    # report vaut None si le processus n'a pas été préchauffé (runserver, WARMUP_ENABLED=False)
+    return Response({"enabled": getattr(settings, 'WARMUP_ENABLED', True), "report": warmup.last_report})
@@ -0,0 +1,169 @@
+# =============================================================================
+# PRÉCHAUFFAGE D'UN WORKER AU DÉMARRAGE (course/warmup.py)
+# =============================================================================
+# Au démarrage, un worker gunicorn n'a pas de connexion au Student Service et
+# ses caches locaux (LocMemCache) sont vides : les premières requêtes paient
+# l'ouverture de la connexion et relisent le catalogue en base. warm_up, appelé
+# par le hook post_worker_init (gunicorn.conf.py), fait ce travail avant que le
+# worker n'accepte des requêtes :
+#
+#   1. base de données : vérifie seulement qu'elle répond. Les connexions
+#      Django sont propres à chaque thread et les requêtes sont servies par
+#      les threads du pool gthread : la connexion du préchauffage ne leur sert
+#      pas (elle est fermée par le hook à la fin)
+#   2. connexion HTTP (keep-alive) au Student Service, dans le pool de la
+#      session partagée par tous les threads
+#   3. catalogue : représentation des cours (catalog.courses_by_id, seulement
+#      avec CATALOG_SHARED_CACHE) et facettes du catalogue complet
+#   4. listes d'inscrits des cours les plus suivis, depuis leurs instantanés
+#      (CourseRosterSnapshot, sans appel au Student Service)
+#
+# Le tout est borné par WARMUP_TIME_BUDGET secondes : une fois le budget
+# épuisé, les étapes restantes sont sautées et le worker démarre quand même
+# (les données manquantes seront lues à la première requête, comme avant).
+# Le rapport (durée totale et par étape) est écrit dans les journaux et exposé
+# par GET /api/warmup/ (administrateurs).
+
+import logging
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count
+
+from . import catalog, rosters
+from .models import Course
+from .services import student_service
+
+logger = logging.getLogger(__name__)
+
+# Rapport du dernier préchauffage de ce processus (None : jamais exécuté)
+last_report = None
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+class _Budget:
+    """Temps restant sur WARMUP_TIME_BUDGET secondes"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.start = time.perf_counter()
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def remaining(self):
+        return self.seconds - self.elapsed()
+
+    def exhausted(self):
+        return self.remaining() <= 0
+
+
+def _chunks(values, size):
+    for index in range(0, len(values), size):
+        yield values[index:index + size]
+
+
+# =============================================================================
+# ÉTAPES
+# =============================================================================
+def _check_database(budget):
+    """Base joignable (erreur journalisée au démarrage plutôt qu'à la première requête)"""
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    return {}
+
+
+def _open_http(budget):
+    """
+    Ouvre la connexion du pool de la session partagée avec une requête HEAD
+    (la réponse importe peu : seule la connexion TCP/TLS est conservée)
+    """
+    timeout = max(0.1, min(student_service.timeout, budget.remaining()))
+    try:
+        response = student_service.session.head(student_service.base_url, timeout=timeout)
+    except Exception as e:
+        # Student Service indisponible : le worker démarre quand même
+        return {"error": str(e)}
+    return {"status": response.status_code}
+
+
+def _load_catalog(budget):
+    """Cours (par paquets de COURSE_BATCH_MAX_IDS) puis facettes du catalogue complet"""
+    limit = _setting('WARMUP_CATALOG_LIMIT', 1000) if catalog.courses_cached() else 0
+    ids = list(Course.objects.order_by('id').values_list('id', flat=True)[:limit])
+    loaded = 0
+    for chunk in _chunks(ids, _setting('COURSE_BATCH_MAX_IDS', 100)):
+        if budget.exhausted():
+            break
+        loaded += len(catalog.courses_by_id(chunk))
+    if not budget.exhausted():
+        catalog.facets({})
+    return {"courses": loaded}
+
+
+def _load_rosters(budget):
+    """Listes d'inscrits des WARMUP_ROSTER_LIMIT cours qui ont le plus d'inscrits"""
+    limit = _setting('WARMUP_ROSTER_LIMIT', 50)
+    course_ids = list(
+        Course.objects
+        .filter(roster_snapshot__isnull=False)
+        .annotate(headcount=Count('studentcourse'))
+        .order_by('-headcount', 'id')
+        .values_list('id', flat=True)[:limit]
+    )
+    return {"rosters": rosters.preload(course_ids)}
+
+
+STEPS = (
+    ('database', _check_database),
+    ('http', _open_http),
+    ('catalog', _load_catalog),
+    ('rosters', _load_rosters),
+)
+
+
+# =============================================================================
+# PRÉCHAUFFAGE
+# =============================================================================
+def warm_up():
+    """
+    Exécute les étapes de préchauffage dans la limite de WARMUP_TIME_BUDGET secondes
+
+    Une étape en erreur est journalisée et n'empêche pas les suivantes.
+
+    Returns:
+        dict: {"seconds", "budget", "completed", "steps": {nom: {"ms", ...}}, "skipped": [...]}
+    """
+    global last_report
+
+    budget = _Budget(_setting('WARMUP_TIME_BUDGET', 2.0))
+    steps = {}
+    skipped = []
+    for name, step in STEPS:
+        if budget.exhausted():
+            skipped.append(name)
+            continue
+        start = time.perf_counter()
+        try:
+            result = step(budget)
+        except Exception as e:
+            logger.exception(f"Warm-up step '{name}' failed")
+            result = {"error": str(e)}
+        steps[name] = {"ms": round((time.perf_counter() - start) * 1000, 1), **result}
+
+    last_report = {
+        "seconds": round(budget.elapsed(), 3),
+        "budget": budget.seconds,
+        "completed": not skipped and not budget.exhausted(),
+        "steps": steps,
+        "skipped": skipped,
+    }
+    logger.info(
+        f"Warm-up finished in {last_report['seconds'] * 1000:.0f} ms "
+        f"(budget {budget.seconds * 1000:.0f} ms, skipped: {', '.join(skipped) or 'none'})"
+    )
+    return last_report
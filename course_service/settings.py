@@ -19,6 +19,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 # =============================================================================
 # IMPORTS
 # =============================================================================
+import os
+import tempfile
 from pathlib import Path  # Pour manipuler les chemins de fichiers de manière portable
 
 # =============================================================================
@@ -80,8 +82,28 @@ REST_FRAMEWORK = {
     # DjangoFilterBackend permet le filtrage exact par champs
   
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
-    'DEFAULT_AUTHENTICATION_CLASSES': ['rest_framework.authentication.TokenAuthentication'],
+    # Rendu et lecture JSON via orjson (repli automatique sur json si absent)
+    'DEFAULT_RENDERER_CLASSES': [
+        'course.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'course.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # TokenAuthentication avec cache des tokens vérifiés (pas de requête SQL par appel)
+    'DEFAULT_AUTHENTICATION_CLASSES': ['course.authentication.CachedTokenAuthentication'],
     'DEFAULT_PERMISSION_CLASSES': ['rest_framework.permissions.AllowAny'],
+    # Pagination par curseur (sans COUNT ni OFFSET) pour les listes des ViewSets
+    'DEFAULT_PAGINATION_CLASS': 'course.pagination.CoursePagination',
+    # Débits des endpoints qui appellent le Student Service (course/throttling.py)
+    # Seau à jetons par client : "60/min" = rafale de 60 puis 1 requête par seconde
+    'DEFAULT_THROTTLE_RATES': {
+        'roster': '60/min',      # GET /api/course/<id>/students/
+        'enroll': '30/min',      # POST /api/enroll/
+        'dashboard': '120/min',  # GET /api/student/<id>/dashboard/
+    },
 
 
 }
@@ -98,6 +120,90 @@ STUDENT_SERVICE_URL = 'https://student-service-r9fd.onrender.com/api/students'
 # Timeout pour les appels HTTP vers le microservice (en secondes)
 # Si le microservice ne répond pas dans ce délai, l'appel sera annulé
 STUDENT_SERVICE_TIMEOUT = 5
+
+# Nombre maximal d'appels simultanés vers le microservice
+# (construction des listes d'inscrits, validation de plusieurs étudiants)
+STUDENT_SERVICE_MAX_WORKERS = 16
+
+# =============================================================================
+# CONFIGURATION DU CACHE
+# =============================================================================
+# Cache local au processus par défaut. En production avec plusieurs workers,
+# utiliser un cache partagé (Redis, Memcached) pour que tous voient les mêmes données.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'course-service',
+    },
+    # Tokens d'authentification déjà vérifiés (course.authentication)
+    # Borné à MAX_ENTRIES tokens ; révocations : voir TOKEN_AUTH_CACHE_TIMEOUT
+    'auth': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'course-service-auth',
+        'TIMEOUT': 60,
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+    # Seaux à jetons de la limitation de débit (course.throttling), locaux au
+    # processus : pas d'aller-retour réseau par requête
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'course-service-throttle',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+# Durée de vie (secondes) d'un token vérifié dans le cache "auth"
+# ⚠️ Ce cache est local à chaque processus. Un token supprimé ou remplacé est
+# refusé immédiatement par tous les processus de la même machine (workers,
+# manage.py, shell) grâce au fichier TOKEN_REVOCATION_MARKER. Sur une autre
+# machine (plusieurs conteneurs), il reste accepté jusqu'à
+# TOKEN_AUTH_CACHE_TIMEOUT secondes : utiliser alors un cache partagé (Redis,
+# Memcached) pour l'alias "auth" et un marqueur sur un volume partagé, ou
+# réduire cette durée.
+TOKEN_AUTH_CACHE_TIMEOUT = 60
+
+# Fichier dont la date de modification marque la dernière révocation de token
+# (None : pas de marqueur, seule la durée de vie ci-dessus s'applique)
+TOKEN_REVOCATION_MARKER = os.path.join(tempfile.gettempdir(), 'course-service-token-revocations')
+
+# Durée de vie (secondes) des listes d'inscrits dans le cache
+# L'instantané en base (CourseRosterSnapshot) reste la source de vérité
+ROSTER_CACHE_TIMEOUT = 60
+
+# Nombre d'inscriptions supprimées par transaction lors de la suppression
+# d'un cours (course/deletion.py) : borne la mémoire et la durée du verrou
+DELETION_BATCH_SIZE = 1000
+
+# Durée de vie (secondes) des données du catalogue en cache (facettes, ...)
+# Clés liées à la version du catalogue : une modification les rend obsolètes
+CATALOG_CACHE_TIMEOUT = 60
+
+# Mettre aussi en cache les cours lus par ID (/api/courses/<id>/, ?ids=) :
+# uniquement si CACHES['default'] est partagé par tous les workers (Redis,
+# Memcached). Avec LocMemCache, un worker renverrait un cours modifié ou
+# supprimé par un autre jusqu'à CATALOG_CACHE_TIMEOUT secondes.
+CATALOG_SHARED_CACHE = False
+
+# Nombre maximal d'IDs par lecture groupée (/api/courses/?ids=, /api/courses/batch/)
+COURSE_BATCH_MAX_IDS = 100
+
+# Appels simultanés au Student Service par processus (course.throttling.
+# upstream_limiter : construction d'une liste d'inscrits, vérification à
+# l'inscription, fiche du tableau de bord). Inférieur au nombre de threads
+# gunicorn (GUNICORN_THREADS = 4) : des threads restent libres pour les
+# endpoints rapides. Au-delà : 503 avec Retry-After (secondes) ; les lectures
+# servies par le cache ne sont jamais limitées.
+UPSTREAM_MAX_CONCURRENCY = 2
+UPSTREAM_RETRY_AFTER = 1
+
+# Préchauffage de chaque worker gunicorn au démarrage (course/warmup.py) :
+# base joignable, connexion au Student Service, catalogue et listes d'inscrits des
+# WARMUP_ROSTER_LIMIT cours les plus suivis, en WARMUP_TIME_BUDGET secondes au plus
+WARMUP_ENABLED = True
+WARMUP_TIME_BUDGET = 2.0
+WARMUP_CATALOG_LIMIT = 1000
+WARMUP_ROSTER_LIMIT = 50
 # =============================================================================
 # CONFIGURATION DES MIDDLEWARES
 # =============================================================================
@@ -106,6 +212,8 @@ STUDENT_SERVICE_TIMEOUT = 5
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',           # Sécurité générale
+    'course.middleware.CompressionMiddleware',                 # Compression gzip/brotli des grosses réponses
+    'course.middleware.ProfilingMiddleware',                   # Profilage échantillonné (si PROFILING_ENABLED)
     'django.contrib.sessions.middleware.SessionMiddleware',   # Gestion des sessions
     'django.middleware.common.CommonMiddleware',               # Fonctionnalités communes
     'django.middleware.csrf.CsrfViewMiddleware',               # Protection CSRF
@@ -114,6 +222,20 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',   # Protection contre le clickjacking
 ]
 
+# Compression des réponses (course.middleware.CompressionMiddleware)
+COMPRESSION_MIN_SIZE = 1024       # Taille minimale (octets) pour compresser
+COMPRESSION_GZIP_LEVEL = 6        # Niveau gzip (1 = rapide ... 9 = compact)
+COMPRESSION_BROTLI_QUALITY = 4    # Qualité brotli si le paquet est installé (0 ... 11)
+
+# Profilage par échantillonnage (course.middleware.ProfilingMiddleware)
+# Désactivé : le middleware se retire de la chaîne au démarrage (aucun coût)
+PROFILING_ENABLED = False
+PROFILING_SAMPLE_RATE = 0.01       # Fraction des requêtes profilées
+PROFILING_HEADER_TOKEN = None      # Jeton de l'en-tête X-Profile-Token (profilage forcé)
+PROFILING_INTERVAL = 0.005         # Intervalle entre deux relevés de pile (secondes)
+PROFILING_MAX_ENDPOINTS = 100      # Endpoints conservés en mémoire
+PROFILING_MAX_STACKS = 2000        # Piles distinctes conservées par endpoint
+
 # =============================================================================
 # CONFIGURATION DES URLS ET TEMPLATES
 # =============================================================================
@@ -151,6 +273,13 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',  # Moteur de base de données SQLite
         'NAME': BASE_DIR / 'db.sqlite3',         # Chemin vers le fichier de base de données
+        'OPTIONS': {
+            # Avec plusieurs workers/threads (gunicorn.conf.py), prendre le verrou
+            # d'écriture dès le début de la transaction et attendre qu'il se libère
+            # au lieu d'échouer avec "database is locked"
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
     }
 }
 
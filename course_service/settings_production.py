@@ -0,0 +1,80 @@
+# =============================================================================
+# CONFIGURATION DE PRODUCTION (course_service/settings_production.py)
+# =============================================================================
+# Profil allégé pour les conteneurs de production : l'API est un service JSON
+# sans état, on ne charge donc que ce dont elle a besoin (pas d'admin, de
+# sessions, de messages, de django_extensions ni d'API navigable).
+# Moins d'applications et de middlewares = démarrage plus rapide de chaque worker.
+#
+# Utilisation : DJANGO_SETTINGS_MODULE=course_service.settings_production
+# (déjà défini dans le dockerfile)
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .settings import *  # noqa: F401,F403 - on part de la configuration commune
+from .settings import REST_FRAMEWORK
+
+# =============================================================================
+# SÉCURITÉ
+# =============================================================================
+DEBUG = False
+# Pas de repli sur la clé de développement (publique, versionnée dans settings.py)
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
+if not SECRET_KEY:
+    raise ImproperlyConfigured("La variable d'environnement DJANGO_SECRET_KEY est requise en production.")
+if os.environ.get('DJANGO_ALLOWED_HOSTS'):
+    ALLOWED_HOSTS = os.environ['DJANGO_ALLOWED_HOSTS'].split(',')
+
+# =============================================================================
+# APPLICATIONS : uniquement celles utilisées par l'API
+# =============================================================================
+INSTALLED_APPS = [
+    'django.contrib.auth',          # Utilisateurs (requis par l'authentification par token)
+    'django.contrib.contenttypes',  # Requis par django.contrib.auth
+    'corsheaders',                  # En-têtes CORS pour le frontend
+    'rest_framework',
+    'rest_framework.authtoken',     # Table des tokens (TokenAuthentication)
+    'django_filters',               # Filtrage des ViewSets (DEFAULT_FILTER_BACKENDS)
+    'course',
+]
+
+# =============================================================================
+# MIDDLEWARES : pas de sessions, messages, CSRF ni protection clickjacking
+# (API JSON authentifiée par token, sans cookies ni pages HTML)
+# =============================================================================
+MIDDLEWARE = [
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'course.middleware.CompressionMiddleware',
+    'course.middleware.ProfilingMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+# Profilage à la demande : PROFILING_ENABLED=1, PROFILING_SAMPLE_RATE=0.01,
+# PROFILING_HEADER_TOKEN=<jeton> (en-tête X-Profile-Token des requêtes à profiler)
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED') == '1'
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', '0.01'))
+PROFILING_HEADER_TOKEN = os.environ.get('PROFILING_HEADER_TOKEN') or None
+
+# Préchauffage des workers : WARMUP_ENABLED=0 pour le désactiver,
+# WARMUP_TIME_BUDGET en secondes (à garder bien en dessous de GUNICORN_TIMEOUT)
+WARMUP_ENABLED = os.environ.get('WARMUP_ENABLED', '1') == '1'
+WARMUP_TIME_BUDGET = float(os.environ.get('WARMUP_TIME_BUDGET', '2.0'))
+
+# Marqueur de révocation des tokens (voir TOKEN_AUTH_CACHE_TIMEOUT dans settings.py) :
+# le placer sur un volume partagé pour que tous les conteneurs le voient
+TOKEN_REVOCATION_MARKER = os.environ.get('TOKEN_REVOCATION_MARKER', TOKEN_REVOCATION_MARKER)  # noqa: F405
+
+# Aucune page HTML rendue par l'API
+TEMPLATES = []
+
+# =============================================================================
+# DJANGO REST FRAMEWORK : JSON uniquement (pas d'API navigable)
+# =============================================================================
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': ['course.renderers.FastJSONRenderer'],
+    'DEFAULT_PARSER_CLASSES': ['course.renderers.FastJSONParser'],
+}
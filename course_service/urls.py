@@ -1,11 +1,8 @@
-from django.contrib import admin
+from django.apps import apps
 from django.http import HttpResponse
 from django.urls import include, path
 
 urlpatterns = [
-    # Interface d'administration Django
-    path('admin/', admin.site.urls),
-
     # Routes de ton application principale "course"
     # Exemple :
     #   GET  /api/courses/
@@ -16,3 +13,10 @@ urlpatterns = [
     # Optionnel : page d'accueil simple (pour vérifier que le serveur tourne)
     path('', lambda request: HttpResponse("✅ Course Service is running.")),
 ]
+
+# Interface d'administration Django
+# (absente du profil de production : voir course_service/settings_production.py)
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
@@ -0,0 +1,152 @@
+# =============================================================================
+# CONFIGURATION GUNICORN DE PRODUCTION (gunicorn.conf.py)
+# =============================================================================
+# Lancement : gunicorn -c gunicorn.conf.py course_service.wsgi:application
+#
+# Chaque paramètre peut être surchargé par une variable d'environnement
+# (GUNICORN_WORKERS, GUNICORN_THREADS, ...) sans reconstruire l'image Docker.
+
+import math
+import os
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _cgroup_cpu_quota():
+    """Limite de CPU du conteneur (cgroup v2 puis v1), ou None si aucune"""
+    try:
+        # cgroup v2 : "<quota> <période>" ou "max <période>"
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()[:2]
+        if quota != 'max':
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+    try:
+        # cgroup v1 : quota -1 = pas de limite
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+            quota = int(f.read())
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+            period = int(f.read())
+        return quota / period if quota > 0 and period > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus():
+    """
+    CPU réellement utilisables par le conteneur
+
+    os.cpu_count() compte les CPU de l'hôte : on retient le plus petit entre
+    les CPU autorisés (cpuset) et le quota du cgroup (arrondi au supérieur).
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Pas de sched_getaffinity (macOS)
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, math.ceil(quota)))
+    return cpus
+
+
+# =============================================================================
+# ÉCOUTE
+# =============================================================================
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+# Nombre de processus dérivé des CPU du conteneur (formule recommandée :
+# 2 × CPU + 1), plafonné par GUNICORN_MAX_WORKERS : chaque worker a ses propres
+# caches locaux et son préchauffage, et tous écrivent dans le même fichier SQLite
+workers = _env_int(
+    'GUNICORN_WORKERS',
+    min(available_cpus() * 2 + 1, _env_int('GUNICORN_MAX_WORKERS', 8))
+)
+
+# Les vues passent l'essentiel de leur temps à attendre la base ou le Student
+# Service : des workers à threads (gthread) traitent plusieurs requêtes par
+# processus au lieu d'une seule avec le worker "sync" par défaut.
+# Pour un serveur ASGI : GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker
+# (avec course_service.asgi:application, nécessite le paquet uvicorn).
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = _env_int('GUNICORN_THREADS', 4)
+
+# Délai max d'une requête, et délai de maintien des connexions keep-alive
+timeout = _env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+
+# =============================================================================
+# RECYCLAGE DES WORKERS
+# =============================================================================
+# Redémarrer chaque worker après N requêtes limite les fuites mémoire ;
+# le "jitter" évite que tous les workers redémarrent en même temps.
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+# =============================================================================
+# PRÉCHARGEMENT
+# =============================================================================
+# Django et le code de l'application sont importés une seule fois dans le
+# processus maître puis partagés (copy-on-write) entre les workers :
+# démarrage plus rapide et moins de mémoire.
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+
+# =============================================================================
+# JOURNAUX
+# =============================================================================
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+# =============================================================================
+# HOOKS
+# =============================================================================
+def post_fork(server, worker):
+    """
+    Exécuté dans chaque worker juste après le fork
+
+    Avec preload_app, les connexions ouvertes dans le maître (base de données,
+    sessions HTTP) seraient partagées par tous les workers : chaque worker
+    repart donc avec ses propres connexions. Sans preload_app, Django n'est pas
+    encore chargé à ce stade (et le maître n'a rien ouvert) : rien à faire.
+    """
+    if not server.cfg.preload_app:
+        return
+
+    from django.db import connections
+    connections.close_all()
+
+    from course.services import student_service
+    student_service.close()
+
+
+def post_worker_init(worker):
+    """
+    Exécuté dans chaque worker une fois l'application chargée, avant la
+    première requête (avec ou sans preload_app)
+
+    Connexion au Student Service et caches locaux remplis
+    (borné par WARMUP_TIME_BUDGET, voir course/warmup.py).
+    """
+    from django.conf import settings
+    if not getattr(settings, 'WARMUP_ENABLED', True):
+        return
+
+    from course import warmup
+    report = warmup.warm_up()
+
+    # Connexion à la base du thread principal : les requêtes sont servies
+    # par les threads du pool, qui ouvrent chacun la leur
+    from django.db import connections
+    connections.close_all()
+
+    worker.log.info(f"Worker {worker.pid} warm-up: {report['seconds'] * 1000:.0f} ms")